@@ -0,0 +1,5 @@
+"""Bancos de pruebas de rendimiento de Calcular Nexus.
+
+Se ejecutan desde la raíz del repositorio, por ejemplo:
+    python -m benchmarks.raices -o reporte.json
+"""
@@ -0,0 +1,120 @@
+"""Utilidades compartidas por los bancos de pruebas: metadatos, estadísticas y reportes."""
+
+import json
+import math
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+
+def metadatos() -> dict:
+    """Datos para ubicar el reporte: revisión de git, Python y plataforma."""
+    revision = None
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        ).stdout.strip() or None
+    except Exception:
+        pass
+    return {
+        "revision": revision,
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+    }
+
+
+def percentil(valores, p: float) -> float:
+    """Percentil `p` (0-100) con interpolación lineal entre rangos."""
+    datos = sorted(valores)
+    if not datos:
+        return math.nan
+    pos = (len(datos) - 1) * p / 100.0
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(datos) - 1)
+    return datos[lo] + (datos[hi] - datos[lo]) * (pos - lo)
+
+
+def resumen_tiempos(valores) -> dict:
+    """Mínimo, percentiles 50/90/99 y máximo de una serie de tiempos."""
+    valores = list(valores)
+    if not valores:
+        return {}
+    return {
+        "n": len(valores),
+        "min": min(valores),
+        "p50": percentil(valores, 50),
+        "p90": percentil(valores, 90),
+        "p99": percentil(valores, 99),
+        "max": max(valores),
+    }
+
+
+def escribir_reporte(reporte: dict, ruta: str) -> None:
+    """Escribe el reporte JSON en `ruta` ('-' para la salida estándar)."""
+    texto = json.dumps(reporte, ensure_ascii=False, indent=2, allow_nan=False, default=_json_default)
+    if ruta == "-":
+        sys.stdout.write(texto + "\n")
+        return
+    with open(ruta, "w", encoding="utf-8") as fh:
+        fh.write(texto + "\n")
+
+
+def leer_reporte(ruta: str) -> dict:
+    with open(ruta, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _json_default(valor):
+    return str(valor)
+
+
+def numero_json(valor):
+    """Los valores no finitos se guardan como null para mantener JSON válido."""
+    try:
+        valor = float(valor)
+    except Exception:
+        return None
+    return valor if math.isfinite(valor) else None
+
+
+def comparar(actual: dict, base: dict, clave, metricas, umbral: float = 0.2):
+    """Compara las corridas de dos reportes con la misma clave.
+
+    `clave(corrida)` identifica una corrida y `metricas` son los campos a
+    comparar. Devuelve líneas de texto con los cambios de conteos y estados,
+    los de valores decimales mayores que `umbral` (relativo) y las corridas
+    que aparecen o desaparecen.
+    """
+    previas = {clave(c): c for c in base.get("corridas", [])}
+    lineas = []
+    vistas = set()
+    for corrida in actual.get("corridas", []):
+        k = clave(corrida)
+        vistas.add(k)
+        anterior = previas.get(k)
+        if anterior is None:
+            lineas.append(f"+ {k}: nueva")
+            continue
+        cambios = []
+        for metrica in metricas:
+            antes, ahora = anterior.get(metrica), corrida.get(metrica)
+            if antes == ahora:
+                continue
+            if isinstance(antes, float) and isinstance(ahora, float) and antes:
+                # Los tiempos varían entre corridas: solo se informan cambios grandes
+                relativo = (ahora - antes) / abs(antes)
+                if abs(relativo) >= umbral:
+                    cambios.append(f"{metrica} {antes:g} -> {ahora:g} ({relativo:+.0%})")
+            else:
+                cambios.append(f"{metrica} {antes} -> {ahora}")
+        if cambios:
+            lineas.append(f"~ {k}: " + "; ".join(cambios))
+    for k in previas:
+        if k not in vistas:
+            lineas.append(f"- {k}: ya no aparece")
+    return lineas
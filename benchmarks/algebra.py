@@ -0,0 +1,383 @@
+"""Banco de pruebas de los núcleos de álgebra lineal exacta (Fraction).
+
+Recorre tamaños de matriz y tipos de coeficientes para cada núcleo, con y
+sin generación de pasos, y registra tiempo, memoria pico (tracemalloc) y el
+mayor tamaño en bits de los numeradores y denominadores que aparecen en el
+cálculo, incluidas las entradas intermedias.
+
+    python -m benchmarks.algebra -o algebra.json --tamanos 2 3 4 8 20 50
+
+Los núcleos de cofactores crecen como n!, así que se limitan con
+--max-factorial; el resto se detiene cuando la estimación del siguiente
+tamaño supera --limite segundos.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from copy import deepcopy
+from fractions import Fraction
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from determinante_matriz_app import determinante_con_pasos
+from independencia_lineal import son_linealmente_independientes
+from qt_app.matrices_qt import determinante_con_pasos as determinante_con_pasos_qt
+from qt_app.sistemas import gauss_jordan_qt as gj
+from qt_app.sistemas import gauss_qt as gq
+
+from ._comun import comparar, escribir_reporte, leer_reporte, metadatos, percentil
+
+
+TAMANOS = [2, 3, 4, 5, 6, 8, 10, 20, 50, 100, 200]
+
+
+# ---------- Generadores de matrices ----------
+
+def _enteros_pequenos(rng, n):
+    return [[Fraction(rng.randint(-9, 9)) for _ in range(n)] for _ in range(n)]
+
+
+def _enteros_grandes(rng, n):
+    limite = 10 ** 12
+    return [[Fraction(rng.randint(-limite, limite)) for _ in range(n)] for _ in range(n)]
+
+
+def _racionales(rng, n):
+    return [[Fraction(rng.randint(-50, 50), rng.randint(1, 50)) for _ in range(n)] for _ in range(n)]
+
+
+def _dispersa(rng, n):
+    # ~10 % de entradas no nulas y diagonal no nula para que suela ser invertible
+    M = [[Fraction(rng.randint(-9, 9)) if rng.random() < 0.1 else Fraction(0) for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        M[i][i] = Fraction(rng.choice([-3, -2, -1, 1, 2, 3]))
+    return M
+
+
+def _singular(rng, n):
+    M = _enteros_pequenos(rng, n)
+    if n >= 3:
+        M[-1] = [a + b for a, b in zip(M[0], M[1])]
+    elif n == 2:
+        M[1] = [2 * a for a in M[0]]
+    return M
+
+
+TIPOS = {
+    "enteros_pequenos": _enteros_pequenos,
+    "enteros_grandes": _enteros_grandes,
+    "racionales": _racionales,
+    "dispersa": _dispersa,
+    "singular": _singular,
+}
+
+
+# ---------- Núcleos ----------
+
+class _Bits:
+    """Máximo de bits observado en numeradores y denominadores."""
+
+    def __init__(self):
+        self.maximo = 0
+
+    def ver(self, valor):
+        if isinstance(valor, Fraction):
+            self.maximo = max(self.maximo, abs(valor.numerator).bit_length(), valor.denominator.bit_length())
+        elif isinstance(valor, int):
+            self.maximo = max(self.maximo, abs(valor).bit_length())
+        elif isinstance(valor, (list, tuple)):
+            for item in valor:
+                self.ver(item)
+
+
+# Operaciones de Fraction cuyos resultados se observan al medir bits
+_OPERACIONES = (
+    "__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__",
+    "__truediv__", "__rtruediv__", "__pow__", "__neg__",
+)
+
+
+@contextmanager
+def _observar_bits(bits: _Bits):
+    """Registra en `bits` cada Fraction que producen las operaciones aritméticas.
+
+    Así el máximo incluye las entradas intermedias de cualquier núcleo (donde
+    crecen los coeficientes), no solo la entrada y el resultado.
+    """
+    originales = {nombre: getattr(Fraction, nombre) for nombre in _OPERACIONES}
+
+    def envolver(operacion):
+        def operar(*args):
+            resultado = operacion(*args)
+            if type(resultado) is Fraction:
+                bits.ver(resultado)
+            return resultado
+
+        return operar
+
+    try:
+        for nombre, operacion in originales.items():
+            setattr(Fraction, nombre, envolver(operacion))
+        yield
+    finally:
+        for nombre, operacion in originales.items():
+            setattr(Fraction, nombre, operacion)
+
+
+@contextmanager
+def _formato(pasos: bool):
+    """Sin pasos, los formateadores de Gauss y Gauss-Jordan devuelven listas vacías.
+
+    Así solo queda la aritmética.
+    """
+    originales = {
+        (mod, nombre): getattr(mod, nombre)
+        for mod in (gj, gq)
+        for nombre in ("format_matriz_lines", "format_operacion_vertical_lines")
+    }
+
+    def envolver(funcion):
+        def formatear(*args):
+            return funcion(*args) if pasos else []
+
+        return formatear
+
+    try:
+        for (mod, nombre), funcion in originales.items():
+            setattr(mod, nombre, envolver(funcion))
+        yield
+    finally:
+        for (mod, nombre), funcion in originales.items():
+            setattr(mod, nombre, funcion)
+
+
+def _aumentada(A):
+    return [fila + [Fraction(1)] for fila in A]
+
+
+def _n_lineas(pasos):
+    return sum(len(p.get("oper_lines", [])) + len(p.get("matriz_lines", [])) for p in pasos)
+
+
+def _ventana_operaciones():
+    from PySide6.QtWidgets import QApplication
+    from qt_app.operaciones_qt import OperacionesMatricesWindow
+
+    app = QApplication.instance() or QApplication([])
+    ventana = OperacionesMatricesWindow()
+    ventana._app_ref = app
+    return ventana
+
+
+_VENTANA = None
+
+
+def _operaciones():
+    global _VENTANA
+    if _VENTANA is None:
+        _VENTANA = _ventana_operaciones()
+    return _VENTANA
+
+
+def _k_det_app(A, _pasos):
+    det, pasos = determinante_con_pasos(A)
+    return det, len(pasos)
+
+
+def _k_det_qt(A, _pasos):
+    det, pasos = determinante_con_pasos_qt(A)
+    return det, len(pasos)
+
+
+def _k_mat_det(A, _pasos):
+    return _operaciones()._mat_det(A), 0
+
+
+def _k_mat_inv(A, _pasos):
+    return _operaciones()._mat_inv(A), 0
+
+
+def _k_gauss_jordan(A, _pasos):
+    M = _aumentada(A)
+    pasos = gj.gauss_jordan(M, len(M), len(M[0]))
+    return M, _n_lineas(pasos)
+
+
+def _k_gauss_eliminacion(A, _pasos):
+    M = _aumentada(A)
+    pasos, triangular = gq.gauss_eliminacion(M, len(M), len(M[0]))
+    return triangular, _n_lineas(pasos)
+
+
+def _k_independencia(metodo):
+    def correr(A, _pasos):
+        vectores = [list(col) for col in zip(*A)]
+        independiente, texto = son_linealmente_independientes(vectores, metodo)
+        return independiente, texto.count("\n") + 1
+
+    return correr
+
+
+# nombre: (función, admite variante sin pasos, costo factorial)
+NUCLEOS = {
+    "determinante_con_pasos": (_k_det_app, False, True),
+    "determinante_con_pasos_qt": (_k_det_qt, False, True),
+    "mat_det": (_k_mat_det, False, True),
+    "mat_inv": (_k_mat_inv, False, False),
+    "gauss_jordan": (_k_gauss_jordan, True, False),
+    "gauss_eliminacion": (_k_gauss_eliminacion, True, False),
+    "independencia_gauss": (_k_independencia("gauss"), False, False),
+    "independencia_determinante": (_k_independencia("determinante"), False, True),
+}
+
+# Núcleos que generan su texto siempre (no hay variante sin pasos)
+_SIEMPRE_CON_PASOS = {
+    "determinante_con_pasos", "determinante_con_pasos_qt", "independencia_gauss", "independencia_determinante",
+}
+
+
+def _medir(nucleo, A, pasos: bool, repeticiones: int):
+    funcion = NUCLEOS[nucleo][0]
+    tiempos = []
+    resultado = None
+    for _ in range(repeticiones):
+        copia = deepcopy(A)
+        with _formato(pasos):
+            inicio = time.perf_counter()
+            resultado = funcion(copia, pasos)
+            tiempos.append(time.perf_counter() - inicio)
+    return tiempos, resultado
+
+
+def _medir_memoria(nucleo, A, pasos: bool):
+    funcion = NUCLEOS[nucleo][0]
+    copia = deepcopy(A)
+    with _formato(pasos):
+        tracemalloc.start()
+        try:
+            funcion(copia, pasos)
+            _actual, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return pico
+
+
+def _medir_bits(nucleo, A, pasos: bool):
+    # Corrida aparte: observar cada operación altera el tiempo y la memoria
+    funcion = NUCLEOS[nucleo][0]
+    bits = _Bits()
+    bits.ver(A)
+    copia = deepcopy(A)
+    with _formato(pasos), _observar_bits(bits):
+        valor, _lineas = funcion(copia, pasos)
+    bits.ver(valor)
+    return bits.maximo
+
+
+def correr(nucleos, tipos, tamanos, repeticiones, limite, max_factorial, semilla):
+    corridas = []
+    for nucleo in nucleos:
+        _funcion, sin_pasos, factorial = NUCLEOS[nucleo]
+        variantes = [True, False] if sin_pasos else [nucleo in _SIEMPRE_CON_PASOS]
+        for tipo in tipos:
+            for pasos in variantes:
+                historial = []
+                motivo = None
+                for n in sorted(tamanos):
+                    corrida = {"nucleo": nucleo, "tipo": tipo, "n": n, "pasos": pasos}
+                    corridas.append(corrida)
+                    if motivo is None and factorial and n > max_factorial:
+                        motivo = f"costo factorial (n > {max_factorial})"
+                    if motivo is None and factorial and historial:
+                        n2, t2 = historial[-1]
+                        estimado = t2 * math.factorial(n) / math.factorial(n2)
+                        if estimado > limite:
+                            motivo = f"estimado {estimado:.1f} s > límite {limite:g} s"
+                    if motivo is None and len(historial) >= 2:
+                        (n1, t1), (n2, t2) = historial[-2:]
+                        exponente = math.log(max(t2, 1e-9) / max(t1, 1e-9)) / math.log(n2 / n1)
+                        estimado = t2 * (n / n2) ** max(exponente, 1.0)
+                        if estimado > limite:
+                            motivo = f"estimado {estimado:.1f} s > límite {limite:g} s"
+                    if motivo is not None:
+                        corrida.update(estado="omitido", motivo=motivo)
+                        continue
+                    A = TIPOS[tipo](random.Random(f"{semilla}-{tipo}-{n}"), n)
+                    try:
+                        tiempos, (_valor, lineas) = _medir(nucleo, A, pasos, repeticiones)
+                        pico = _medir_memoria(nucleo, A, pasos)
+                        bits = _medir_bits(nucleo, A, pasos)
+                    except Exception as exc:
+                        corrida.update(estado="error", error=str(exc))
+                        continue
+                    tiempo = percentil(tiempos, 50)
+                    corrida.update(
+                        estado="ok",
+                        tiempo_s=tiempo,
+                        memoria_pico_kb=round(pico / 1024, 1),
+                        bits_max=bits,
+                        lineas_pasos=lineas,
+                    )
+                    historial.append((n, tiempo))
+                    print(f"{nucleo:28s} {tipo:17s} n={n:<4d} pasos={'si' if pasos else 'no'} {tiempo * 1e3:10.2f} ms", file=sys.stderr)
+                    if tiempo > limite:
+                        motivo = f"n={n} tardó {tiempo:.1f} s > límite {limite:g} s"
+    return corridas
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Banco de pruebas de álgebra lineal exacta.")
+    parser.add_argument("-o", "--salida", default="-", help="reporte JSON (por defecto, salida estándar)")
+    parser.add_argument("--tamanos", type=int, nargs="*", default=TAMANOS)
+    parser.add_argument("--tipos", nargs="*", choices=sorted(TIPOS), default=list(TIPOS))
+    parser.add_argument("--nucleos", nargs="*", choices=sorted(NUCLEOS), default=list(NUCLEOS))
+    parser.add_argument("-r", "--repeticiones", type=int, default=3, help="repeticiones por corrida (se usa la mediana)")
+    parser.add_argument("--limite", type=float, default=5.0, help="segundos máximos estimados por corrida")
+    parser.add_argument("--max-factorial", type=int, default=8, help="n máximo para núcleos por cofactores")
+    parser.add_argument("--semilla", default="nexus")
+    parser.add_argument("--comparar", metavar="BASE", help="reporte anterior contra el que comparar")
+    parser.add_argument("--umbral", type=float, default=0.5, help="cambio relativo mínimo a informar al comparar")
+    args = parser.parse_args(argv)
+
+    corridas = correr(
+        args.nucleos,
+        args.tipos,
+        args.tamanos,
+        max(1, args.repeticiones),
+        args.limite,
+        args.max_factorial,
+        args.semilla,
+    )
+    reporte = {
+        "banco": "algebra",
+        "metadatos": metadatos(),
+        "parametros": {
+            "tamanos": sorted(args.tamanos),
+            "repeticiones": args.repeticiones,
+            "limite_s": args.limite,
+            "max_factorial": args.max_factorial,
+            "semilla": args.semilla,
+        },
+        "corridas": corridas,
+    }
+    escribir_reporte(reporte, args.salida)
+    if args.comparar:
+        cambios = comparar(
+            reporte,
+            leer_reporte(args.comparar),
+            lambda c: f"{c['nucleo']}/{c['tipo']}/n={c['n']}/{'pasos' if c['pasos'] else 'sin_pasos'}",
+            ("estado", "tiempo_s", "memoria_pico_kb", "bits_max", "lineas_pasos"),
+            args.umbral,
+        )
+        print("\n".join(cambios) or "Sin cambios relevantes.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
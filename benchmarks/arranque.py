@@ -0,0 +1,168 @@
+"""Reporte de costo de arranque: importaciones y tiempo hasta el selector.
+
+Cada repetición corre un proceso nuevo con `python -X importtime` que importa
+`qt_app.main_qt`, construye y muestra el selector de inicio y, para cada
+ventana del registro (`qt_app.ventanas`), mide aparte la importación
+diferida que ocurre al abrirla por primera vez.
+
+    python -m benchmarks.arranque -o arranque.json -r 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from qt_app.ventanas import VENTANAS
+
+from ._comun import comparar, escribir_reporte, leer_reporte, metadatos, percentil, resumen_tiempos
+
+
+_MARCA = "@@arranque"
+
+_HIJO = f"""
+import sys, time
+t0 = time.perf_counter()
+import qt_app.main_qt
+t1 = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+from qt_app.selector_inicio_qt import SelectorInicioWindow
+from qt_app.theme import apply_theme
+app = QApplication([])
+apply_theme(app, mode="light")
+ventana = SelectorInicioWindow()
+ventana.show()
+app.processEvents()
+t2 = time.perf_counter()
+sys.stderr.write("{_MARCA} arranque %r %r\\n" % (t1 - t0, t2 - t1))
+nombre = sys.argv[1] if len(sys.argv) > 1 else None
+if nombre:
+    from qt_app.ventanas import clase_ventana, modulo_ventana
+    sys.stderr.write("{_MARCA} ventana\\n")
+    t3 = time.perf_counter()
+    # -X importtime solo informa importaciones hechas con la sentencia import
+    __import__(modulo_ventana(nombre))
+    clase_ventana(nombre)
+    sys.stderr.write("{_MARCA} diferida %r\\n" % (time.perf_counter() - t3))
+"""
+
+
+def _parsear(stderr: str):
+    """Separa la salida de -X importtime en fases y devuelve tiempos y módulos.
+
+    Los módulos se devuelven como {nombre: (propio_us, acumulado_us)}.
+    """
+    fases = {"arranque": {}, "ventana": {}}
+    tiempos = {}
+    fase = "arranque"
+    for linea in stderr.splitlines():
+        if linea.startswith(_MARCA):
+            partes = linea.split()
+            if partes[1] == "ventana":
+                fase = "ventana"
+            elif partes[1] == "arranque":
+                tiempos["importar_s"], tiempos["selector_s"] = float(partes[2]), float(partes[3])
+            elif partes[1] == "diferida":
+                tiempos["diferida_s"] = float(partes[2])
+            continue
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, acumulado, modulo = linea[len("import time:"):].split("|")
+        fases[fase][modulo.strip()] = (int(propio), int(acumulado))
+    return tiempos, fases
+
+
+def _correr(nombre=None):
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    entorno = dict(os.environ)
+    entorno.setdefault("QT_QPA_PLATFORM", "offscreen")
+    comando = [sys.executable, "-X", "importtime", "-c", _HIJO] + ([nombre] if nombre else [])
+    inicio = time.perf_counter()
+    proceso = subprocess.run(comando, cwd=raiz, env=entorno, capture_output=True, text=True)
+    total = time.perf_counter() - inicio
+    if proceso.returncode != 0:
+        raise RuntimeError(proceso.stderr.strip().splitlines()[-1] if proceso.stderr.strip() else "sin salida")
+    tiempos, fases = _parsear(proceso.stderr)
+    tiempos["proceso_s"] = total
+    return tiempos, fases
+
+
+def _modulos(muestras, limite):
+    """Mediana por módulo del costo propio y acumulado, ordenada por acumulado."""
+    por_modulo = {}
+    for muestra in muestras:
+        for modulo, (propio, acumulado) in muestra.items():
+            por_modulo.setdefault(modulo, ([], []))
+            por_modulo[modulo][0].append(propio)
+            por_modulo[modulo][1].append(acumulado)
+    filas = [
+        {"modulo": modulo, "propio_ms": percentil(propios, 50) / 1000, "acumulado_ms": percentil(acumulados, 50) / 1000}
+        for modulo, (propios, acumulados) in por_modulo.items()
+    ]
+    filas.sort(key=lambda f: f["acumulado_ms"], reverse=True)
+    return filas[:limite] if limite else filas
+
+
+def _sufijo(resumen):
+    return {clave if clave == "n" else f"{clave}_s": valor for clave, valor in resumen.items()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Costo de importación y arranque de la aplicación.")
+    parser.add_argument("-o", "--salida", default="-", help="reporte JSON (por defecto, salida estándar)")
+    parser.add_argument("-r", "--repeticiones", type=int, default=5, help="procesos por medición")
+    parser.add_argument("-v", "--ventanas", nargs="*", choices=list(VENTANAS), help="ventanas diferidas a medir (por defecto, todas)")
+    parser.add_argument("--limite", type=int, default=40, help="módulos a listar por fase (0 = todos)")
+    parser.add_argument("--comparar", metavar="BASE", help="reporte anterior contra el que comparar")
+    parser.add_argument("--umbral", type=float, default=0.5, help="cambio relativo mínimo a informar al comparar")
+    args = parser.parse_args(argv)
+
+    repeticiones = max(1, args.repeticiones)
+    corridas = []
+
+    muestras = [_correr() for _ in range(repeticiones)]
+    for clave in ("importar_s", "selector_s", "proceso_s"):
+        tiempos = [t[clave] for t, _ in muestras]
+        corridas.append({"objetivo": "arranque", "variante": clave[:-2], **_sufijo(resumen_tiempos(tiempos))})
+    arranque = _modulos([f["arranque"] for _, f in muestras], args.limite)
+    propios = [m for m in arranque if m["modulo"].startswith("qt_app")]
+    print("Arranque (mediana, acumulado):", file=sys.stderr)
+    for fila in propios:
+        print(f"  {fila['modulo']:40s} {fila['acumulado_ms']:8.1f} ms (propio {fila['propio_ms']:.1f})", file=sys.stderr)
+
+    diferidas = {}
+    for nombre in args.ventanas or list(VENTANAS):
+        try:
+            muestras = [_correr(nombre) for _ in range(repeticiones)]
+        except Exception as exc:
+            corridas.append({"objetivo": nombre, "variante": "diferida", "error": str(exc)})
+            continue
+        tiempos = [t["diferida_s"] for t, _ in muestras]
+        corridas.append({"objetivo": nombre, "variante": "diferida", **_sufijo(resumen_tiempos(tiempos))})
+        diferidas[nombre] = _modulos([f["ventana"] for _, f in muestras], args.limite)
+        print(f"{nombre:18s} primera apertura importa {percentil(tiempos, 50) * 1e3:8.1f} ms", file=sys.stderr)
+
+    reporte = {
+        "banco": "arranque",
+        "metadatos": metadatos(),
+        "parametros": {"repeticiones": repeticiones, "limite": args.limite},
+        "corridas": corridas,
+        "modulos_arranque": arranque,
+        "modulos_diferidos": diferidas,
+    }
+    escribir_reporte(reporte, args.salida)
+    if args.comparar:
+        cambios = comparar(
+            reporte,
+            leer_reporte(args.comparar),
+            lambda c: f"{c['objetivo']}/{c['variante']}",
+            ("error", "p50_s", "p90_s"),
+            args.umbral,
+        )
+        print("\n".join(cambios) or "Sin cambios relevantes.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,459 @@
+"""Banco de pruebas de latencia de la interfaz con la plataforma Qt offscreen.
+
+Mide, con percentiles sobre varias repeticiones:
+  - construcción (y primera presentación) de cada ventana alcanzable desde
+    el selector de inicio y los menús principales;
+  - creación de grillas de entrada n x n en las ventanas de matrices y
+    sistemas;
+  - renderizado de resultados con registros de pasos grandes;
+  - latencia de apply_theme al alternar claro/oscuro con todas las ventanas
+    abiertas.
+
+    python -m benchmarks.interfaz -o interfaz.json --comparar base.json
+
+Por defecto cada sección y ventana corre en un proceso propio (ver
+`_aparte`); --sin-aislar mide todo en el proceso actual.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from copy import deepcopy
+from fractions import Fraction
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import qInstallMessageHandler
+from PySide6.QtWidgets import QApplication
+
+from qt_app.ventanas import VENTANAS, clase_ventana
+
+from ._comun import comparar, escribir_reporte, leer_reporte, metadatos, resumen_tiempos
+
+
+# Argumentos de constructor distintos de los por defecto
+ARGUMENTOS = {"menu_algebra": {"module": "algebra"}}
+
+TAMANOS_GRILLA = [10, 30, 60]
+
+
+def _silenciar_avisos():
+    """Descarta los avisos repetitivos de la plataforma offscreen y de PySide."""
+    warnings.filterwarnings("ignore", message="libpyside: Failed to disconnect", category=RuntimeWarning)
+
+    def manejador(_tipo, _contexto, mensaje):
+        if "propagateSizeHints" not in mensaje:
+            sys.stderr.write(mensaje + "\n")
+
+    qInstallMessageHandler(manejador)
+
+
+def _app():
+    _silenciar_avisos()
+    app = QApplication.instance() or QApplication([])
+    if not app.property("theme_mode"):
+        from qt_app.theme import apply_theme
+
+        apply_theme(app, mode="light")
+    return app
+
+
+def _procesar(app):
+    app.processEvents()
+
+
+# Las ventanas cerradas se conservan hasta el final: forzar su destrucción
+# (deleteLater + DeferredDelete) no es lo que hace la aplicación y, tras
+# reconstruir grillas grandes, puede terminar en una doble liberación.
+_CERRADAS = []
+
+
+def _cerrar(app, ventana):
+    ventana.close()
+    _CERRADAS.append(ventana)
+    app.processEvents()
+
+
+def _nueva(nombre):
+    # Sin pasar por crear_ventana: no debe tocar la última ventana usada ni las reservas
+    return clase_ventana(nombre)(**ARGUMENTOS.get(nombre, {}))
+
+
+def _corrida(seccion, objetivo, variante, tiempos, **extra):
+    corrida = {"seccion": seccion, "objetivo": objetivo, "variante": variante}
+    for clave, valor in resumen_tiempos(tiempos).items():
+        corrida[clave if clave == "n" else f"{clave}_s"] = valor
+    corrida.update(extra)
+    return corrida
+
+
+def _fallida(seccion, objetivo, variante, exc):
+    return {"seccion": seccion, "objetivo": objetivo, "variante": variante, "error": f"{type(exc).__name__}: {exc}"}
+
+
+# ---------- Construcción ----------
+
+def medir_construccion(app, nombres, repeticiones):
+    for nombre in nombres:
+        inicio = time.perf_counter()
+        try:
+            clase_ventana(nombre)
+        except Exception as exc:
+            yield _fallida("construccion", nombre, "construir", exc)
+            continue
+        importar = time.perf_counter() - inicio
+
+        construir, mostrar = [], []
+        try:
+            # La primera instancia incluye cargas diferidas (p. ej. matplotlib)
+            for _ in range(repeticiones + 1):
+                inicio = time.perf_counter()
+                ventana = _nueva(nombre)
+                medio = time.perf_counter()
+                ventana.show()
+                _procesar(app)
+                fin = time.perf_counter()
+                construir.append(medio - inicio)
+                mostrar.append(fin - medio)
+                _cerrar(app, ventana)
+        except Exception as exc:
+            yield _fallida("construccion", nombre, "construir", exc)
+            continue
+        corrida = _corrida(
+            "construccion", nombre, "construir", construir[1:], primera_s=construir[0], importar_s=importar
+        )
+        print(
+            f"{nombre:18s} importar={importar * 1e3:8.1f} ms  primera={construir[0] * 1e3:8.1f} ms  "
+            f"p50={corrida['p50_s'] * 1e3:8.1f} ms",
+            file=sys.stderr,
+        )
+        yield corrida
+        yield _corrida("construccion", nombre, "mostrar", mostrar[1:], primera_s=mostrar[0])
+
+
+# ---------- Grillas de entrada ----------
+
+def _grilla_matriz(ventana, n):
+    ventana.f_edit.setText(str(n))
+    ventana.c_edit.setText(str(n))
+    if hasattr(ventana, "p_edit"):
+        ventana.p_edit.setText(str(n))
+    ventana._setup_entries()
+
+
+def _grilla_operaciones(ventana, n):
+    ventana.mat_rows.setText(str(n))
+    ventana.mat_cols.setText(str(n))
+    ventana._crear_tablero_matriz()
+
+
+def _grilla_independencia(ventana, n):
+    ventana.f_edit.setText(str(n))
+    ventana.c_edit.setText(str(n))
+    ventana._rebuild()
+
+
+def _grilla_sistema(ventana, n):
+    ventana._rebuild_grid(n, n + 1)
+
+
+def _grilla_leontief(ventana, n):
+    ventana._render_grids(n)
+
+
+GRILLAS = {
+    "suma": _grilla_matriz,
+    "multiplicacion": _grilla_matriz,
+    "determinante": _grilla_matriz,
+    "transpuesta": _grilla_matriz,
+    "inversa": _grilla_matriz,
+    "operaciones": _grilla_operaciones,
+    "independencia": _grilla_independencia,
+    "gauss_jordan": _grilla_sistema,
+    "gauss": _grilla_sistema,
+    "cramer": _grilla_sistema,
+    "leontief": _grilla_leontief,
+}
+
+
+def medir_grillas(app, nombres, tamanos, repeticiones):
+    for nombre in nombres:
+        if nombre not in GRILLAS:
+            continue
+        try:
+            ventana = _nueva(nombre)
+            ventana.show()
+            _procesar(app)
+        except Exception as exc:
+            yield _fallida("grilla", nombre, "crear", exc)
+            continue
+        for n in tamanos:
+            tiempos = []
+            try:
+                for _ in range(repeticiones):
+                    # Volver a una grilla pequeña para medir siempre la creación completa
+                    GRILLAS[nombre](ventana, 2)
+                    _procesar(app)
+                    inicio = time.perf_counter()
+                    GRILLAS[nombre](ventana, n)
+                    _procesar(app)
+                    tiempos.append(time.perf_counter() - inicio)
+            except Exception as exc:
+                yield _fallida("grilla", nombre, f"n={n}", exc)
+                continue
+            corrida = _corrida("grilla", nombre, f"n={n}", tiempos, celdas=n * n)
+            print(f"{nombre:18s} grilla n={n:<3d} p50={corrida['p50_s'] * 1e3:8.1f} ms", file=sys.stderr)
+            yield corrida
+        _cerrar(app, ventana)
+
+
+# ---------- Renderizado de resultados ----------
+
+def _sistema_aleatorio(n):
+    rng = random.Random(f"interfaz-{n}")
+    return [[Fraction(rng.randint(-9, 9)) for _ in range(n + 1)] for _ in range(n)]
+
+
+def _render_gauss_jordan(ventana, n):
+    from qt_app.sistemas.gauss_jordan_qt import gauss_jordan
+
+    A = _sistema_aleatorio(n)
+    ventana.matriz_original = deepcopy(A)
+    ventana.pasos_guardados = gauss_jordan(A, n, n + 1)
+    ventana.matriz_final = A
+    return ventana._mostrar_detalles
+
+
+def _render_gauss(ventana, n):
+    from qt_app.sistemas.gauss_qt import gauss_eliminacion, rref_para_soluciones
+
+    A = _sistema_aleatorio(n)
+    ventana.matriz_original = deepcopy(A)
+    pasos, triangular = gauss_eliminacion(A, n, n + 1)
+    ventana.pasos_guardados = pasos
+    ventana.matriz_triangular = deepcopy(triangular)
+    ventana.matriz_final = rref_para_soluciones(deepcopy(triangular))
+    return ventana._show_detalles
+
+
+def _render_biseccion(ventana, variante):
+    from qt_app.metodos.biseccion_qt import BisectionStep, IterationTrace, _compile_function
+
+    tarjetas, iteraciones = variante
+    expr = "x^3-2x-5"
+    func = _compile_function(expr)
+    # Traza sintética del largo pedido: la bisección real se detiene al agotar la precisión
+    pasos = IterationTrace(BisectionStep, iteraciones)
+    a, b = 2.0, 3.0
+    for k in range(1, iteraciones + 1):
+        c = (a + b) / 2
+        pasos.append(k, a, b, c, func(a), func(b), func(c))
+        if func(a) * func(c) < 0:
+            b = c
+        else:
+            a = c
+        if b - a < 1e-12:
+            a, b = 2.0, 3.0
+    pasos.finish()
+    raiz = pasos[-1].c
+    resultados = [(i + 1, expr, pasos, raiz, func(raiz), iteraciones, None) for i in range(tarjetas)]
+    return lambda: ventana._render_resultados(resultados)
+
+
+# nombre de ventana: (preparación, variantes)
+RENDERS = {
+    "gauss_jordan": (_render_gauss_jordan, [5, 10, 20]),
+    "gauss": (_render_gauss, [5, 10, 20]),
+    "biseccion": (_render_biseccion, [(1, 100), (1, 5000), (20, 200)]),
+}
+
+
+def _nombre_variante(variante):
+    if isinstance(variante, tuple):
+        return f"tarjetas={variante[0]},iteraciones={variante[1]}"
+    return f"n={variante}"
+
+
+def medir_render(app, nombres, repeticiones):
+    for nombre in nombres:
+        if nombre not in RENDERS:
+            continue
+        preparar, variantes = RENDERS[nombre]
+        try:
+            ventana = _nueva(nombre)
+            ventana.show()
+            _procesar(app)
+        except Exception as exc:
+            yield _fallida("render", nombre, "mostrar", exc)
+            continue
+        for variante in variantes:
+            etiqueta = _nombre_variante(variante)
+            tiempos = []
+            try:
+                render = preparar(ventana, variante)
+                for _ in range(repeticiones):
+                    inicio = time.perf_counter()
+                    render()
+                    _procesar(app)
+                    tiempos.append(time.perf_counter() - inicio)
+            except Exception as exc:
+                yield _fallida("render", nombre, etiqueta, exc)
+                continue
+            corrida = _corrida("render", nombre, etiqueta, tiempos)
+            print(f"{nombre:18s} render {etiqueta:28s} p50={corrida['p50_s'] * 1e3:8.1f} ms", file=sys.stderr)
+            yield corrida
+        _cerrar(app, ventana)
+
+
+# ---------- Cambio de tema ----------
+
+def medir_tema(app, nombres, repeticiones):
+    from qt_app.theme import apply_theme, current_mode
+
+    abiertas = []
+    for nombre in nombres:
+        try:
+            ventana = _nueva(nombre)
+            ventana.show()
+            abiertas.append(ventana)
+        except Exception:
+            pass
+    _procesar(app)
+
+    tiempos = []
+    modo_inicial = current_mode(app)
+    try:
+        for _ in range(repeticiones):
+            modo = "dark" if current_mode(app) == "light" else "light"
+            inicio = time.perf_counter()
+            apply_theme(app, mode=modo)
+            _procesar(app)
+            tiempos.append(time.perf_counter() - inicio)
+    except Exception as exc:
+        yield _fallida("tema", "apply_theme", "alternar", exc)
+        return
+    finally:
+        apply_theme(app, mode=modo_inicial)
+        for ventana in abiertas:
+            _cerrar(app, ventana)
+    corrida = _corrida("tema", "apply_theme", "alternar", tiempos, ventanas=len(abiertas))
+    print(f"apply_theme con {len(abiertas)} ventanas p50={corrida['p50_s'] * 1e3:8.1f} ms", file=sys.stderr)
+    yield corrida
+
+
+SECCIONES = ("construccion", "grilla", "render", "tema")
+
+
+def _medir(seccion, app, nombres, repeticiones, tamanos):
+    if seccion == "grilla":
+        return medir_grillas(app, nombres, tamanos, repeticiones)
+    medicion = {"construccion": medir_construccion, "render": medir_render, "tema": medir_tema}[seccion]
+    return medicion(app, nombres, repeticiones)
+
+
+def _aparte(seccion, nombres, args, repeticiones):
+    """Corre una sección, para las ventanas dadas, en un proceso nuevo.
+
+    Así cada ventana se construye con sus módulos sin importar, las ventanas
+    que retiene una medición no encarecen a las siguientes (apply_theme
+    recorre todos los widgets vivos) y una caída del proceso solo pierde las
+    mediciones que faltaban: el hijo escribe cada corrida apenas la obtiene.
+    """
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "parcial.jsonl")
+        comando = [
+            sys.executable, "-m", "benchmarks.interfaz", "--sin-aislar", "--parcial", ruta,
+            "-s", seccion, "-v", *nombres, "-o", os.devnull, "-r", str(repeticiones),
+            "--tamanos", *map(str, args.tamanos),
+        ]
+        raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        proceso = subprocess.run(comando, cwd=raiz)
+        corridas = []
+        if os.path.exists(ruta):
+            with open(ruta, encoding="utf-8") as fh:
+                corridas = [json.loads(linea) for linea in fh if linea.strip()]
+        if proceso.returncode != 0:
+            corridas.append({
+                "seccion": seccion,
+                "objetivo": nombres[0] if len(nombres) == 1 else "*",
+                "variante": "*",
+                "error": f"el proceso terminó con código {proceso.returncode}",
+            })
+        return corridas
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Banco de pruebas de latencia de la interfaz (Qt offscreen).")
+    parser.add_argument("-o", "--salida", default="-", help="reporte JSON (por defecto, salida estándar)")
+    parser.add_argument("-r", "--repeticiones", type=int, default=10, help="repeticiones por medición")
+    parser.add_argument("-s", "--secciones", nargs="*", choices=SECCIONES, default=list(SECCIONES))
+    parser.add_argument("-v", "--ventanas", nargs="*", choices=list(VENTANAS), help="ventanas a medir (por defecto, todas)")
+    parser.add_argument("--tamanos", type=int, nargs="*", default=TAMANOS_GRILLA, help="tamaños n de las grillas")
+    parser.add_argument(
+        "--sin-aislar", action="store_true",
+        help="medir todo en este proceso (por defecto, un proceso por sección y ventana)",
+    )
+    parser.add_argument("--parcial", help=argparse.SUPPRESS)
+    parser.add_argument("--comparar", metavar="BASE", help="reporte anterior contra el que comparar")
+    parser.add_argument("--umbral", type=float, default=0.5, help="cambio relativo mínimo a informar al comparar")
+    args = parser.parse_args(argv)
+
+    repeticiones = max(1, args.repeticiones)
+    nombres = args.ventanas or list(VENTANAS)
+    corridas = []
+    if args.sin_aislar:
+        app = _app()
+        plataforma = app.platformName()
+        parcial = open(args.parcial, "a", encoding="utf-8") if args.parcial else None
+        try:
+            for seccion in args.secciones:
+                for corrida in _medir(seccion, app, nombres, repeticiones, args.tamanos):
+                    corridas.append(corrida)
+                    if parcial is not None:
+                        parcial.write(json.dumps(corrida, ensure_ascii=False) + "\n")
+                        parcial.flush()
+        finally:
+            if parcial is not None:
+                parcial.close()
+    else:
+        plataforma = os.environ.get("QT_QPA_PLATFORM")
+        for seccion in args.secciones:
+            if seccion == "tema":
+                corridas += _aparte(seccion, nombres, args, repeticiones)
+                continue
+            for nombre in nombres:
+                if seccion == "grilla" and nombre not in GRILLAS or seccion == "render" and nombre not in RENDERS:
+                    continue
+                corridas += _aparte(seccion, [nombre], args, repeticiones)
+
+    reporte = {
+        "banco": "interfaz",
+        "metadatos": metadatos(),
+        "parametros": {
+            "repeticiones": repeticiones,
+            "tamanos": args.tamanos,
+            "plataforma_qt": plataforma,
+        },
+        "corridas": corridas,
+    }
+    escribir_reporte(reporte, args.salida)
+    if args.comparar:
+        cambios = comparar(
+            reporte,
+            leer_reporte(args.comparar),
+            lambda c: f"{c['seccion']}/{c['objetivo']}/{c['variante']}",
+            ("error", "p50_s", "p90_s", "primera_s"),
+            args.umbral,
+        )
+        print("\n".join(cambios) or "Sin cambios relevantes.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""Banco de pruebas de los métodos de raíces sobre un corpus fijo de funciones.
+
+Para cada función del corpus y cada método registra tiempo de pared,
+evaluaciones de f, iteraciones y |f| en la raíz obtenida. El reporte JSON
+puede compararse con el de otra revisión:
+
+    python -m benchmarks.raices -o nuevo.json --comparar base.json
+"""
+
+import argparse
+import sys
+import time
+
+from qt_app.metodos import biseccion_qt as bq
+from qt_app.metodos.brent_qt import _run_brent
+from qt_app.metodos.falsa_posicion_qt import _run_false_position
+from qt_app.metodos.illinois_qt import _run_illinois
+from qt_app.metodos.newton_raphson_qt import _run_newton_raphson
+from qt_app.metodos.secante_qt import _run_secante
+
+from ._comun import comparar, escribir_reporte, leer_reporte, metadatos, numero_json, percentil
+
+
+# (nombre, categoría, f(x), intervalo [a, b], x0, x1)
+CORPUS = [
+    ("cubica", "polinomio", "x^3-2x-5", (2.0, 3.0), 2.0, 3.0),
+    ("x10", "polinomio", "x^10-1", (0.0, 1.5), 1.5, 1.4),
+    ("quintica", "polinomio", "x^5-x-1", (1.0, 2.0), 1.0, 2.0),
+    ("producto5", "polinomio", "(x-1)(x-2)(x-3)(x-4)(x-5)", (3.6, 4.5), 3.6, 4.5),
+    ("raiz2", "polinomio", "x^2-2", (0.0, 2.0), 1.0, 2.0),
+    ("kepler", "trascendente", "cos(x)-x", (0.0, 1.0), 0.0, 1.0),
+    ("exp_lineal", "trascendente", "e^x-3x", (0.0, 1.0), 0.0, 1.0),
+    ("seno", "trascendente", "sin(x)-x/2", (1.0, 3.0), 2.0, 3.0),
+    ("log", "trascendente", "ln(x)+x", (0.1, 1.0), 0.5, 1.0),
+    ("exp_decae", "trascendente", "e^(-x)-0.5", (0.0, 2.0), 0.0, 2.0),
+    ("triple", "raiz_multiple", "(x-1)^3", (0.0, 2.5), 0.0, 2.5),
+    ("quintuple", "raiz_multiple", "(x-2)^5", (1.0, 3.2), 1.0, 3.2),
+    ("doble_mas_simple", "raiz_multiple", "(x-1)^2(x+2)", (-3.0, 0.0), 0.5, 2.0),
+    ("taylor3", "raiz_multiple", "e^x-1-x-x^2/2", (-1.0, 0.5), 0.5, 1.0),
+    ("polo", "polo", "1/(x-1)", (0.0, 2.0), 0.5, 2.0),
+    ("tangente", "polo", "tan(x)", (1.0, 2.0), 1.2, 1.9),
+    ("polo_con_raiz", "polo", "1/(x-1)-2", (1.1, 2.0), 1.2, 2.0),
+    ("escalon_suave", "plana", "tanh(10(x-0.3))", (-1.0, 1.0), 1.0, 0.9),
+    ("arcotangente", "plana", "atan(x)", (-1.0, 3.0), 2.0, 3.0),
+    ("campana", "plana", "x*e^(-x^2)", (-0.5, 3.0), 1.5, 2.0),
+]
+
+
+def _intervalo(metodo):
+    def correr(func, _expr, caso, tol):
+        registro = bq.EvaluationLedger(func)
+        a, b = caso[3]
+        return metodo(registro, a, b, tol), registro
+
+    return correr
+
+
+def _newton(func, expr, caso, tol):
+    fdf = bq._compile_derivative(expr)
+    if fdf is None:
+        return _newton_numerica(func, expr, caso, tol)
+    registro = bq.EvaluationLedger(fdf)
+    return _run_newton_raphson(func, caso[4], tol, fdf=registro), registro
+
+
+def _newton_numerica(func, _expr, caso, tol):
+    registro = bq.EvaluationLedger(func)
+    return _run_newton_raphson(registro, caso[4], tol), registro
+
+
+def _secante(func, _expr, caso, tol):
+    registro = bq.EvaluationLedger(func)
+    return _run_secante(registro, caso[4], caso[5], tol), registro
+
+
+METODOS = {
+    "biseccion": _intervalo(bq._run_bisection),
+    "falsa_posicion": _intervalo(_run_false_position),
+    "illinois": _intervalo(_run_illinois),
+    "brent": _intervalo(_run_brent),
+    "newton": _newton,
+    "newton_numerica": _newton_numerica,
+    "secante": _secante,
+}
+
+
+def correr_caso(caso, metodo: str, tol: float, repeticiones: int) -> dict:
+    nombre, categoria, expr = caso[:3]
+    func = bq._compile_function(expr)
+    corrida = {"funcion": nombre, "categoria": categoria, "expresion": expr, "metodo": metodo}
+    tiempos = []
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        try:
+            resultado = METODOS[metodo](func, expr, caso, tol)
+        except Exception as exc:
+            resultado = exc
+        tiempos.append(time.perf_counter() - inicio)
+
+    corrida["tiempo_s"] = percentil(tiempos, 50)
+    corrida["tiempo_min_s"] = min(tiempos)
+    if isinstance(resultado, Exception):
+        corrida.update(estado="error", error=str(resultado))
+        return corrida
+    (_pasos, raiz, _fc, iteraciones), registro = resultado
+    try:
+        abs_f = abs(func(raiz))
+    except Exception:
+        abs_f = None
+    corrida.update(
+        estado="ok",
+        iteraciones=iteraciones,
+        evaluaciones=registro.evaluations,
+        raiz=numero_json(raiz),
+        abs_f=numero_json(abs_f),
+    )
+    return corrida
+
+
+def _resumen(corridas) -> dict:
+    resumen = {}
+    for metodo in METODOS:
+        propias = [c for c in corridas if c["metodo"] == metodo]
+        exitosas = [c for c in propias if c["estado"] == "ok"]
+        if not propias:
+            continue
+        resumen[metodo] = {
+            "corridas": len(propias),
+            "exitosas": len(exitosas),
+            "evaluaciones_totales": sum(c["evaluaciones"] for c in exitosas),
+            "iteraciones_totales": sum(c["iteraciones"] for c in exitosas),
+            "tiempo_total_s": sum(c["tiempo_s"] for c in propias),
+        }
+    return resumen
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Banco de pruebas de los métodos de raíces.")
+    parser.add_argument("-o", "--salida", default="-", help="reporte JSON (por defecto, salida estándar)")
+    parser.add_argument("-r", "--repeticiones", type=int, default=5, help="repeticiones por corrida (se usa la mediana)")
+    parser.add_argument("--tol", type=float, default=1e-10)
+    parser.add_argument("-m", "--metodos", nargs="*", choices=sorted(METODOS), help="métodos a medir (por defecto, todos)")
+    parser.add_argument("--comparar", metavar="BASE", help="reporte anterior contra el que comparar")
+    parser.add_argument("--umbral", type=float, default=0.5, help="cambio relativo mínimo a informar al comparar")
+    args = parser.parse_args(argv)
+
+    metodos = args.metodos or list(METODOS)
+    corridas = [
+        correr_caso(caso, metodo, args.tol, max(1, args.repeticiones))
+        for caso in CORPUS
+        for metodo in metodos
+    ]
+    reporte = {
+        "banco": "raices",
+        "metadatos": metadatos(),
+        "parametros": {"tol": args.tol, "repeticiones": args.repeticiones},
+        "corridas": corridas,
+        "resumen": _resumen(corridas),
+    }
+    escribir_reporte(reporte, args.salida)
+
+    for metodo, datos in reporte["resumen"].items():
+        print(
+            f"{metodo:16s} {datos['exitosas']:3d}/{datos['corridas']:<3d} "
+            f"evals={datos['evaluaciones_totales']:6d} iters={datos['iteraciones_totales']:6d} "
+            f"t={datos['tiempo_total_s'] * 1e3:9.2f} ms",
+            file=sys.stderr,
+        )
+    if args.comparar:
+        cambios = comparar(
+            reporte,
+            leer_reporte(args.comparar),
+            lambda c: f"{c['funcion']}/{c['metodo']}",
+            ("estado", "iteraciones", "evaluaciones", "tiempo_s"),
+            args.umbral,
+        )
+        print("\n".join(cambios) or "Sin cambios relevantes.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
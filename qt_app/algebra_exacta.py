@@ -0,0 +1,281 @@
+"""Álgebra lineal exacta con Fraction basada en la eliminación de Bareiss.
+
+La eliminación de Bareiss (sin fracciones) divide cada paso por el pivote
+anterior, y esa división siempre es exacta: los coeficientes no crecen como en
+la expansión por cofactores y el costo es O(n³) en lugar de O(n!).
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+
+
+def _fmt(x) -> str:
+    return str(x.numerator) if isinstance(x, Fraction) and x.denominator == 1 else str(x)
+
+
+def _lineas_matriz(M, ind=""):
+    if not M:
+        return [ind + "[ ]"]
+    ancho = max(len(_fmt(v)) for fila in M for v in fila)
+    return [ind + "[ " + "  ".join(_fmt(v).rjust(ancho) for v in fila) + " ]" for fila in M]
+
+
+def menor(M, r: int, c: int):
+    """Submatriz de M sin la fila r ni la columna c."""
+    return [[M[i][j] for j in range(len(M)) if j != c] for i in range(len(M)) if i != r]
+
+
+def determinante_bareiss(M, pasos=None) -> Fraction:
+    """Determinante exacto de M por eliminación de Bareiss.
+
+    Si se pasa una lista `pasos`, se le agregan las líneas del procedimiento.
+    """
+    n = len(M)
+    W = [[Fraction(v) for v in fila] for fila in M]
+    if n == 0:
+        return Fraction(1)
+    signo = 1
+    previo = Fraction(1)
+    if pasos is not None:
+        pasos.append("Eliminación de Bareiss: a_ij <- (a_kk·a_ij - a_ik·a_kj) / p, con p el pivote anterior")
+        pasos.extend(_lineas_matriz(W, "    "))
+    for k in range(n - 1):
+        if W[k][k] == 0:
+            p = next((r for r in range(k + 1, n) if W[r][k] != 0), None)
+            if p is None:
+                if pasos is not None:
+                    pasos.append(f"Columna {k+1} sin pivote: det = 0")
+                return Fraction(0)
+            W[k], W[p] = W[p], W[k]
+            signo = -signo
+            if pasos is not None:
+                pasos.append(f"R{k+1} <-> R{p+1} (cambia el signo)")
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                W[i][j] = (W[k][k] * W[i][j] - W[i][k] * W[k][j]) / previo
+            W[i][k] = Fraction(0)
+        previo = W[k][k]
+        if pasos is not None:
+            pasos.append(f"Paso {k+1} (pivote {_fmt(previo)}):")
+            pasos.extend(_lineas_matriz(W, "    "))
+    det = signo * W[n - 1][n - 1]
+    if pasos is not None:
+        if signo > 0:
+            pasos.append(f"det = {_fmt(det)}")
+        else:
+            pasos.append(f"det = -({_fmt(W[n - 1][n - 1])}) = {_fmt(det)}")
+    return det
+
+
+def adjunta_bareiss(M):
+    """Devuelve (det, Adj(M)) con una sola pasada de Gauss-Jordan sin fracciones.
+
+    Sobre [M | I] la eliminación deja [d·I | d·M⁻¹] con d = ±det(M), de modo
+    que la adjunta det(M)·M⁻¹ sale sin calcular ningún menor. Si M es
+    singular devuelve (0, None).
+    """
+    n = len(M)
+    W = [[Fraction(v) for v in fila] + [Fraction(1 if i == j else 0) for j in range(n)] for i, fila in enumerate(M)]
+    if n == 0:
+        return Fraction(1), []
+    signo = 1
+    previo = Fraction(1)
+    for k in range(n):
+        if W[k][k] == 0:
+            p = next((r for r in range(k + 1, n) if W[r][k] != 0), None)
+            if p is None:
+                return Fraction(0), None
+            W[k], W[p] = W[p], W[k]
+            signo = -signo
+        for i in range(n):
+            if i == k:
+                continue
+            for j in range(2 * n):
+                if j != k:
+                    W[i][j] = (W[k][k] * W[i][j] - W[i][k] * W[k][j]) / previo
+            W[i][k] = Fraction(0)
+        previo = W[k][k]
+    det = signo * W[n - 1][n - 1]
+    return det, [[signo * v for v in fila[n:]] for fila in W]
+
+
+class Adjunta:
+    """Determinante, cofactores, adjunta e inversa exactos de una matriz cuadrada.
+
+    Si A es invertible todo sale de `adjunta_bareiss`; si es singular, los
+    cofactores se calculan uno a uno (cada uno por Bareiss) cuando se piden.
+    El texto de los pasos de un cofactor solo se arma a pedido. Si ya se
+    tiene el par (det, adj) de `adjunta_bareiss`, se pasa en `det_adj`.
+    """
+
+    def __init__(self, A, det_adj=None):
+        self.A = [[Fraction(v) for v in fila] for fila in A]
+        self.n = len(self.A)
+        self.det, self._adj = det_adj if det_adj is not None else adjunta_bareiss(self.A)
+        self._cof = {}
+
+    @property
+    def invertible(self) -> bool:
+        return self.det != 0
+
+    def cofactor(self, i: int, j: int) -> Fraction:
+        if self._adj is not None:
+            return self._adj[j][i]
+        if (i, j) not in self._cof:
+            signo = 1 if (i + j) % 2 == 0 else -1
+            self._cof[(i, j)] = signo * determinante_bareiss(menor(self.A, i, j))
+        return self._cof[(i, j)]
+
+    def menor_det(self, i: int, j: int) -> Fraction:
+        """det(M_ij), es decir el cofactor sin su signo."""
+        return self.cofactor(i, j) * (1 if (i + j) % 2 == 0 else -1)
+
+    def cofactores(self):
+        return [[self.cofactor(i, j) for j in range(self.n)] for i in range(self.n)]
+
+    def adjunta(self):
+        if self._adj is not None:
+            return [fila[:] for fila in self._adj]
+        return [[self.cofactor(j, i) for j in range(self.n)] for i in range(self.n)]
+
+    def inversa(self):
+        if self._adj is None:
+            return None
+        return [[v / self.det for v in fila] for fila in self._adj]
+
+    def pasos_cofactor(self, i: int, j: int):
+        """Líneas que explican C_ij = (-1)^(i+j)·det(M_ij) para i, j desde 0."""
+        sub = menor(self.A, i, j)
+        signo = "+" if (i + j) % 2 == 0 else "-"
+        pasos = [f"C{i+1}{j+1} = (-1)^({i+1}+{j+1})·det(M{i+1}{j+1})"]
+        pasos.append(f"M{i+1}{j+1} (sin la fila {i+1} ni la columna {j+1}):")
+        pasos.extend(_lineas_matriz(sub, "    "))
+        det = determinante_bareiss(sub, pasos)
+        pasos.append(f"C{i+1}{j+1} = ({signo})·{_fmt(det)} = {_fmt(self.cofactor(i, j))}")
+        return pasos
+
+
+class AnalisisMatriz:
+    """RREF, columnas pivote, rango y columnas libres de una matriz.
+
+    Se obtiene con `analizar`, que reutiliza el resultado mientras el contenido
+    de la matriz no cambie; las filas de `rref` son tuplas de solo lectura.
+    """
+
+    __slots__ = ("rref", "pivotes", "libres")
+
+    def __init__(self, rref, pivotes, libres):
+        self.rref = rref
+        self.pivotes = pivotes
+        self.libres = libres
+
+    @property
+    def rango(self) -> int:
+        return len(self.pivotes)
+
+
+def _rref(M):
+    M = [list(fila) for fila in M]
+    filas = len(M)
+    cols = len(M[0]) if filas else 0
+    fila = 0
+    pivotes = []
+    for col in range(cols):
+        if fila >= filas:
+            break
+        piv = next((r for r in range(fila, filas) if M[r][col] != 0), None)
+        if piv is None:
+            continue
+        if piv != fila:
+            M[fila], M[piv] = M[piv], M[fila]
+        a = M[fila][col]
+        if a != 1:
+            M[fila] = [v / a for v in M[fila]]
+        for r in range(filas):
+            if r == fila:
+                continue
+            f = M[r][col]
+            if f != 0:
+                M[r] = [M[r][j] - f * M[fila][j] for j in range(cols)]
+        pivotes.append(col)
+        fila += 1
+    libres = tuple(j for j in range(cols) if j not in pivotes)
+    return AnalisisMatriz(tuple(tuple(f) for f in M), tuple(pivotes), libres)
+
+
+@lru_cache(maxsize=64)
+def _analizar(clave):
+    return _rref(clave)
+
+
+def analizar(M) -> AnalisisMatriz:
+    """Análisis por reducción de M, compartido entre llamadas con el mismo contenido."""
+    return _analizar(tuple(tuple(Fraction(v) for v in fila) for fila in M))
+
+
+class LU:
+    """Factorización exacta PA = LU de una matriz cuadrada invertible.
+
+    Factorizar cuesta O(n³) una sola vez; después cada lado derecho se resuelve
+    con sustitución hacia adelante y hacia atrás en O(n²), sin formar A⁻¹.
+    Si A es singular o no es cuadrada lanza ValueError.
+    """
+
+    def __init__(self, A):
+        n = len(A)
+        if any(len(fila) != n for fila in A):
+            raise ValueError("La matriz no es cuadrada.")
+        U = [[Fraction(v) for v in fila] for fila in A]
+        L = [[Fraction(0)] * n for _ in range(n)]
+        perm = list(range(n))
+        pasos = ["Factorización PA = LU (eliminación gaussiana guardando los multiplicadores en L):"]
+        for k in range(n):
+            p = next((r for r in range(k, n) if U[r][k] != 0), None)
+            if p is None:
+                raise ValueError("La matriz no es invertible.")
+            if p != k:
+                U[k], U[p] = U[p], U[k]
+                L[k], L[p] = L[p], L[k]
+                perm[k], perm[p] = perm[p], perm[k]
+                pasos.append(f"R{k+1} <-> R{p+1} (se registra en P)")
+            L[k][k] = Fraction(1)
+            for i in range(k + 1, n):
+                f = U[i][k] / U[k][k]
+                L[i][k] = f
+                if f != 0:
+                    U[i] = [U[i][j] - f * U[k][j] for j in range(n)]
+                    pasos.append(f"R{i+1} = R{i+1} - ({_fmt(f)})·R{k+1}  ->  l{i+1}{k+1} = {_fmt(f)}")
+        pasos.append("L =")
+        pasos.extend(_lineas_matriz(L, "    "))
+        pasos.append("U =")
+        pasos.extend(_lineas_matriz(U, "    "))
+        if perm != list(range(n)):
+            pasos.append("P reordena las filas: " + ", ".join(f"R{i+1}" for i in perm))
+        self.n = n
+        self.L = L
+        self.U = U
+        self.perm = perm
+        self.pasos = pasos
+
+    def resolver(self, b, pasos=None):
+        """Solución exacta de A·x = b para un vector b.
+
+        Si se pasa una lista `pasos`, se le agregan las dos sustituciones.
+        """
+        n = self.n
+        if len(b) != n:
+            raise ValueError(f"El lado derecho debe tener {n} entradas.")
+        pb = [Fraction(b[i]) for i in self.perm]
+        y = []
+        for i in range(n):
+            y.append(pb[i] - sum(self.L[i][j] * y[j] for j in range(i)))
+            if pasos is not None:
+                resta = "".join(f" - ({_fmt(self.L[i][j])})·{_fmt(y[j])}" for j in range(i) if self.L[i][j] != 0)
+                pasos.append(f"y{i+1} = {_fmt(pb[i])}{resta} = {_fmt(y[i])}")
+        x = [Fraction(0)] * n
+        for i in range(n - 1, -1, -1):
+            x[i] = (y[i] - sum(self.U[i][j] * x[j] for j in range(i + 1, n))) / self.U[i][i]
+            if pasos is not None:
+                resta = "".join(f" - ({_fmt(self.U[i][j])})·{_fmt(x[j])}" for j in range(i + 1, n) if self.U[i][j] != 0)
+                pasos.append(f"x{i+1} = ({_fmt(y[i])}{resta}) / {_fmt(self.U[i][i])} = {_fmt(x[i])}")
+        return x
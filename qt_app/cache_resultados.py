@@ -0,0 +1,219 @@
+"""Caché en disco de resultados exactos, compartida entre sesiones.
+
+Cada resultado vive en un archivo propio cuyo nombre es el hash SHA-256 de
+(operación, entradas exactas, opciones) en forma canónica: la misma matriz da
+la misma clave venga de la ventana que venga. El valor y sus pasos se guardan
+como JSON comprimido con zlib y solo se leen cuando se piden. Si el total
+supera el límite se borran primero los archivos usados hace más tiempo (la
+fecha de modificación hace de marca LRU y se renueva en cada acierto).
+"""
+
+import hashlib
+import json
+import os
+import time
+import zlib
+from fractions import Fraction
+
+
+# Cambiarla invalida lo guardado, p. ej. si cambia el formato de los pasos
+_VERSION = 1
+_FALTA = object()
+
+_config = {
+    "directorio": None,
+    "limite": 64 * 1024 * 1024,
+    # Lo que se calcula más rápido que esto no vale una escritura en disco
+    "minimo_s": 0.005,
+    "activa": True,
+}
+# Bytes ocupados; se cuentan recién al primer guardado
+_estado = {"total": None}
+
+
+def configurar(directorio: str = None, limite: int = None, minimo_s: float = None, activa: bool = None) -> None:
+    """Ajusta la carpeta, el tamaño máximo en bytes, el costo mínimo a guardar y si se usa la caché."""
+    if directorio is not None:
+        _config["directorio"] = directorio
+        _estado["total"] = None
+    if limite is not None:
+        _config["limite"] = max(0, int(limite))
+    if minimo_s is not None:
+        _config["minimo_s"] = max(0.0, float(minimo_s))
+    if activa is not None:
+        _config["activa"] = bool(activa)
+
+
+def _directorio() -> str:
+    if _config["directorio"] is None:
+        base = ""
+        try:
+            from PySide6.QtCore import QStandardPaths
+
+            base = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+        except Exception:
+            pass
+        if not base:
+            base = os.path.join(os.path.expanduser("~"), ".cache")
+        _config["directorio"] = os.path.join(base, "Calculadora Nexus", "resultados")
+    return _config["directorio"]
+
+
+def _canonico(x) -> str:
+    # Los números se escriben como fracción exacta: 2, 2.0 y Fraction(2) son la misma entrada
+    if x is None or isinstance(x, bool):
+        return json.dumps(x)
+    if isinstance(x, (int, float, Fraction)):
+        f = Fraction(x)
+        return f"{f.numerator}/{f.denominator}"
+    if isinstance(x, str):
+        return json.dumps(x, ensure_ascii=False)
+    if isinstance(x, (list, tuple)):
+        return "[" + ",".join(_canonico(v) for v in x) + "]"
+    if isinstance(x, dict):
+        return "{" + ",".join(f"{json.dumps(str(k), ensure_ascii=False)}:{_canonico(x[k])}" for k in sorted(x, key=str)) + "}"
+    raise TypeError(f"entrada no admitida en la caché: {type(x).__name__}")
+
+
+def clave(operacion: str, entradas, opciones=None) -> str:
+    """Hash canónico de (operación, entradas, opciones)."""
+    texto = f"{_VERSION}|{operacion}|{_canonico(entradas)}|{_canonico(opciones or {})}"
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def _a_json(x):
+    if isinstance(x, Fraction):
+        return {"f": f"{x.numerator}/{x.denominator}"}
+    if isinstance(x, tuple):
+        return {"t": [_a_json(v) for v in x]}
+    if isinstance(x, list):
+        return [_a_json(v) for v in x]
+    if isinstance(x, dict):
+        if not all(isinstance(k, str) for k in x):
+            raise TypeError("solo se guardan diccionarios con claves de texto")
+        return {"d": {k: _a_json(v) for k, v in x.items()}}
+    if x is None or isinstance(x, (bool, int, float, str)):
+        return x
+    raise TypeError(f"resultado no admitido en la caché: {type(x).__name__}")
+
+
+def _de_json(x):
+    if isinstance(x, list):
+        return [_de_json(v) for v in x]
+    if isinstance(x, dict):
+        if "f" in x:
+            return Fraction(x["f"])
+        if "t" in x:
+            return tuple(_de_json(v) for v in x["t"])
+        return {k: _de_json(v) for k, v in x["d"].items()}
+    return x
+
+
+def _ruta(k: str) -> str:
+    return os.path.join(_directorio(), k[:2], k[2:])
+
+
+def _leer(ruta: str):
+    try:
+        with open(ruta, "rb") as fh:
+            datos = fh.read()
+    except OSError:
+        return _FALTA
+    try:
+        valor = _de_json(json.loads(zlib.decompress(datos).decode("utf-8"))["valor"])
+    except Exception:
+        # Archivo dañado o de un formato anterior: se descarta
+        _borrar(ruta)
+        return _FALTA
+    try:
+        os.utime(ruta)
+    except OSError:
+        pass
+    return valor
+
+
+def _escribir(ruta: str, operacion: str, valor) -> None:
+    try:
+        datos = zlib.compress(json.dumps({"operacion": operacion, "valor": _a_json(valor)}).encode("utf-8"), 6)
+    except (TypeError, ValueError):
+        return
+    if len(datos) > _config["limite"]:
+        return
+    try:
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        previo = os.path.getsize(ruta) if os.path.exists(ruta) else 0
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as fh:
+            fh.write(datos)
+        os.replace(temporal, ruta)
+    except OSError:
+        return
+    if _estado["total"] is None:
+        _estado["total"] = sum(tam for _, _, tam in _archivos())
+    else:
+        _estado["total"] += len(datos) - previo
+    if _estado["total"] > _config["limite"]:
+        _recortar()
+
+
+def _archivos():
+    """(ruta, fecha de uso, tamaño) de cada resultado guardado."""
+    raiz = _directorio()
+    try:
+        carpetas = [e.path for e in os.scandir(raiz) if e.is_dir()]
+    except OSError:
+        return []
+    out = []
+    for carpeta in carpetas:
+        try:
+            for e in os.scandir(carpeta):
+                if e.is_file() and not e.name.endswith(".tmp"):
+                    st = e.stat()
+                    out.append((e.path, st.st_mtime, st.st_size))
+        except OSError:
+            continue
+    return out
+
+
+def _borrar(ruta: str) -> int:
+    try:
+        tam = os.path.getsize(ruta)
+        os.remove(ruta)
+        return tam
+    except OSError:
+        return 0
+
+
+def _recortar() -> None:
+    # Se baja al 90 % del límite para no recortar en cada guardado
+    objetivo = _config["limite"] * 0.9
+    archivos = sorted(_archivos(), key=lambda a: a[1])
+    total = sum(tam for _, _, tam in archivos)
+    for ruta, _, _ in archivos:
+        if total <= objetivo:
+            break
+        total -= _borrar(ruta)
+    _estado["total"] = total
+
+
+def calcular(operacion: str, entradas, funcion, opciones=None):
+    """Devuelve funcion(), o el resultado guardado para las mismas entradas exactas.
+
+    `entradas` y `opciones` identifican el cálculo; el resultado puede tener
+    fracciones, listas, tuplas, textos y diccionarios. Lo que no se pueda
+    guardar (o un disco sin espacio) simplemente no se guarda.
+    """
+    if not _config["activa"]:
+        return funcion()
+    try:
+        ruta = _ruta(clave(operacion, entradas, opciones))
+    except TypeError:
+        return funcion()
+    valor = _leer(ruta)
+    if valor is not _FALTA:
+        return valor
+    inicio = time.perf_counter()
+    valor = funcion()
+    if time.perf_counter() - inicio >= _config["minimo_s"]:
+        _escribir(ruta, operacion, valor)
+    return valor
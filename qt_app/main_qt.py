@@ -2,6 +2,7 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from .selector_inicio_qt import SelectorInicioWindow
 from .theme import apply_theme
+from . import precarga
 import sys
 
 
@@ -11,4 +12,6 @@ def run():
     w = SelectorInicioWindow()
     # A pantalla completa SIEMPRE (maximizado conserva marcos de ventana)
     w.showMaximized()
+    # NumPy, matplotlib y la última ventana usada se cargan cuando haya tiempo ocioso
+    precarga.iniciar()
     sys.exit(app.exec())
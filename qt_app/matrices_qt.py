@@ -2,9 +2,10 @@
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QScrollArea, QGridLayout, QLineEdit, QTextEdit, QMessageBox, QFrame,
     QRadioButton, QCheckBox, QToolButton, QMenu, QSizePolicy, QDialog,
-    QListWidget, QListWidgetItem, QTabWidget
+    QListWidget, QListWidgetItem, QTabWidget, QComboBox
 )
 from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QTextCursor
 from fractions import Fraction
 from .theme import (
     bind_font_scale_stylesheet,
@@ -14,6 +15,8 @@ from .theme import (
     help_icon_preferred,
 )
 from .settings_qt import open_settings_dialog
+from . import cache_resultados
+from .algebra_exacta import Adjunta, adjunta_bareiss, analizar, determinante_bareiss, menor
 
 
 def _parse_fraction(s: str) -> Fraction:
@@ -794,35 +797,33 @@ class SumaMatricesWindow(_BaseMatrixWindow):
             return None, steps, "non_square"
 
         A = [[Fraction(val) for val in row] for row in matrix]
-        det, det_steps = determinante_con_pasos_ascii(A)
+        n = rows
+        # Cofactores, adjunta e inversa salen de una sola eliminación de Bareiss
+        engine = Adjunta(A)
+        det = engine.det
         steps.append("1) Calculo del determinante |A|")
-        steps.extend(det_steps)
+        if n <= 3:
+            steps.extend(determinante_con_pasos_ascii(A)[1])
+        else:
+            determinante_bareiss(A, steps)
         steps.append(f"\nDeterminante: {det}")
         if det == 0:
             steps.append("Como |A| = 0, la matriz es singular y no tiene inversa.")
             return None, steps, "singular"
 
-        n = rows
-
-        def minor(M, r, c):
-            return [[M[i][j] for j in range(len(M)) if j != c] for i in range(len(M)) if i != r]
-
-        cof = [[Fraction(0) for _ in range(n)] for __ in range(n)]
+        cof = engine.cofactores()
         steps.append("\n2) Matriz de cofactores C_ij = (-1)^{i+j} det(M_ij)")
         for i in range(n):
             for j in range(n):
-                sub = minor(A, i, j)
-                sub_det, _ = determinante_con_pasos_ascii(sub)
-                cof[i][j] = Fraction((1 if (i + j) % 2 == 0 else -1)) * sub_det
                 steps.append(f"   C{i+1}{j+1} = ({'-' if (i+j)%2 else '+'})det(M{i+1}{j+1}) = {cof[i][j]}")
 
-        adj = [[cof[j][i] for j in range(n)] for i in range(n)]
+        adj = engine.adjunta()
         steps.append("\n3) Adjunta: Adj(A) = (Cof(A))^T")
         steps.append("   Adj(A):")
         for row in adj:
             steps.append("   " + " ".join(str(v) for v in row))
 
-        inv = [[adj[i][j] / det for j in range(n)] for i in range(n)]
+        inv = engine.inversa()
         steps.append("\n4) Inversa: A^-1 = (1/|A|) * Adj(A)")
         steps.append("   A^-1:")
         for row in inv:
@@ -2159,7 +2160,7 @@ class DeterminanteMatrizWindow(_BaseMatrixWindow):
 
     def _run(self):
         A = self._leer()
-        det, steps = determinante_con_pasos_ascii(A)
+        det, steps = cache_resultados.calcular("determinante", (A,), lambda: determinante_con_pasos_ascii(A))
         try:
             self.det_badge.setText(f"Determinante = {det}")
         except Exception:
@@ -2352,7 +2353,7 @@ class InversaMatrizWindow(_BaseMatrixWindow):
         # Añadir selección de método y opción de animar
         method_row = QHBoxLayout()
         method_row.addWidget(QLabel("Método:"))
-        self.rb_adj = QRadioButton("Adjunta (1×1,2×2,3×3)")
+        self.rb_adj = QRadioButton("Adjunta")
         self.rb_gj = QRadioButton("Gauss-Jordan")
         self.rb_adj.setChecked(True)
         method_row.addWidget(self.rb_adj)
@@ -2360,6 +2361,16 @@ class InversaMatrizWindow(_BaseMatrixWindow):
         method_row.addStretch(1)
         self.cb_anim = QCheckBox("Animar paso a paso")
         method_row.addWidget(self.cb_anim)
+        # Los pasos de cada cofactor se generan solo cuando se piden
+        method_row.addWidget(QLabel("Ver cofactor:"))
+        self.cb_cofactor = QComboBox()
+        self.cb_cofactor.setEnabled(False)
+        method_row.addWidget(self.cb_cofactor)
+        self.btn_cofactor = QPushButton("Ver pasos")
+        self.btn_cofactor.setEnabled(False)
+        self.btn_cofactor.clicked.connect(self._mostrar_pasos_cofactor)
+        method_row.addWidget(self.btn_cofactor)
+        self._adjunta = None
         # Insertar el row antes del resultado (result_box está al final); lo insertamos
         # en la posición anterior al último widget para que aparezca sobre el resultado.
         self.lay.insertLayout(self.lay.count() - 1, method_row)
@@ -2370,6 +2381,29 @@ class InversaMatrizWindow(_BaseMatrixWindow):
         self.visual_frame.layout().setSpacing(18)
         self.lay.insertWidget(self.lay.count() - 1, self.visual_frame)
 
+    def _actualizar_cofactores(self, n):
+        """Llena el selector de cofactores para la última matriz calculada por adjunta."""
+        self.cb_cofactor.clear()
+        for i in range(n):
+            for j in range(n):
+                self.cb_cofactor.addItem(f"C{i+1}{j+1}", (i, j))
+        self.cb_cofactor.setEnabled(n > 0)
+        self.btn_cofactor.setEnabled(n > 0)
+
+    def _mostrar_pasos_cofactor(self):
+        if self._adjunta is None or self.cb_cofactor.currentIndex() < 0:
+            return
+        i, j = self.cb_cofactor.currentData()
+        try:
+            pasos = self._adjunta.pasos_cofactor(i, j)
+        except Exception as exc:
+            QMessageBox.warning(self, "Aviso", f"No se pudo calcular el cofactor: {exc}")
+            return
+        self.result_box.moveCursor(QTextCursor.End)
+        self.result_box.insertPlainText("\n" + ("-" * 110) + "\n")
+        self.result_box.insertPlainText("\n".join(pasos) + "\n")
+        self.result_box.ensureCursorVisible()
+
     def _setup_entries(self):
         # Fuerza matriz cuadrada: usa filas para columnas
         for i in reversed(range(self.grid.count())):
@@ -2441,39 +2475,14 @@ class InversaMatrizWindow(_BaseMatrixWindow):
 
         _clear_visuals()
         self.result_box.clear()
-
-        # RREF helper (copiado y adaptado de la versión Tk)
-        def rref_info(A_matrix):
-            M = [row[:] for row in A_matrix]
-            rows = len(M); cols = len(M[0]) if rows else 0
-            row = 0
-            piv_cols = []
-            for col in range(cols):
-                if row >= rows:
-                    break
-                piv = None
-                for r in range(row, rows):
-                    if M[r][col] != 0:
-                        piv = r; break
-                if piv is None:
-                    continue
-                if piv != row:
-                    M[row], M[piv] = M[piv], M[row]
-                a = M[row][col]
-                if a != 1:
-                    M[row] = [v / a for v in M[row]]
-                for r in range(rows):
-                    if r == row: continue
-                    f = M[r][col]
-                    if f != 0:
-                        M[r] = [M[r][j] - f * M[row][j] for j in range(cols)]
-                piv_cols.append(col)
-                row += 1
-            free_cols = [j for j in range(cols) if j not in piv_cols]
-            return M, piv_cols, free_cols
+        self._adjunta = None
+        self._actualizar_cofactores(0)
 
         def explain_cde(A_matrix):
-            R, piv_cols, free_cols = rref_info(A_matrix)
+            # RREF, pivotes y columnas libres salen del análisis compartido: una
+            # misma matriz (la original o la ya reducida) no se vuelve a reducir
+            analisis = analizar(A_matrix)
+            R, piv_cols, free_cols = analisis.rref, analisis.pivotes, analisis.libres
             lines = []
             lines.append("Comprobación de invertibilidad (c, d, e):")
             lines.append("")
@@ -2510,9 +2519,9 @@ class InversaMatrizWindow(_BaseMatrixWindow):
             """Return a single string with the explanation lines joined for message boxes."""
             return "\n".join(explain_cde(A_matrix))
 
-        # Ejecutar Gauss-Jordan solo si no se eligió explícitamente el método Adjunta
+        # Ejecutar Gauss-Jordan solo si no se eligió el método Adjunta
         pivot_cols = []
-        if not (self.rb_adj.isChecked() and n <= 3):
+        if not self.rb_adj.isChecked():
             # Mostrar la matriz aumentada inicial [A | I]
             _clear_visuals()
             box_start = QFrame(); box_start.setLayout(QVBoxLayout())
@@ -2523,72 +2532,83 @@ class InversaMatrizWindow(_BaseMatrixWindow):
             box_start.layout().addLayout(h)
             self.visual_frame.layout().addWidget(box_start)
 
-            fila_pivote = 0
-            for col in range(n):
-                piv = None
-                for r in range(fila_pivote, n):
-                    if Aw[r][col] != 0:
-                        piv = r; break
-                if piv is None:
-                    continue
-                if piv != fila_pivote:
-                    Aw[fila_pivote], Aw[piv] = Aw[piv], Aw[fila_pivote]
-                    Iw[fila_pivote], Iw[piv] = Iw[piv], Iw[fila_pivote]
-                    self.result_box.insertPlainText("Operación: ")
-                    self.result_box.insertPlainText(f"R{fila_pivote+1} \u2194 R{piv+1}\n\n")
-                    for ln in augmented_lines(Aw, Iw):
-                        self.result_box.insertPlainText(ln + "\n")
-                    self.result_box.insertPlainText("\n" + ("-" * 110) + "\n\n")
-
-                a = Aw[fila_pivote][col]
-                if a == 0:
+            def reducir(Aw, Iw):
+                # Trabaja sobre copias y devuelve el texto de los pasos con el estado final
+                Aw = [fila[:] for fila in Aw]
+                Iw = [fila[:] for fila in Iw]
+                out = []
+                pivot_cols = []
+                fila_pivote = 0
+                for col in range(n):
+                    piv = None
+                    for r in range(fila_pivote, n):
+                        if Aw[r][col] != 0:
+                            piv = r; break
+                    if piv is None:
+                        continue
+                    if piv != fila_pivote:
+                        Aw[fila_pivote], Aw[piv] = Aw[piv], Aw[fila_pivote]
+                        Iw[fila_pivote], Iw[piv] = Iw[piv], Iw[fila_pivote]
+                        out.append("Operación: ")
+                        out.append(f"R{fila_pivote+1} \u2194 R{piv+1}\n\n")
+                        for ln in augmented_lines(Aw, Iw):
+                            out.append(ln + "\n")
+                        out.append("\n" + ("-" * 110) + "\n\n")
+
+                    a = Aw[fila_pivote][col]
+                    if a == 0:
+                        fila_pivote += 1
+                        if fila_pivote >= n:
+                            break
+                        continue
+                    if a != 1:
+                        Aw[fila_pivote] = [v / a for v in Aw[fila_pivote]]
+                        Iw[fila_pivote] = [v / a for v in Iw[fila_pivote]]
+                        out.append("Operación: ")
+                        out.append(f"R{fila_pivote+1} \u2192 R{fila_pivote+1}/{a}\n\n")
+                        for ln in augmented_lines(Aw, Iw):
+                            out.append(ln + "\n")
+                        out.append("\n" + ("-" * 110) + "\n\n")
+
+                    for r in range(n):
+                        if r == fila_pivote: continue
+                        f = Aw[r][col]
+                        if f == 0: continue
+                        origA = Aw[r][:]; origI = Iw[r][:]
+                        pivA = Aw[fila_pivote][:]; pivI = Iw[fila_pivote][:]
+                        Aw[r] = [origA[j] - f * pivA[j] for j in range(n)]
+                        Iw[r] = [origI[j] - f * pivI[j] for j in range(n)]
+                        fp = pivA + pivI
+                        fa = origA + origI
+                        fr = Aw[r] + Iw[r]
+                        left_lines = operacion_vertical_aug(fp, fa, f, fr)
+                        right_lines = augmented_lines(Aw, Iw)
+                        out.append("Operación: ")
+                        out.append(f"R{r+1} \u2192 R{r+1} - ({f})R{fila_pivote+1}\n\n")
+                        max_left = max(len(s) for s in left_lines) if left_lines else 0
+                        sep = "   |   "
+                        max_len = max(len(left_lines), len(right_lines))
+                        for i in range(max_len):
+                            l = left_lines[i] if i < len(left_lines) else ""
+                            rr = right_lines[i] if i < len(right_lines) else ""
+                            out.append(l.ljust(max_left) + (sep if rr else "") + rr + "\n")
+                        out.append("\n" + ("-" * 110) + "\n\n")
+
+                    pivot_cols.append(col)
                     fila_pivote += 1
-                    if fila_pivote >= n:
-                        break
-                    continue
-                if a != 1:
-                    Aw[fila_pivote] = [v / a for v in Aw[fila_pivote]]
-                    Iw[fila_pivote] = [v / a for v in Iw[fila_pivote]]
-                    self.result_box.insertPlainText("Operación: ")
-                    self.result_box.insertPlainText(f"R{fila_pivote+1} \u2192 R{fila_pivote+1}/{a}\n\n")
-                    for ln in augmented_lines(Aw, Iw):
-                        self.result_box.insertPlainText(ln + "\n")
-                    self.result_box.insertPlainText("\n" + ("-" * 110) + "\n\n")
-
-                for r in range(n):
-                    if r == fila_pivote: continue
-                    f = Aw[r][col]
-                    if f == 0: continue
-                    origA = Aw[r][:]; origI = Iw[r][:]
-                    pivA = Aw[fila_pivote][:]; pivI = Iw[fila_pivote][:]
-                    Aw[r] = [origA[j] - f * pivA[j] for j in range(n)]
-                    Iw[r] = [origI[j] - f * pivI[j] for j in range(n)]
-                    fp = pivA + pivI
-                    fa = origA + origI
-                    fr = Aw[r] + Iw[r]
-                    left_lines = operacion_vertical_aug(fp, fa, f, fr)
-                    right_lines = augmented_lines(Aw, Iw)
-                    self.result_box.insertPlainText("Operación: ")
-                    self.result_box.insertPlainText(f"R{r+1} \u2192 R{r+1} - ({f})R{fila_pivote+1}\n\n")
-                    max_left = max(len(s) for s in left_lines) if left_lines else 0
-                    sep = "   |   "
-                    max_len = max(len(left_lines), len(right_lines))
-                    for i in range(max_len):
-                        l = left_lines[i] if i < len(left_lines) else ""
-                        rr = right_lines[i] if i < len(right_lines) else ""
-                        self.result_box.insertPlainText(l.ljust(max_left) + (sep if rr else "") + rr + "\n")
-                    self.result_box.insertPlainText("\n" + ("-" * 110) + "\n\n")
-
-                pivot_cols.append(col)
-                fila_pivote += 1
-                if fila_pivote >= n: break
+                    if fila_pivote >= n: break
+                return "".join(out), Aw, Iw, pivot_cols
+
+            # La reducción (y su texto) se guarda en la caché de resultados entre sesiones
+            texto, Aw, Iw, pivot_cols = cache_resultados.calcular("inversa_gauss_jordan", (Aw,), lambda: reducir(Aw, Iw))
+            self.result_box.insertPlainText(texto)
 
         # Determinar si hay n pivotes (nota: si se saltó GJ, pivot_cols estará vacío)
         invertible_by_piv = (len(pivot_cols) == n)
 
         # Si Gauss-Jordan se ejecutó y la matriz es invertible, mostrar visualmente
         # la transformación final [I | A^-1] de forma ordenada en la interfaz.
-        if not (self.rb_adj.isChecked() and n <= 3) and invertible_by_piv:
+        if not self.rb_adj.isChecked() and invertible_by_piv:
             _clear_visuals()
             box_final_left = QFrame(); box_final_left.setLayout(QVBoxLayout())
             box_final_left.layout().addWidget(QLabel("Matriz Identidad(I):"))
@@ -2610,188 +2630,142 @@ class InversaMatrizWindow(_BaseMatrixWindow):
             QMessageBox.critical(self, "Sin inversa (Gauss-Jordan)", "La matriz no es invertible.\n\n" + expl)
             # Además anexar la explicación al cuadro de pasos para evidencia
             self.result_box.insertPlainText("\n" + expl + "\n")
-            # Si se llegó aquí por elegir Adjunta pero n>3, no return — dejar que flujo continúe.
             # Si se llegó por GJ deliberado, no continuar con adjunta mostrando matrices.
-            if not (self.rb_adj.isChecked() and n <= 3):
+            if not self.rb_adj.isChecked():
                 return
 
-        # Si el usuario eligió adjunta y la dimensión es adecuada, usar adjunta
+        # Método de la adjunta: cofactores, adjunta e inversa salen de una sola
+        # eliminación exacta (Bareiss); ya no hay límite de tamaño.
         if self.rb_adj.isChecked():
-            if n > 3:
-                QMessageBox.information(self, "Info", "Adjunta solo disponible para n ≤ 3. Usando Gauss-Jordan.")
+            engine = Adjunta(Aw, cache_resultados.calcular("adjunta", (Aw,), lambda: adjunta_bareiss(Aw)))
+            self._adjunta = engine
+
+            # Helper para formatear submatrices en varias líneas
+            def format_submatrix(M):
+                if not M:
+                    return "[]"
+                rows = ["[" + ", ".join(str(x) for x in r) + "]" for r in M]
+                if len(rows) == 1:
+                    return "[" + rows[0] + "]"
+                return "[" + ",\n           ".join(rows) + "]"
+
+            # Mostrar el procedimiento del determinante de forma ordenada (expansión por cofactores
+            # en la primera fila). Si resulta 0, NO se muestran matrices, sólo este procedimiento
+            # y un mensaje claro al usuario.
+            self.result_box.insertPlainText("1) Cálculo del determinante |A|\n")
+            self.result_box.insertPlainText("Expansión por cofactores en la primera fila:\n\n")
+
+            # Para cada elemento de la primera fila mostrar su menor y el valor del cofactor
+            for j in range(n):
+                sub = menor(Aw, 0, j)
+                sub_det = engine.menor_det(0, j)
+                sign = 1 if (j % 2 == 0) else -1
+                cofactor = engine.cofactor(0, j)
+
+                # Formatear submatriz en bloque alineado (cada fila en su propia línea)
+                sub_rows = ["[" + ", ".join(str(x) for x in r) + "]" for r in sub]
+                if len(sub_rows) == 1:
+                    sub_block = sub_rows[0]
+                else:
+                    sub_block = "[\n" + "\n".join("    " + r for r in sub_rows) + "\n]"
+                self.result_box.insertPlainText(
+                    f"M1{j+1} = det({sub_block}) = {sub_det}   →  C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {cofactor}\n\n"
+                )
+
+            # Fórmula por cofactores y evaluación
+            terms = " + ".join(f"a1{j+1}·C1{j+1}" for j in range(n))
+            self.result_box.insertPlainText("|A| = " + terms + "\n")
+            eval_terms = " + ".join(f"({Aw[0][j]})({engine.cofactor(0, j)})" for j in range(n))
+            self.result_box.insertPlainText("    = " + eval_terms + "\n")
+            total = engine.det
+            self.result_box.insertPlainText(f"    = {total}\n\n")
+            self._actualizar_cofactores(n)
+
+            # Si el determinante es cero, mostrar mensaje crítico y un bloque de conclusión
+            if total == 0:
+                QMessageBox.critical(
+                    self,
+                    "Sin inversa",
+                    "La matriz no es invertible porque es una matriz singular.\nUna matriz es singular cuando su determinante es igual a cero."
+                )
+                # Mensaje final con formato claro y alineado
+                self.result_box.insertPlainText("Resultado:\n\n")
+                self.result_box.insertPlainText("El determinante de la matriz es 0.\n\n")
+                self.result_box.insertPlainText("Esto significa que la matriz no es invertible,\n")
+                self.result_box.insertPlainText("ya que su determinante es igual a cero.\n\n")
+                self.result_box.insertPlainText("Por lo tanto, no existe la matriz inversa A⁻¹.\n\n")
+                # además mostrar la explicación c/d/e en el recuadro para aportar evidencia adicional
+                for l in explain_cde(Aw):
+                    self.result_box.insertPlainText(l + "\n")
+                return
+
+            # Si det != 0: cofactores y adjunta (transpuesta de cofactores) ya calculados
+            cof = engine.cofactores()
+            adj = engine.adjunta()
+
+            # Mostrar visualmente: A, Adj(A), A^{-1}
+            _clear_visuals()
+            boxA = QFrame(); boxA.setLayout(QVBoxLayout())
+            boxA.layout().addWidget(QLabel("Matriz A:"))
+            boxA.layout().addWidget(_matrix_widget(self, Aw))
+            boxAdj = QFrame(); boxAdj.setLayout(QVBoxLayout())
+            boxAdj.layout().addWidget(QLabel("Adj(A) (transpuesta de la matriz de cofactores):"))
+            boxAdj.layout().addWidget(_matrix_widget(self, adj))
+
+            # preparar contenedor para la inversa
+            boxInv = QFrame(); boxInv.setLayout(QVBoxLayout())
+            boxInv.layout().addWidget(QLabel("A⁻¹ (inversa):"))
+
+            self.visual_frame.layout().addWidget(boxA)
+            self.visual_frame.layout().addWidget(boxAdj)
+            self.visual_frame.layout().addWidget(boxInv)
+
+            # 2) Matriz de cofactores de A (tabla compacta). Para n > 3 se omiten las
+            # submatrices: los pasos de cada cofactor se piden con "Ver cofactor".
+            self.result_box.insertPlainText("2) Matriz de cofactores de A\n")
+            sep = "-" * 75
+            self.result_box.insertPlainText(sep + "\n")
+            if n <= 3:
+                self.result_box.insertPlainText("| Posición |       M_ij (submatriz)       | det(M_ij) |  C_ij  |\n")
             else:
-                # Calcular determinante
-                det, det_steps = determinante_con_pasos_ascii(Aw)
-
-                # Helper para submatrices
-                def minor(M, r, c):
-                    return [[M[i][j] for j in range(len(M)) if j != c] for i in range(len(M)) if i != r]
-
-                # Helper para formatear submatrices en varias líneas
-                def format_submatrix(M):
-                    if not M:
-                        return "[]"
-                    rows = ["[" + ", ".join(str(x) for x in r) + "]" for r in M]
-                    if len(rows) == 1:
-                        return "[" + rows[0] + "]"
-                    return "[" + ",\n           ".join(rows) + "]"
-
-                # Mostrar el procedimiento del determinante de forma ordenada (expansión por cofactores
-                # en la primera fila). Si resulta 0, NO se muestran matrices, sólo este procedimiento
-                # y un mensaje claro al usuario.
-                self.result_box.insertPlainText("1) Cálculo del determinante |A|\n")
-                self.result_box.insertPlainText("Expansión por cofactores en la primera fila:\n\n")
-
-                # Para cada elemento de la primera fila mostrar su menor y el valor del cofactor
-                first_row_contribs = []
+                self.result_box.insertPlainText("| Posición | det(M_ij) |  C_ij  |\n")
+            self.result_box.insertPlainText(sep + "\n")
+            for i in range(n):
                 for j in range(n):
-                    sub = minor(Aw, 0, j)
-                    sub_det, _ = determinante_con_pasos_ascii(sub)
-                    sign = 1 if (j % 2 == 0) else -1
-                    cofactor = Fraction(sign) * sub_det
-
-                    # Formatear submatriz en bloque alineado (cada fila en su propia línea)
-                    sub_rows = ["[" + ", ".join(str(x) for x in r) + "]" for r in sub]
-                    if len(sub_rows) == 1:
-                        sub_block = sub_rows[0]
-                        self.result_box.insertPlainText(
-                            f"M1{j+1} = det({sub_block}) = {sub_det}   →  C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {cofactor}\n\n"
-                        )
+                    sub_det = engine.menor_det(i, j)
+                    cij = cof[i][j]
+                    if n <= 3:
+                        sub_str = format_submatrix(menor(Aw, i, j))
+                        self.result_box.insertPlainText(f"| C{i+1}{j+1} | {sub_str:<30} | {str(sub_det):>8} | {str(cij):>6} |\n")
                     else:
-                        sub_block = "[\n" + "\n".join("    " + r for r in sub_rows) + "\n]"
-                        self.result_box.insertPlainText(
-                            f"M1{j+1} = det({sub_block}) = {sub_det}   →  C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {cofactor}\n\n"
-                        )
-
-                    first_row_contribs.append((Aw[0][j], cofactor))
-
-                # Fórmula por cofactores y evaluación
-                terms = " + ".join(f"a1{j+1}·C1{j+1}" for j in range(n))
-                self.result_box.insertPlainText("|A| = " + terms + "\n")
-                eval_terms = " + ".join(f"({Aw[0][j]})({first_row_contribs[j][1]})" for j in range(n))
-                self.result_box.insertPlainText("    = " + eval_terms + "\n")
-                total = sum(Aw[0][j] * first_row_contribs[j][1] for j in range(n))
-                self.result_box.insertPlainText(f"    = {total}\n\n")
-
-                # Si el determinante es cero, mostrar mensaje crítico y un bloque de conclusión
-                if total == 0:
-                    QMessageBox.critical(
-                        self,
-                        "Sin inversa",
-                        "La matriz no es invertible porque es una matriz singular.\nUna matriz es singular cuando su determinante es igual a cero."
-                    )
-                    # Mensaje final con formato claro y alineado
-                    self.result_box.insertPlainText("Resultado:\n\n")
-                    self.result_box.insertPlainText("El determinante de la matriz es 0.\n\n")
-                    self.result_box.insertPlainText("Esto significa que la matriz no es invertible,\n")
-                    self.result_box.insertPlainText("ya que su determinante es igual a cero.\n\n")
-                    self.result_box.insertPlainText("Por lo tanto, no existe la matriz inversa A⁻¹.\n\n")
-                    # además mostrar la explicación c/d/e en el recuadro para aportar evidencia adicional
-                    for l in explain_cde(Aw):
-                        self.result_box.insertPlainText(l + "\n")
-                    return
+                        self.result_box.insertPlainText(f"| C{i+1}{j+1} | {str(sub_det):>8} | {str(cij):>6} |\n")
 
-                # Si det != 0, entonces construir cofactores y adjunta
-                cof = [[None for _ in range(n)] for __ in range(n)]
-                for i in range(n):
-                    for j in range(n):
-                        sub = minor(Aw, i, j)
-                        sub_det, _ = determinante_con_pasos(sub)
-                        cof[i][j] = Fraction((1 if ((i + j) % 2 == 0) else -1)) * sub_det
-
-                # adjunta = transpuesta de cofactores
-                adj = [[cof[j][i] for j in range(n)] for i in range(n)]
-
-                # Mostrar visualmente: A, Adj(A), A^{-1}
-                _clear_visuals()
-                boxA = QFrame(); boxA.setLayout(QVBoxLayout())
-                boxA.layout().addWidget(QLabel("Matriz A:"))
-                boxA.layout().addWidget(_matrix_widget(self, Aw))
-                boxAdj = QFrame(); boxAdj.setLayout(QVBoxLayout())
-                boxAdj.layout().addWidget(QLabel("Adj(A) (transpuesta de la matriz de cofactores):"))
-                boxAdj.layout().addWidget(_matrix_widget(self, adj))
-
-                # preparar contenedor para la inversa
-                boxInv = QFrame(); boxInv.setLayout(QVBoxLayout())
-                boxInv.layout().addWidget(QLabel("A⁻¹ (inversa):"))
-
-                self.visual_frame.layout().addWidget(boxA)
-                self.visual_frame.layout().addWidget(boxAdj)
-                self.visual_frame.layout().addWidget(boxInv)
-
-                # Formato mejorado y legible del recuadro de pasos
-                # 1) Cálculo del determinante |A| por expansión por cofactores en la primera fila
-                self.result_box.insertPlainText("1) Calculo del determinante |A|\n")
-                self.result_box.insertPlainText("Expansión por cofactores en la primera fila:\n\n")
-                # Listar M1j y C1j para j=1..n con espacios y saltos claros
-                for j in range(n):
-                    sub = minor(Aw, 0, j)
-                    sub_det, sub_steps = determinante_con_pasos_ascii(sub)
-                    sign = 1 if (j % 2 == 0) else -1
-                    sub_fmt = format_submatrix(sub)
-                    self.result_box.insertPlainText(f"M1{j+1} = det({sub_fmt}) = {sub_det}\n")
-                    # añadir una línea con flecha → C1j
-                    self.result_box.insertPlainText(f"    -> C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {Fraction(sign)*sub_det}\n\n")
-
-                # fórmula del determinante por cofactores (primera fila) y evaluación
-                terms = " + ".join(f"a1{j+1}·C1{j+1}" for j in range(n))
-                self.result_box.insertPlainText("|A| = " + terms + "\n")
-                eval_terms = " + ".join(f"({Aw[0][j]})({Fraction(cof[0][j])})" for j in range(n))
-                self.result_box.insertPlainText("    = " + eval_terms + "\n")
-                total = sum(Aw[0][j] * cof[0][j] for j in range(n))
-                self.result_box.insertPlainText(f"    = {total}\n\n")
-
-                # Si el determinante es cero, informar y mostrar el diálogo de error.
-                if total == 0:
-                    QMessageBox.critical(
-                        self,
-                        "Sin inversa",
-                        "La matriz no es invertible porque es una matriz singular.\nUna matriz es singular cuando su determinante es igual a cero."
-                    )
-                    # Ya mostramos el procedimiento del determinante arriba; terminar.
-                    return
+            # 3) Matriz Adjunta
+            self.result_box.insertPlainText("3) Matriz Adjunta\n")
+            self.result_box.insertPlainText("Adj(A) = (Cof(A))ᵀ  (traspuesta de la matriz de cofactores)\n\n")
+            for ln in (" ".join(str(v) for v in row) for row in adj):
+                self.result_box.insertPlainText(ln + "\n")
+            self.result_box.insertPlainText("\n")
 
-                # 2) Matriz de cofactores de A (tabla compacta)
-                self.result_box.insertPlainText("2) Matriz de cofactores de A\n")
-                sep = "-" * 75
-                self.result_box.insertPlainText(sep + "\n")
-                self.result_box.insertPlainText("| Posición |       M_ij (submatriz)       | det(M_ij) |  C_ij  |\n")
-                self.result_box.insertPlainText(sep + "\n")
-                for i in range(n):
-                    for j in range(n):
-                        sub = minor(Aw, i, j)
-                        sub_det, _ = determinante_con_pasos_ascii(sub)
-                        cij = cof[i][j]
-                        sub_str = format_submatrix(sub)
-                        # separar visualmente cada fila
-                        self.result_box.insertPlainText(f"| C{i+1}{j+1} | {sub_str:<30} | {str(sub_det):>8} | {str(cij):>6} |\n")
+            # 4) Cálculo de la inversa (det != 0 en este punto)
+            inv = engine.inversa()
+            # Mostrar resultado numérico y visual
+            boxInv.layout().addWidget(_matrix_widget(self, inv))
+            self.visual_frame.layout().addWidget(boxInv)
+            self.result_box.insertPlainText("4) Cálculo de la inversa\n")
+            self.result_box.insertPlainText(f"Como |A| = {total},\nA⁻¹ = (1 / |A|) · Adj(A)\n")
+            self.result_box.insertPlainText(f"A⁻¹ = (1 / {total}) · Adj(A)\n\n")
+            self.result_box.insertPlainText("A⁻¹ =\n")
+            for ln in (" ".join(str(v) for v in row) for row in inv):
+                self.result_box.insertPlainText(ln + "\n")
 
-                # 3) Matriz Adjunta
-                self.result_box.insertPlainText("3) Matriz Adjunta\n")
-                self.result_box.insertPlainText("Adj(A) = (Cof(A))ᵀ  (traspuesta de la matriz de cofactores)\n\n")
-                for ln in (" ".join(str(v) for v in row) for row in adj):
-                    self.result_box.insertPlainText(ln + "\n")
-                self.result_box.insertPlainText("\n")
-
-                # 4) Cálculo de la inversa (det != 0 en este punto)
-                inv = [[adj[i][j] / total for j in range(n)] for i in range(n)]
-                # Mostrar resultado numérico y visual
-                boxInv.layout().addWidget(_matrix_widget(self, inv))
-                self.visual_frame.layout().addWidget(boxInv)
-                self.result_box.insertPlainText("4) Cálculo de la inversa\n")
-                self.result_box.insertPlainText(f"Como |A| = {total},\nA⁻¹ = (1 / |A|) · Adj(A)\n")
-                self.result_box.insertPlainText(f"A⁻¹ = (1 / {total}) · Adj(A)\n\n")
-                self.result_box.insertPlainText("A⁻¹ =\n")
-                for ln in (" ".join(str(v) for v in row) for row in inv):
-                    self.result_box.insertPlainText(ln + "\n")
-
-                # Conclusión (comprobación c/d/e)
-                self.result_box.insertPlainText("\nConclusión: la matriz es invertible y la inversa se ha calculado como arriba.\n\n")
-                for l in explain_cde(Aw):
-                    self.result_box.insertPlainText(l + "\n")
-                return
+            # Conclusión (comprobación c/d/e)
+            self.result_box.insertPlainText("\nConclusión: la matriz es invertible y la inversa se ha calculado como arriba.\n\n")
+            for l in explain_cde(Aw):
+                self.result_box.insertPlainText(l + "\n")
+            return
 
-        # Si llegamos aquí, proceder con Gauss-Jordan (sea por selección o por limitación de adjunta)
+        # Si llegamos aquí, proceder con Gauss-Jordan
         if not self.cb_anim.isChecked():
             # mostrar explicación aunque no se anime
             pass
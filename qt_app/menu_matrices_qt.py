@@ -19,6 +19,7 @@ from .theme import (
     help_icon_preferred,
 )
 from .settings_qt import open_settings_dialog
+from .ventanas import crear_ventana
 
 
 class MenuMatricesWindow(QMainWindow):
@@ -152,44 +153,37 @@ class MenuMatricesWindow(QMainWindow):
             self.close()
 
     def _open_suma(self):
-        from .matrices_qt import SumaMatricesWindow
-        w = SumaMatricesWindow(parent=self)
+        w = crear_ventana("suma", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_resta(self):
-        from .matrices_qt import RestaMatricesWindow
-        w = RestaMatricesWindow(parent=self)
+        w = crear_ventana("resta", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_mult(self):
-        from .matrices_qt import MultiplicacionMatricesWindow
-        w = MultiplicacionMatricesWindow(parent=self)
+        w = crear_ventana("multiplicacion", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_det(self):
-        from .matrices_qt import DeterminanteMatrizWindow
-        w = DeterminanteMatrizWindow(parent=self)
+        w = crear_ventana("determinante", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_trans(self):
-        from .matrices_qt import TranspuestaMatrizWindow
-        w = TranspuestaMatrizWindow(parent=self)
+        w = crear_ventana("transpuesta", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_inv(self):
-        from .matrices_qt import InversaMatrizWindow
-        w = InversaMatrizWindow(parent=self)
+        w = crear_ventana("inversa", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_ops(self):
-        from .operaciones_qt import OperacionesMatricesWindow
-        w = OperacionesMatricesWindow(parent=self)
+        w = crear_ventana("operaciones", parent=self)
         w.showMaximized()
         self._child = w
 
@@ -19,10 +19,7 @@ from .theme import (
     help_icon_preferred,
 )
 from .settings_qt import open_settings_dialog
-from .metodos.biseccion_qt import MetodoBiseccionWindow
-from .metodos.falsa_posicion_qt import MetodoFalsaPosicionWindow
-from .metodos.newton_raphson_qt import MetodoNewtonRaphsonWindow
-from .metodos.secante_qt import MetodoSecanteWindow
+from .ventanas import crear_ventana
 
 
 class MenuMetodosNumericosWindow(QMainWindow):
@@ -73,6 +70,16 @@ class MenuMetodosNumericosWindow(QMainWindow):
         btn_secante.clicked.connect(self._open_secante)
         top_layout.addWidget(btn_secante)
 
+        btn_illinois = QPushButton("Metodo de Illinois")
+        btn_illinois.setMinimumHeight(36)
+        btn_illinois.clicked.connect(self._open_illinois)
+        top_layout.addWidget(btn_illinois)
+
+        btn_brent = QPushButton("Metodo de Brent")
+        btn_brent.setMinimumHeight(36)
+        btn_brent.clicked.connect(self._open_brent)
+        top_layout.addWidget(btn_brent)
+
         top_layout.addStretch(1)
 
         more_btn = QToolButton()
@@ -119,8 +126,10 @@ class MenuMetodosNumericosWindow(QMainWindow):
             "Disponible ahora:\n"
             "- Metodo de Biseccion con reporte paso a paso, resumen destacado y validaciones del intervalo.\n"
             "- Metodo de Falsa Posicion heredado del flujo de biseccion con reportes completos.\n"
-            "- Metodo de Newton-Raphson con derivada numerica y seguimiento de cada iteracion.\n"
+            "- Metodo de Newton-Raphson con derivada exacta (diferenciacion automatica) y seguimiento de cada iteracion.\n"
             "- Metodo de la secante con dos aproximaciones iniciales y tabla de iteraciones completa.\n"
+            "- Metodo de Illinois (falsa posicion modificada) que evita el estancamiento de un extremo.\n"
+            "- Metodo de Brent con interpolacion y respaldo de biseccion, con menos evaluaciones de f(x).\n"
             "\nEn desarrollo:\n"
             "- Nuevos metodos de aproximacion con interfaces interactivas.\n"
             "- Integracion con historiales para comparar iteraciones clave."
@@ -144,22 +153,32 @@ class MenuMetodosNumericosWindow(QMainWindow):
             self.close()
 
     def _open_biseccion(self):
-        w = MetodoBiseccionWindow(parent=self)
+        w = crear_ventana("biseccion", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_falsa_posicion(self):
-        w = MetodoFalsaPosicionWindow(parent=self)
+        w = crear_ventana("falsa_posicion", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_newton_raphson(self):
-        w = MetodoNewtonRaphsonWindow(parent=self)
+        w = crear_ventana("newton_raphson", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_secante(self):
-        w = MetodoSecanteWindow(parent=self)
+        w = crear_ventana("secante", parent=self)
+        w.showMaximized()
+        self._child = w
+
+    def _open_illinois(self):
+        w = crear_ventana("illinois", parent=self)
+        w.showMaximized()
+        self._child = w
+
+    def _open_brent(self):
+        w = crear_ventana("brent", parent=self)
         w.showMaximized()
         self._child = w
 
@@ -168,7 +187,7 @@ class MenuMetodosNumericosWindow(QMainWindow):
 
     def _open_help(self):
         text = (
-            "Barra superior: abre Bisección, Falsa Posición, Newton-Raphson o Secante.\n"
+            "Barra superior: abre Bisección, Falsa Posición, Newton-Raphson, Secante, Illinois o Brent.\n"
             "Cada botón lanza la ventana específica con pasos guiados y reportes.\n\n"
             "Tip: el menú de tres puntos incluye Configuración y esta Ayuda."
         )
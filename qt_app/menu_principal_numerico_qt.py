@@ -25,10 +25,7 @@ from .theme import (
     help_icon_preferred,
 )
 from .settings_qt import open_settings_dialog
-from .metodos.biseccion_qt import MetodoBiseccionWindow
-from .metodos.falsa_posicion_qt import MetodoFalsaPosicionWindow
-from .metodos.newton_raphson_qt import MetodoNewtonRaphsonWindow
-from .metodos.secante_qt import MetodoSecanteWindow
+from .ventanas import crear_ventana
 
 
 class MenuNumericoPrincipalWindow(QMainWindow):
@@ -132,6 +129,14 @@ class MenuNumericoPrincipalWindow(QMainWindow):
         self.btn_secante.setMinimumHeight(44)
         self.btn_secante.clicked.connect(self._open_secante)
         nav_lay.addWidget(self.btn_secante)
+        self.btn_illinois = QPushButton("Método de Illinois")
+        self.btn_illinois.setMinimumHeight(44)
+        self.btn_illinois.clicked.connect(self._open_illinois)
+        nav_lay.addWidget(self.btn_illinois)
+        self.btn_brent = QPushButton("Método de Brent")
+        self.btn_brent.setMinimumHeight(44)
+        self.btn_brent.clicked.connect(self._open_brent)
+        nav_lay.addWidget(self.btn_brent)
         
 
         nav_lay.addStretch(1)
@@ -187,7 +192,7 @@ class MenuNumericoPrincipalWindow(QMainWindow):
 
         strapline = QLabel(
             "Herramientas de métodos numéricos con enfoque práctico. "
-            "Explora bisección, falsa posición, secante y Newton-Raphson desde una sola vista."
+            "Explora bisección, falsa posición, secante, Newton-Raphson, Illinois y Brent desde una sola vista."
         )
         strapline.setObjectName("Subtitle")
         strapline.setWordWrap(True)
@@ -199,8 +204,10 @@ class MenuNumericoPrincipalWindow(QMainWindow):
             "Disponible ahora:\n"
             "- Metodo de biseccion con validacion del intervalo y reporte paso a paso.\n"
             "- Metodo de falsa posicion con el mismo flujo guiado, ideal para intervalos dinamicos.\n"
-            "- Metodo de Newton-Raphson con derivada numerica y seguimiento iterativo detallado.\n"
-            "- Metodo de la secante con dos valores iniciales, sin requerir cambio de signo."
+            "- Metodo de Newton-Raphson con derivada exacta (diferenciacion automatica) y seguimiento iterativo detallado.\n"
+            "- Metodo de la secante con dos valores iniciales, sin requerir cambio de signo.\n"
+            "- Metodo de Illinois (falsa posicion modificada) sin estancamiento de extremos.\n"
+            "- Metodo de Brent: interpolacion con respaldo de biseccion y menos evaluaciones de f(x)."
         )
         details.setWordWrap(True)
         details.setAlignment(Qt.AlignLeft)
@@ -249,22 +256,32 @@ class MenuNumericoPrincipalWindow(QMainWindow):
         super().closeEvent(event)
 
     def _open_biseccion(self):
-        w = MetodoBiseccionWindow(parent=self)
+        w = crear_ventana("biseccion", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_falsa_posicion(self):
-        w = MetodoFalsaPosicionWindow(parent=self)
+        w = crear_ventana("falsa_posicion", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_newton_raphson(self):
-        w = MetodoNewtonRaphsonWindow(parent=self)
+        w = crear_ventana("newton_raphson", parent=self)
         w.showMaximized()
         self._child = w
 
     def _open_secante(self):
-        w = MetodoSecanteWindow(parent=self)
+        w = crear_ventana("secante", parent=self)
+        w.showMaximized()
+        self._child = w
+
+    def _open_illinois(self):
+        w = crear_ventana("illinois", parent=self)
+        w.showMaximized()
+        self._child = w
+
+    def _open_brent(self):
+        w = crear_ventana("brent", parent=self)
         w.showMaximized()
         self._child = w
 
@@ -274,7 +291,7 @@ class MenuNumericoPrincipalWindow(QMainWindow):
     def _open_help(self):
         text = (
             "Panel lateral: abre cada m\u00f3dulo de m\u00e9todos num\u00e9ricos (Bisecci\u00f3n, "
-            "Falsa Posici\u00f3n, Newton-Raphson o Secante).\n"
+            "Falsa Posici\u00f3n, Newton-Raphson, Secante, Illinois o Brent).\n"
             "Esta vista solo presenta los accesos; el c\u00e1lculo se realiza en las ventanas individuales.\n\n"
             "Tip: usa el men\u00fa de tres puntos para Configuraci\u00f3n y esta Ayuda. "
             "Ctrl+D alterna el tema."
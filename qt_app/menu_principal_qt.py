@@ -14,11 +14,6 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 from PySide6.QtCore import Qt, QSize
-from .menu_matrices_qt import MenuMatricesWindow
-from .menu_sistemas_qt import MenuSistemasWindow
-from .independencia_qt import IndependenciaWindow
-from .transformaciones_qt import TransformacionesWindow
-from .menu_metodos_numericos_qt import MenuMetodosNumericosWindow
 from .theme import (
     install_toggle_shortcut,
     bind_font_scale_stylesheet,
@@ -31,6 +26,7 @@ from .theme import (
     help_icon_preferred,
 )
 from .settings_qt import open_settings_dialog
+from .ventanas import crear_ventana
 
 
 class MenuPrincipalWindow(QMainWindow):
@@ -281,23 +277,23 @@ class MenuPrincipalWindow(QMainWindow):
         super().closeEvent(event)
 
     def _open_sistemas(self):
-        self.s = MenuSistemasWindow(parent=self)
+        self.s = crear_ventana("menu_sistemas", parent=self)
         self.s.showMaximized()
 
     def _open_matrices(self):
-        self.m = MenuMatricesWindow(parent=self)
+        self.m = crear_ventana("menu_matrices", parent=self)
         self.m.showMaximized()
 
     def _open_independencia(self):
-        self.w = IndependenciaWindow(parent=self)
+        self.w = crear_ventana("independencia", parent=self)
         self.w.showMaximized()
 
     def _open_transformaciones(self):
-        self.w = TransformacionesWindow(parent=self)
+        self.w = crear_ventana("transformaciones", parent=self)
         self.w.showMaximized()
 
     def _open_metodos_numericos(self):
-        self.w = MenuMetodosNumericosWindow(parent=self)
+        self.w = crear_ventana("menu_metodos", parent=self)
         self.w.showMaximized()
 
     def _open_settings(self):
@@ -19,6 +19,7 @@ from .theme import (
     help_icon_preferred,
 )
 from .settings_qt import open_settings_dialog
+from .ventanas import crear_ventana
 
 
 class MenuSistemasWindow(QMainWindow):
@@ -133,8 +134,7 @@ class MenuSistemasWindow(QMainWindow):
 
     def _open_gauss(self):
         try:
-            from .sistemas.gauss_jordan_qt import GaussJordanWindow
-            w = GaussJordanWindow(parent=self)
+            w = crear_ventana("gauss_jordan", parent=self)
             w.showMaximized()
             self._child = w
         except Exception as exc:
@@ -142,8 +142,7 @@ class MenuSistemasWindow(QMainWindow):
 
     def _open_cramer(self):
         try:
-            from .sistemas.cramer_qt import CramerWindow
-            w = CramerWindow(parent=self)
+            w = crear_ventana("cramer", parent=self)
             w.showMaximized()
             self._child = w
         except Exception as exc:
@@ -151,8 +150,7 @@ class MenuSistemasWindow(QMainWindow):
 
     def _open_gauss_simple(self):
         try:
-            from .sistemas.gauss_qt import GaussWindow
-            w = GaussWindow(parent=self)
+            w = crear_ventana("gauss", parent=self)
             w.showMaximized()
             self._child = w
         except Exception as exc:
@@ -160,8 +158,7 @@ class MenuSistemasWindow(QMainWindow):
 
     def _open_leontief(self):
         try:
-            from .sistemas.leontief_qt import LeontiefWindow
-            w = LeontiefWindow(parent=self)
+            w = crear_ventana("leontief", parent=self)
             w.showMaximized()
             self._child = w
         except Exception as exc:
@@ -0,0 +1,200 @@
+"""Diferenciación automática en modo directo (números duales) para f(x).
+
+Un `Dual(v, d)` representa v + d·ε con ε² = 0: al evaluar f sobre
+`Dual(x, 1)` se obtiene f(x) en la parte real y f'(x) exacta en la dual.
+`DUAL_NAMES` replica el vocabulario de funciones de `biseccion_qt._ALLOWED_NAMES`
+con versiones que propagan la derivada.
+"""
+
+import math
+
+
+class Dual:
+    __slots__ = ("real", "dual")
+
+    def __init__(self, real: float, dual: float = 0.0):
+        self.real = real
+        self.dual = dual
+
+    def __repr__(self) -> str:
+        return f"Dual({self.real!r}, {self.dual!r})"
+
+    # Aritmética
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real + other.real, self.dual + other.dual)
+        return Dual(self.real + other, self.dual)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real - other.real, self.dual - other.dual)
+        return Dual(self.real - other, self.dual)
+
+    def __rsub__(self, other):
+        return Dual(other - self.real, -self.dual)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real * other.real, self.real * other.dual + self.dual * other.real)
+        return Dual(self.real * other, self.dual * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            value = self.real / other.real
+            return Dual(value, (self.dual - value * other.dual) / other.real)
+        return Dual(self.real / other, self.dual / other)
+
+    def __rtruediv__(self, other):
+        value = other / self.real
+        return Dual(value, -value * self.dual / self.real)
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            value = self.real ** other.real
+            return Dual(
+                value,
+                value * (other.dual * math.log(self.real) + other.real * self.dual / self.real),
+            )
+        if other == 0:
+            return Dual(1.0, 0.0)
+        return Dual(self.real ** other, other * self.real ** (other - 1) * self.dual)
+
+    def __rpow__(self, other):
+        value = other ** self.real
+        if other == 0:
+            return Dual(value, 0.0)
+        return Dual(value, value * math.log(other) * self.dual)
+
+    def __neg__(self):
+        return Dual(-self.real, -self.dual)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        if self.real < 0:
+            return -self
+        if self.real > 0:
+            return self
+        # |x| no es derivable en 0; se usa el subgradiente 0
+        return Dual(abs(self.real), 0.0)
+
+    # Comparaciones sobre la parte real
+    def __eq__(self, other):
+        return self.real == (other.real if isinstance(other, Dual) else other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self.real < (other.real if isinstance(other, Dual) else other)
+
+    def __le__(self, other):
+        return self.real <= (other.real if isinstance(other, Dual) else other)
+
+    def __gt__(self, other):
+        return self.real > (other.real if isinstance(other, Dual) else other)
+
+    def __ge__(self, other):
+        return self.real >= (other.real if isinstance(other, Dual) else other)
+
+    __hash__ = None
+
+
+def _lift(fn, dfn):
+    """Convierte f de un argumento en su versión dual usando la derivada `dfn`."""
+
+    def _wrapped(u):
+        if isinstance(u, Dual):
+            return Dual(fn(u.real), dfn(u.real) * u.dual)
+        return fn(u)
+
+    return _wrapped
+
+
+def _log(u, base=None):
+    if base is None:
+        return _ln(u)
+    return _ln(u) / _ln(base)
+
+
+def _pow(u, v):
+    return u ** v
+
+
+def _atan2(y, x):
+    if not isinstance(y, Dual) and not isinstance(x, Dual):
+        return math.atan2(y, x)
+    y = y if isinstance(y, Dual) else Dual(y)
+    x = x if isinstance(x, Dual) else Dual(x)
+    den = x.real * x.real + y.real * y.real
+    return Dual(math.atan2(y.real, x.real), (x.real * y.dual - y.real * x.dual) / den)
+
+
+def _hypot(*args):
+    if not any(isinstance(a, Dual) for a in args):
+        return math.hypot(*args)
+    reals = [a.real if isinstance(a, Dual) else a for a in args]
+    value = math.hypot(*reals)
+    dual = sum((a.real * a.dual for a in args if isinstance(a, Dual)), 0.0) / value
+    return Dual(value, dual)
+
+
+_ln = _lift(math.log, lambda x: 1.0 / x)
+_sin = _lift(math.sin, math.cos)
+_cos = _lift(math.cos, lambda x: -math.sin(x))
+_tan = _lift(math.tan, lambda x: 1.0 / math.cos(x) ** 2)
+_asin = _lift(math.asin, lambda x: 1.0 / math.sqrt(1.0 - x * x))
+_atan = _lift(math.atan, lambda x: 1.0 / (1.0 + x * x))
+_sqrt = _lift(math.sqrt, lambda x: 0.5 / math.sqrt(x))
+
+DUAL_NAMES = {
+    "sin": _sin,
+    "cos": _cos,
+    "tan": _tan,
+    "asin": _asin,
+    "acos": _lift(math.acos, lambda x: -1.0 / math.sqrt(1.0 - x * x)),
+    "atan": _atan,
+    "atan2": _atan2,
+    "sinh": _lift(math.sinh, math.cosh),
+    "cosh": _lift(math.cosh, math.sinh),
+    "tanh": _lift(math.tanh, lambda x: 1.0 - math.tanh(x) ** 2),
+    "asinh": _lift(math.asinh, lambda x: 1.0 / math.sqrt(x * x + 1.0)),
+    "acosh": _lift(math.acosh, lambda x: 1.0 / math.sqrt(x * x - 1.0)),
+    "atanh": _lift(math.atanh, lambda x: 1.0 / (1.0 - x * x)),
+    "exp": _lift(math.exp, math.exp),
+    "expm1": _lift(math.expm1, math.exp),
+    "log": _log,
+    "log10": _lift(math.log10, lambda x: 1.0 / (x * math.log(10.0))),
+    "log2": _lift(math.log2, lambda x: 1.0 / (x * math.log(2.0))),
+    "log1p": _lift(math.log1p, lambda x: 1.0 / (1.0 + x)),
+    "sqrt": _sqrt,
+    "fabs": (lambda u: abs(u) if isinstance(u, Dual) else math.fabs(u)),
+    "abs": abs,
+    "pow": _pow,
+    "hypot": _hypot,
+    "degrees": _lift(math.degrees, lambda _x: 180.0 / math.pi),
+    "radians": _lift(math.radians, lambda _x: math.pi / 180.0),
+    # Alias del vocabulario de la aplicación
+    "ln": _ln,
+    "sen": _sin,
+    "tg": _tan,
+    "ctg": (lambda u: 1.0 / _tan(u)),
+    "cosec": (lambda u: 1.0 / _sin(u)),
+    "csc": (lambda u: 1.0 / _sin(u)),
+    "sec": (lambda u: 1.0 / _cos(u)),
+    "arcsen": _asin,
+    "asen": _asin,
+    "arctg": _atan,
+    "atg": _atan,
+    "raiz": _sqrt,
+}
+if hasattr(math, "cbrt"):
+    DUAL_NAMES["cbrt"] = _lift(math.cbrt, lambda x: 1.0 / (3.0 * math.cbrt(x) ** 2))
+
+# Constantes que pueden aparecer en f(x) sin afectar la derivada
+DUAL_CONSTANTS = {"pi", "e", "tau", "inf", "nan"}
@@ -2,7 +2,9 @@
 from math import isfinite
 import re
 import math
-from dataclasses import dataclass
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from typing import Callable, List, Tuple
 
 from PySide6.QtWidgets import (
@@ -19,8 +21,7 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QGridLayout,
     QMessageBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QSpinBox,
     QSizePolicy,
     QHeaderView,
@@ -31,7 +32,7 @@ from PySide6.QtWidgets import (
     QStyle,
     QListWidget,
 )
-from PySide6.QtCore import Qt, QObject, QEvent
+from PySide6.QtCore import Qt, QObject, QEvent, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFontMetrics
 
 from ..theme import (
@@ -45,7 +46,9 @@ from ..theme import (
     theme_changed_signal,
 )
 from ..settings_qt import open_settings_dialog
+from ..precarga import tomar_grafica
 from ..text_utils import superscriptify
+from .autodiff import Dual, DUAL_NAMES, DUAL_CONSTANTS
 
 # Import plotting libraries when needed. We'll import lazily inside the plotting method
 
@@ -690,7 +693,8 @@ def _looks_like_scientific(expr: str, e_idx: int) -> bool:
         return False
     return True
 
-def _compile_function(expr: str) -> Callable[[float], float]:
+def _prepare_expression(expr: str) -> str:
+    """Normaliza f(x) y convierte igualdades `izq = der` en `(izq) - (der)`."""
     cleaned = (expr or "").strip()
     if not cleaned:
         raise ValueError("Ingrese una función f(x).")
@@ -703,6 +707,11 @@ def _compile_function(expr: str) -> Callable[[float], float]:
         if not left or not right:
             raise ValueError("Completa ambos lados de la igualdad, por ejemplo: cos(x) - x = 0.")
         cleaned = f"({left}) - ({right})"
+    return cleaned
+
+
+def _compile_function(expr: str) -> Callable[[float], float]:
+    cleaned = _prepare_expression(expr)
     try:
         code = compile(cleaned, "<función>", "eval")
     except Exception as exc:
@@ -724,7 +733,267 @@ def _compile_function(expr: str) -> Callable[[float], float]:
     return _fn
 
 
-@dataclass
+def _compile_derivative(expr: str) -> Callable[[float], Tuple[float, float]] | None:
+    """Compila f(x) para obtener f(x) y f'(x) exacta en una sola evaluación.
+
+    Usa diferenciación automática (números duales). Devuelve None si la
+    expresión usa funciones sin versión dual (p. ej. factorial o gamma); en ese
+    caso hay que recurrir a una derivada numérica.
+    """
+    try:
+        code = compile(_prepare_expression(expr), "<función>", "eval")
+    except Exception:
+        return None
+    if any(name != "x" and name not in DUAL_NAMES and name not in DUAL_CONSTANTS for name in code.co_names):
+        return None
+    names = dict(_ALLOWED_NAMES)
+    names.update(DUAL_NAMES)
+
+    def _fdf(x: float) -> Tuple[float, float]:
+        local = dict(names)
+        local["x"] = Dual(x, 1.0)
+        value = eval(code, {"__builtins__": {}}, local)
+        if isinstance(value, Dual):
+            return float(value.real), float(value.dual)
+        return float(value), 0.0
+
+    return _fdf
+
+
+def _vector_names(np) -> dict:
+    """Vocabulario de `_ALLOWED_NAMES` con equivalentes de NumPy que aceptan arreglos.
+
+    Los nombres sin equivalente conservan la versión de `math`; si la expresión
+    los usa, la evaluación vectorizada falla y se vuelve al camino escalar.
+    """
+    names = dict(_ALLOWED_NAMES)
+
+    def _log(x, base=None):
+        if base is None:
+            return np.log(x)
+        return np.log(x) / np.log(base)
+
+    names.update(
+        {
+            "sin": np.sin, "cos": np.cos, "tan": np.tan,
+            "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan, "atan2": np.arctan2,
+            "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+            "asinh": np.arcsinh, "acosh": np.arccosh, "atanh": np.arctanh,
+            "exp": np.exp, "expm1": np.expm1, "exp2": np.exp2,
+            "log": _log, "ln": np.log, "log10": np.log10, "log2": np.log2, "log1p": np.log1p,
+            "sqrt": np.sqrt, "raiz": np.sqrt, "cbrt": np.cbrt,
+            "fabs": np.fabs, "abs": np.abs, "pow": np.power,
+            "floor": np.floor, "ceil": np.ceil, "trunc": np.trunc,
+            "hypot": np.hypot, "copysign": np.copysign,
+            "degrees": np.degrees, "radians": np.radians,
+            "sen": np.sin, "tg": np.tan,
+            "ctg": (lambda x: 1.0 / np.tan(x)),
+            "cosec": (lambda x: 1.0 / np.sin(x)),
+            "csc": (lambda x: 1.0 / np.sin(x)),
+            "sec": (lambda x: 1.0 / np.cos(x)),
+            "arcsen": np.arcsin, "asen": np.arcsin,
+            "arctg": np.arctan, "atg": np.arctan,
+        }
+    )
+    return names
+
+
+def _compile_vectorized_function(expr: str) -> Callable[[List[float]], List[float]] | None:
+    """Compila f(x) para evaluarla sobre varios puntos en una sola llamada.
+
+    Devuelve None si NumPy no está disponible o la expresión no compila; en ese
+    caso los solucionadores por lotes evalúan punto a punto con `_compile_function`.
+    """
+    try:
+        import numpy as np
+    except Exception:
+        return None
+    try:
+        code = compile(_prepare_expression(expr), "<función>", "eval")
+    except Exception:
+        return None
+    names = _vector_names(np)
+
+    def _vfn(xs: List[float]) -> List[float]:
+        arr = np.asarray(xs, dtype=float)
+        local = dict(names)
+        local["x"] = arr
+        with np.errstate(all="ignore"):
+            value = eval(code, {"__builtins__": {}}, local)
+            out = np.broadcast_to(np.asarray(value, dtype=float), arr.shape)
+        return out.tolist()
+
+    return _vfn
+
+
+def _evaluate_many(
+    func: Callable[[float], float],
+    xs: List[float],
+    vfunc: Callable[[List[float]], List[float]] | None = None,
+) -> List[object]:
+    """Evalúa f en todos los puntos de `xs` con una sola llamada vectorizada.
+
+    Cada posición del resultado es el valor de f o la excepción que produjo ese
+    punto. Los valores no finitos del camino vectorizado se recalculan con `func`
+    para conservar los mismos errores que la evaluación escalar (p. ej. log(0)).
+    """
+    values = None
+    if vfunc is not None and xs:
+        try:
+            values = vfunc(xs)
+        except Exception:
+            values = None
+    out: List[object] = []
+    for idx, x in enumerate(xs):
+        if values is not None and isfinite(values[idx]):
+            out.append(values[idx])
+            continue
+        try:
+            out.append(func(x))
+        except Exception as exc:
+            out.append(exc)
+    return out
+
+
+class EvaluationLedger:
+    """Registro de evaluaciones de f(x) para un solo cálculo de raíz.
+
+    Se usa como la propia función: `ledger(x)`. Guarda los últimos `size`
+    valores con clave exacta (mismo x, incluido el signo de cero), de modo que
+    un punto repetido no vuelve a evaluarse, y cuenta cuántas evaluaciones
+    reales (`evaluations`) y reutilizaciones (`hits`) hubo.
+    """
+
+    def __init__(self, func: Callable[[float], float], size: int = 8):
+        self.func = func
+        self.size = max(1, int(size))
+        self.evaluations = 0
+        self.hits = 0
+        self._cache: "OrderedDict[Tuple[float, float], float]" = OrderedDict()
+
+    def __call__(self, x: float) -> float:
+        key = (x, math.copysign(1.0, x))
+        cache = self._cache
+        if key in cache:
+            self.hits += 1
+            cache.move_to_end(key)
+            return cache[key]
+        value = self.func(x)
+        self.evaluations += 1
+        cache[key] = value
+        if len(cache) > self.size:
+            cache.popitem(last=False)
+        return value
+
+    @classmethod
+    def wrap(cls, func: Callable[[float], float]) -> "EvaluationLedger":
+        """Devuelve `func` si ya es un registro; si no, lo envuelve en uno nuevo."""
+        return func if isinstance(func, cls) else cls(func)
+
+
+# Filas reservadas de entrada en cada traza; más allá crece bajo demanda
+_TRACE_PREALLOC = 256
+
+
+class IterationTrace:
+    """Tabla de iteraciones guardada por columnas (`array('d')`, una por campo).
+
+    `step_cls` es el dataclass que describe una fila: define el orden de las
+    columnas y es la vista que devuelven `trace[i]` e `iter(trace)`, de modo
+    que `pasos[0].a` o `for paso in pasos` siguen funcionando. Las tablas y
+    gráficas pueden leer una columna completa con `column(nombre)`.
+    """
+
+    __slots__ = ("step_cls", "names", "_columns", "_size")
+
+    def __init__(self, step_cls, capacity: int = 0):
+        self.step_cls = step_cls
+        self.names = tuple(f.name for f in fields(step_cls))
+        rows = max(0, min(int(capacity), _TRACE_PREALLOC))
+        self._columns = tuple(
+            array("q" if name == "iteration" else "d", [0]) * rows for name in self.names
+        )
+        self._size = 0
+
+    def append(self, *values) -> None:
+        n = self._size
+        for col, value in zip(self._columns, values):
+            if n < len(col):
+                col[n] = value
+            else:
+                col.append(value)
+        self._size = n + 1
+
+    def finish(self) -> "IterationTrace":
+        """Libera las filas reservadas que no se usaron."""
+        for col in self._columns:
+            del col[self._size:]
+        return self
+
+    def column(self, name: str) -> array:
+        """Copia de la columna `name` con una entrada por iteración."""
+        return self._columns[self.names.index(name)][: self._size]
+
+    def _row(self, i: int):
+        return self.step_cls(*(col[i] for col in self._columns))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self._row(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("índice de iteración fuera de rango")
+        return self._row(index)
+
+
+class IterationTableModel(QAbstractTableModel):
+    """Modelo de solo lectura sobre una `IterationTrace`.
+
+    Las celdas se formatean al pintarse (`data`), así que una traza larga no
+    crea ningún objeto por celda y el mismo modelo sirve para la tabla de la
+    tarjeta y para la ventana ampliada.
+    """
+
+    def __init__(self, trace: "IterationTrace", columns, parent=None):
+        super().__init__(parent)
+        self._headers = [header for header, _name in columns]
+        # Referencias a las columnas de la traza, sin copiarlas
+        self._columns = [trace._columns[trace.names.index(name)] for _header, name in columns]
+        self._rows = len(trace)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self._columns[index.column()][index.row()]
+            if isinstance(value, int):
+                return str(value)
+            return _format_number(value)
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+
+@dataclass(slots=True)
 class BisectionStep:
     iteration: int
     a: float
@@ -741,24 +1010,23 @@ def _run_bisection(
     b: float,
     tol: float,
     max_iterations: int = 1000,
-) -> Tuple[List[BisectionStep], float, float, int]:
+) -> Tuple[IterationTrace, float, float, int]:
     fa = func(a)
     fb = func(b)
     if not (fa * fb < 0):
         raise ValueError("El intervalo inicial debe contener la raíz (f(a) * f(b) < 0).")
 
-    steps: List[BisectionStep] = []
+    steps = IterationTrace(BisectionStep, max_iterations)
     iteration = 0
 
     while iteration < max_iterations:
         iteration += 1
         c = (a + b) / 2.0
         fc = func(c)
-        step = BisectionStep(iteration, a, b, c, fa, fb, fc)
-        steps.append(step)
+        steps.append(iteration, a, b, c, fa, fb, fc)
 
         if abs(fc) < tol:
-            return steps, c, fc, iteration
+            return steps.finish(), c, fc, iteration
 
         if fa * fc < 0:
             b = c
@@ -770,6 +1038,93 @@ def _run_bisection(
     raise ValueError("El método excedió el máximo de iteraciones permitidas.")
 
 
+def _run_bracketed_batch(
+    func: Callable[[float], float],
+    intervals: List[Tuple[float, float]],
+    tol: float,
+    next_point: Callable[[float, float, float, float], float],
+    step_cls=BisectionStep,
+    max_iterations: int = 1000,
+    vfunc: Callable[[List[float]], List[float]] | None = None,
+) -> List[object]:
+    """Avanza todos los intervalos a la vez con una evaluación de f por iteración.
+
+    `next_point(a, b, fa, fb)` elige el punto interior (punto medio, regla falsa...)
+    y `step_cls` el tipo de fila de cada `IterationTrace`.
+    Cada intervalo sale del lote al converger. El resultado conserva el orden de
+    `intervals`: una tupla (pasos, raíz, f(raíz), iteraciones) igual a la de
+    `_run_bisection` o la excepción que habría lanzado la versión escalar.
+    """
+    results: List[object] = [None] * len(intervals)
+    ends = _evaluate_many(func, [x for ab in intervals for x in ab], vfunc)
+    active = {}
+    for i, (a, b) in enumerate(intervals):
+        fa, fb = ends[2 * i], ends[2 * i + 1]
+        if isinstance(fa, Exception):
+            results[i] = fa
+        elif isinstance(fb, Exception):
+            results[i] = fb
+        elif not (fa * fb < 0):
+            results[i] = ValueError("El intervalo inicial debe contener la raíz (f(a) * f(b) < 0).")
+        else:
+            active[i] = [a, b, fa, fb, IterationTrace(step_cls, max_iterations)]
+
+    iteration = 0
+    while active and iteration < max_iterations:
+        iteration += 1
+        idxs = []
+        cs = []
+        for i, (a, b, fa, fb, _steps) in active.items():
+            try:
+                cs.append(next_point(a, b, fa, fb))
+                idxs.append(i)
+            except Exception as exc:
+                results[i] = exc
+        for i in list(active):
+            if results[i] is not None:
+                del active[i]
+        fcs = _evaluate_many(func, cs, vfunc)
+        for i, c, fc in zip(idxs, cs, fcs):
+            state = active[i]
+            if isinstance(fc, Exception):
+                results[i] = fc
+                del active[i]
+                continue
+            a, b, fa, fb, steps = state
+            steps.append(iteration, a, b, c, fa, fb, fc)
+            if abs(fc) < tol:
+                results[i] = (steps.finish(), c, fc, iteration)
+                del active[i]
+                continue
+            if fa * fc < 0:
+                state[1], state[3] = c, fc
+            else:
+                state[0], state[2] = c, fc
+
+    for i in active:
+        results[i] = ValueError("El método excedió el máximo de iteraciones permitidas.")
+    return results
+
+
+def _run_bisection_batch(
+    func: Callable[[float], float],
+    intervals: List[Tuple[float, float]],
+    tol: float,
+    max_iterations: int = 1000,
+    vfunc: Callable[[List[float]], List[float]] | None = None,
+) -> List[object]:
+    """Bisección sobre varios intervalos en paralelo (ver `_run_bracketed_batch`)."""
+    return _run_bracketed_batch(
+        func,
+        intervals,
+        tol,
+        lambda a, b, _fa, _fb: (a + b) / 2.0,
+        BisectionStep,
+        max_iterations,
+        vfunc,
+    )
+
+
 def _detect_sign_change_intervals(
     func: Callable[[float], float],
     start: float = -10.0,
@@ -1748,6 +2103,11 @@ class MetodoBiseccionWindow(QMainWindow):
             except Exception:
                 approx1_value = None
 
+        # Reunir los intervalos a resolver y calcularlos todos en un solo lote:
+        # (a, b, aproximado, mensaje de error)
+        jobs = []
+        auto_detected = False
+
         # Procesar primera raíz (permite detección automática si no hay [a,b])
         if a1_txt and b1_txt:
             try:
@@ -1756,12 +2116,7 @@ class MetodoBiseccionWindow(QMainWindow):
             except Exception as exc:
                 QMessageBox.warning(self, "Aviso", f"Intervalo inválido (primera raíz): {exc}")
                 return
-            try:
-                pasos, raiz, fc, iteraciones = _run_bisection(func, a1, b1, tol)
-                resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, approx1_value))
-                display_idx += 1
-            except Exception as exc:
-                QMessageBox.warning(self, "Aviso", f"No se pudo calcular la raíz (intervalo [{a1}, {b1}]): {exc}")
+            jobs.append((a1, b1, approx1_value, f"No se pudo calcular la raíz (intervalo [{a1}, {b1}])"))
         else:
             # Detección automática para la primera raíz si no hay intervalo
             dlg = IntervalsDialog(self, func, start=-10.0, end=10.0, step=0.5)
@@ -1787,19 +2142,9 @@ class MetodoBiseccionWindow(QMainWindow):
                                 pass
             except Exception:
                 pass
-            any_success = False
             for a, b in intervals:
-                try:
-                    pasos, raiz, fc, iteraciones = _run_bisection(func, a, b, tol)
-                    resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, approx1_value))
-                    display_idx += 1
-                    any_success = True
-                except Exception as exc:
-                    QMessageBox.warning(self, "Aviso", f"Bisección en [{a}, {b}] falló: {exc}")
-                    continue
-            if not any_success:
-                QMessageBox.warning(self, "Aviso", "No se encontraron ra??ces en los intervalos detectados.")
-                return
+                jobs.append((a, b, approx1_value, f"Bisección en [{a}, {b}] falló"))
+            auto_detected = True
             skip_additional = True
 
         # Procesar ra??ces adicionales: solo requieren intervalos, reutilizan expr1 y tol
@@ -1816,13 +2161,22 @@ class MetodoBiseccionWindow(QMainWindow):
                 except Exception as exc:
                     QMessageBox.warning(self, "Aviso", f"Intervalo involido en la ra??z #{card_idx}: {exc}")
                     continue
-                try:
-                    pasos, raiz, fc, iteraciones = _run_bisection(func, a, b, tol)
-                    resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, None))
-                    display_idx += 1
-                except Exception as exc:
-                    QMessageBox.warning(self, "Aviso", f"No se pudo calcular la ra??z #{card_idx} (intervalo [{a}, {b}]): {exc}")
-                    continue
+                jobs.append((a, b, None, f"No se pudo calcular la ra??z #{card_idx} (intervalo [{a}, {b}])"))
+
+        batch = self._solve_batch(expr1, func, [(a, b) for a, b, _ap, _msg in jobs], tol)
+        any_success = False
+        for (_a, _b, approx_value, fail_msg), outcome in zip(jobs, batch):
+            if isinstance(outcome, Exception):
+                QMessageBox.warning(self, "Aviso", f"{fail_msg}: {outcome}")
+                continue
+            pasos, raiz, fc, iteraciones = outcome
+            resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, approx_value))
+            display_idx += 1
+            any_success = True
+        if auto_detected and not any_success:
+            QMessageBox.warning(self, "Aviso", "No se encontraron ra??ces en los intervalos detectados.")
+            return
+
         # Quitar duplicados por valor de raíz
         _unique_res = []
         _seen_keys = set()
@@ -1844,6 +2198,14 @@ class MetodoBiseccionWindow(QMainWindow):
         self._render_resultados(resultados)
         self._draw_results_on_canvas(resultados)
 
+    def _evaluation_count(self, pasos, iteraciones: int) -> int:
+        """Los métodos de intervalo evalúan f en a, en b y una vez por iteración."""
+        return iteraciones + 2
+
+    def _solve_batch(self, expr: str, func, intervals, tol):
+        """Resuelve todos los intervalos en lote; las subclases cambian el método."""
+        return _run_bisection_batch(func, intervals, tol, vfunc=_compile_vectorized_function(expr))
+
     def _filter_results_by_sign(self, resultados):
         if not resultados:
             return resultados
@@ -1867,47 +2229,43 @@ class MetodoBiseccionWindow(QMainWindow):
                 filtrados.append(item)
         return filtrados
 
-    def _create_table_widget(self, pasos: List[BisectionStep]) -> QTableWidget:
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels(
-            ["Iteración", "a", "b", "c", "f(a)", "f(b)", "f(c)"]
-        )
-        table.setRowCount(len(pasos))
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
-        table.setSelectionMode(QTableWidget.NoSelection)
+    # (encabezado, columna de la traza) de la tabla de iteraciones
+    _TABLE_COLUMNS = [
+        ("Iteración", "iteration"),
+        ("a", "a"),
+        ("b", "b"),
+        ("c", "c"),
+        ("f(a)", "fa"),
+        ("f(b)", "fb"),
+        ("f(c)", "fc"),
+    ]
+
+    def _create_table_model(self, pasos: IterationTrace, parent=None) -> IterationTableModel:
+        return IterationTableModel(pasos, self._TABLE_COLUMNS, parent)
+
+    def _create_table_widget(self, model: IterationTableModel) -> QTableView:
+        table = QTableView()
+        table.setModel(model)
+        table.setEditTriggers(QTableView.NoEditTriggers)
+        table.setSelectionMode(QTableView.NoSelection)
         table.verticalHeader().setVisible(False)
         table.setAlternatingRowColors(True)
         table.setObjectName("ResultsTable")
         table.setMinimumHeight(320)
         table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-        for row, paso in enumerate(pasos):
-            values = [
-                str(paso.iteration),
-                _format_number(paso.a),
-                _format_number(paso.b),
-                _format_number(paso.c),
-                _format_number(paso.fa),
-                _format_number(paso.fb),
-                _format_number(paso.fc),
-            ]
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                item.setTextAlignment(Qt.AlignCenter)
-                table.setItem(row, col, item)
-
         header = table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         return table
 
-    def _open_table_dialog(self, title: str, pasos: List[BisectionStep]) -> None:
+    def _open_table_dialog(self, title: str, model: IterationTableModel) -> None:
         dialog = QDialog(self)
         dialog.setWindowTitle(title)
         dialog.resize(960, 600)
         dialog_layout = QVBoxLayout(dialog)
-        dialog_table = self._create_table_widget(pasos)
+        dialog_table = self._create_table_widget(model)
         dialog_table.setMinimumHeight(0)
+        self._style_table_for_theme(dialog_table, current_mode(QApplication.instance()))
         dialog_layout.addWidget(dialog_table, 1)
         buttons = QDialogButtonBox(QDialogButtonBox.Close)
         buttons.rejected.connect(dialog.reject)
@@ -1969,6 +2327,8 @@ class MetodoBiseccionWindow(QMainWindow):
             layout = QVBoxLayout(card)
             layout.setContentsMargins(28, 24, 28, 24)
             layout.setSpacing(18)
+            # La tabla de la tarjeta y la ventana ampliada comparten el modelo
+            model = self._create_table_model(pasos, card)
 
             # Mostrar la función con potencias en superíndice para mejor lectura
             title = QLabel(f"Raíz #{idx} - f(x) = {superscriptify(expr)}")
@@ -1990,7 +2350,7 @@ class MetodoBiseccionWindow(QMainWindow):
             except Exception:
                 expand_btn.setText("↗")
             expand_btn.clicked.connect(
-                lambda _checked=False, t=lambda: title.text(), ps=pasos: self._open_table_dialog(t(), ps)
+                lambda _checked=False, t=lambda: title.text(), m=model: self._open_table_dialog(t(), m)
             )
             # quitar el título agregado y reemplazar por la fila con icono
             try:
@@ -2009,6 +2369,7 @@ class MetodoBiseccionWindow(QMainWindow):
                 f"El método converge con {iteraciones} iteraciones.",
                 f"La raíz es: {raiz_txt}.",
                 f"El margen de error es: {error_txt}.",
+                f"Evaluaciones de f(x): {self._evaluation_count(pasos, iteraciones)}.",
             ]
             # Agregar intervalo utilizado si está disponible en los pasos
             try:
@@ -2031,7 +2392,7 @@ class MetodoBiseccionWindow(QMainWindow):
             bind_font_scale_stylesheet(summary, summary_tpl, body=18)
             layout.addWidget(summary)
 
-            table = self._create_table_widget(pasos)
+            table = self._create_table_widget(model)
             self._style_table_for_theme(table, mode)
             layout.addWidget(table)
 
@@ -2044,11 +2405,11 @@ class MetodoBiseccionWindow(QMainWindow):
         self.results_layout.addWidget(spacer)
 
 
-    def _style_table_for_theme(self, table: QTableWidget, mode: str):
+    def _style_table_for_theme(self, table: QTableView, mode: str):
         if mode == "dark":
             table.setStyleSheet(
                 """
-                QTableWidget {
+                QTableView {
                     background: #1f1b24;
                     alternate-background-color: #241f2a;
                     color: #f7f4f1;
@@ -2061,7 +2422,7 @@ class MetodoBiseccionWindow(QMainWindow):
                     border: 1px solid #3d3242;
                     padding: 6px;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background: #b07a8c;
                     color: #ffffff;
                 }
@@ -2124,7 +2485,7 @@ class MetodoBiseccionWindow(QMainWindow):
                 for lbl in w.findChildren(QLabel):
                     if lbl.objectName() == "ResultSummary":
                         bind_font_scale_stylesheet(lbl, summary_tpl, body=18)
-                for table in w.findChildren(QTableWidget):
+                for table in w.findChildren(QTableView):
                     self._style_table_for_theme(table, mode)
             elif isinstance(w, QLabel) and w.objectName() == "ResultsPlaceholder":
                 bind_font_scale_stylesheet(w, placeholder_tpl, body=16)
@@ -2286,8 +2647,12 @@ class MetodoBiseccionWindow(QMainWindow):
         self._mpl_ready = True
         self._mpl = {}
         self._mpl['plt'] = plt
-        self._mpl['fig'], self._mpl['ax'] = plt.subplots(figsize=(8, 4))
-        self._mpl['canvas'] = FigureCanvas(self._mpl['fig'])
+        plantilla = tomar_grafica()
+        if plantilla is not None:
+            self._mpl['fig'], self._mpl['ax'], self._mpl['canvas'] = plantilla
+        else:
+            self._mpl['fig'], self._mpl['ax'] = plt.subplots(figsize=(8, 4))
+            self._mpl['canvas'] = FigureCanvas(self._mpl['fig'])
         self._mpl['toolbar'] = NavigationToolbar(self._mpl['canvas'], self)
         self._mpl['ax'].grid(True, linestyle='--', alpha=0.3)
         self._mpl['ax'].set_title("f(x)")
@@ -0,0 +1,118 @@
+import sys
+from dataclasses import dataclass
+from typing import Callable, Tuple
+
+from PySide6.QtWidgets import QLabel
+
+from . import biseccion_qt as bq
+from .falsa_posicion_qt import MetodoFalsaPosicionWindow
+
+
+@dataclass(slots=True)
+class BrentStep:
+    iteration: int
+    a: float
+    b: float
+    c: float
+    fa: float
+    fb: float
+    fc: float
+
+
+def _run_brent(
+    func: Callable[[float], float],
+    a: float,
+    b: float,
+    tol: float,
+    max_iterations: int = 1000,
+) -> Tuple[bq.IterationTrace, float, float, int]:
+    """Método de Brent: interpolación cuadrática inversa o secante con respaldo de bisección.
+
+    Cada iteración evalúa f una sola vez. En la tabla, a y b son los extremos
+    del intervalo vigente (ordenados) y c el nuevo punto evaluado.
+    """
+    fa = func(a)
+    fb = func(b)
+    if not (fa * fb < 0):
+        raise ValueError("El intervalo inicial debe contener la raíz (f(a) * f(b) < 0).")
+
+    # b es la mejor aproximación y a el extremo opuesto del intervalo
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc = a, fa
+    d = c
+    bisected = True
+    steps = bq.IterationTrace(BrentStep, max_iterations)
+    iteration = 0
+
+    while iteration < max_iterations:
+        iteration += 1
+        if fa != fc and fb != fc:
+            # Interpolación cuadrática inversa
+            s = (
+                a * fb * fc / ((fa - fb) * (fa - fc))
+                + b * fa * fc / ((fb - fa) * (fb - fc))
+                + c * fa * fb / ((fc - fa) * (fc - fb))
+            )
+        else:
+            # Secante
+            s = b - fb * (b - a) / (fb - fa)
+
+        delta = 2.0 * sys.float_info.epsilon * max(1.0, abs(b))
+        lo, hi = sorted(((3.0 * a + b) / 4.0, b))
+        if (
+            not (lo < s < hi)
+            or (bisected and abs(s - b) >= abs(b - c) / 2.0)
+            or (not bisected and abs(s - b) >= abs(c - d) / 2.0)
+            or (bisected and abs(b - c) < delta)
+            or (not bisected and abs(c - d) < delta)
+        ):
+            s = (a + b) / 2.0
+            bisected = True
+        else:
+            bisected = False
+
+        fs = func(s)
+        if a < b:
+            steps.append(iteration, a, b, s, fa, fb, fs)
+        else:
+            steps.append(iteration, b, a, s, fb, fa, fs)
+
+        if abs(fs) < tol:
+            return steps.finish(), s, fs, iteration
+
+        d = c
+        c, fc = b, fb
+        if fa * fs < 0:
+            b, fb = s, fs
+        else:
+            a, fa = s, fs
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+
+    raise ValueError("El método excedió el máximo de iteraciones permitidas.")
+
+
+class MetodoBrentWindow(MetodoFalsaPosicionWindow):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Método de Brent")
+        try:
+            for lbl in self.findChildren(QLabel):
+                if (lbl.text() or "").strip() == "Método de Falsa Posición":
+                    lbl.setText("Método de Brent")
+        except Exception:
+            pass
+        try:
+            self.btn_calcular.setText("Calcular Brent")
+        except Exception:
+            pass
+
+    def _solve_batch(self, expr: str, func, intervals, tol):
+        outcomes = []
+        for a, b in intervals:
+            try:
+                outcomes.append(_run_brent(func, a, b, tol))
+            except Exception as exc:
+                outcomes.append(exc)
+        return outcomes
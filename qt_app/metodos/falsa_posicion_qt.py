@@ -7,7 +7,7 @@ from PySide6.QtWidgets import QLabel, QMessageBox, QMainWindow, QDialog
 from . import biseccion_qt as bq
 
 
-@dataclass
+@dataclass(slots=True)
 class FalsePositionStep:
     iteration: int
     a: float
@@ -24,13 +24,13 @@ def _run_false_position(
     b: float,
     tol: float,
     max_iterations: int = 1000,
-) -> Tuple[List[FalsePositionStep], float, float, int]:
+) -> Tuple[bq.IterationTrace, float, float, int]:
     fa = func(a)
     fb = func(b)
     if not (fa * fb < 0):
         raise ValueError("El intervalo inicial debe contener la raíz (f(a) * f(b) < 0).")
 
-    steps: List[FalsePositionStep] = []
+    steps = bq.IterationTrace(FalsePositionStep, max_iterations)
     iteration = 0
 
     while iteration < max_iterations:
@@ -38,10 +38,10 @@ def _run_false_position(
         # c = b - f(b) * (b - a) / (f(b) - f(a))
         c = b - fb * (b - a) / (fb - fa)
         fc = func(c)
-        steps.append(FalsePositionStep(iteration, a, b, c, fa, fb, fc))
+        steps.append(iteration, a, b, c, fa, fb, fc)
 
         if abs(fc) < tol:
-            return steps, c, fc, iteration
+            return steps.finish(), c, fc, iteration
 
         if fa * fc < 0:
             b = c
@@ -53,6 +53,25 @@ def _run_false_position(
     raise ValueError("El método excedió el máximo de iteraciones permitidas.")
 
 
+def _run_false_position_batch(
+    func: Callable[[float], float],
+    intervals: List[Tuple[float, float]],
+    tol: float,
+    max_iterations: int = 1000,
+    vfunc: Callable[[List[float]], List[float]] | None = None,
+) -> List[object]:
+    """Falsa posición sobre varios intervalos en paralelo (ver `bq._run_bracketed_batch`)."""
+    return bq._run_bracketed_batch(
+        func,
+        intervals,
+        tol,
+        lambda a, b, fa, fb: b - fb * (b - a) / (fb - fa),
+        FalsePositionStep,
+        max_iterations,
+        vfunc,
+    )
+
+
 class MetodoFalsaPosicionWindow(bq.MetodoBiseccionWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -71,6 +90,9 @@ class MetodoFalsaPosicionWindow(bq.MetodoBiseccionWindow):
         except Exception:
             pass
 
+    def _solve_batch(self, expr: str, func, intervals, tol):
+        return _run_false_position_batch(func, intervals, tol, vfunc=bq._compile_vectorized_function(expr))
+
     def _calcular(self):
         resultados = []
         display_idx = 1
@@ -106,6 +128,10 @@ class MetodoFalsaPosicionWindow(bq.MetodoBiseccionWindow):
             except Exception:
                 approx1_value = None
 
+        # (a, b, aproximado, mensaje de error) de cada intervalo; se resuelven en un solo lote
+        jobs = []
+        auto_detected = False
+
         # Primera raíz: permite detección automática si no hay [a,b]
         if a1_txt and b1_txt:
             try:
@@ -114,12 +140,7 @@ class MetodoFalsaPosicionWindow(bq.MetodoBiseccionWindow):
             except Exception as exc:
                 QMessageBox.warning(self, "Aviso", f"Intervalo inválido (primera raíz): {exc}")
                 return
-            try:
-                pasos, raiz, fc, iteraciones = _run_false_position(func, a1, b1, tol)
-                resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, approx1_value))
-                display_idx += 1
-            except Exception as exc:
-                QMessageBox.warning(self, "Aviso", f"No se pudo calcular la raíz (intervalo [{a1}, {b1}]): {exc}")
+            jobs.append((a1, b1, approx1_value, f"No se pudo calcular la raíz (intervalo [{a1}, {b1}])"))
         else:
             dlg = bq.IntervalsDialog(self, func, start=-10.0, end=10.0, step=0.5)
             if dlg.exec() != QDialog.Accepted:
@@ -144,19 +165,9 @@ class MetodoFalsaPosicionWindow(bq.MetodoBiseccionWindow):
                                 pass
             except Exception:
                 pass
-            any_success = False
             for a, b in intervals:
-                try:
-                    pasos, raiz, fc, iteraciones = _run_false_position(func, a, b, tol)
-                    resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, approx1_value))
-                    display_idx += 1
-                    any_success = True
-                except Exception as exc:
-                    QMessageBox.warning(self, "Aviso", f"Falsa posición en [{a}, {b}] falló: {exc}")
-                    continue
-            if not any_success:
-                QMessageBox.warning(self, "Aviso", "No se encontraron raíces en los intervalos detectados.")
-                return
+                jobs.append((a, b, approx1_value, f"Falsa posición en [{a}, {b}] falló"))
+            auto_detected = True
 
         # Raíces adicionales: reutilizan expr1 y tol
         for card_idx, card in enumerate(self.root_cards[1:], start=2):
@@ -170,13 +181,21 @@ class MetodoFalsaPosicionWindow(bq.MetodoBiseccionWindow):
             except Exception as exc:
                 QMessageBox.warning(self, "Aviso", f"Intervalo inválido en la raíz #{card_idx}: {exc}")
                 continue
-            try:
-                pasos, raiz, fc, iteraciones = _run_false_position(func, a, b, tol)
-                resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, None))
-                display_idx += 1
-            except Exception as exc:
-                QMessageBox.warning(self, "Aviso", f"No se pudo calcular la raíz #{card_idx} (intervalo [{a}, {b}]): {exc}")
+            jobs.append((a, b, None, f"No se pudo calcular la raíz #{card_idx} (intervalo [{a}, {b}])"))
+
+        batch = self._solve_batch(expr1, func, [(a, b) for a, b, _ap, _msg in jobs], tol)
+        any_success = False
+        for (_a, _b, approx_value, fail_msg), outcome in zip(jobs, batch):
+            if isinstance(outcome, Exception):
+                QMessageBox.warning(self, "Aviso", f"{fail_msg}: {outcome}")
                 continue
+            pasos, raiz, fc, iteraciones = outcome
+            resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, approx_value))
+            display_idx += 1
+            any_success = True
+        if auto_detected and not any_success:
+            QMessageBox.warning(self, "Aviso", "No se encontraron raíces en los intervalos detectados.")
+            return
 
         # Quitar duplicados por valor de raíz
         _unique_res = []
@@ -0,0 +1,85 @@
+from typing import Callable, Tuple
+
+from PySide6.QtWidgets import QLabel
+
+from . import biseccion_qt as bq
+from .falsa_posicion_qt import FalsePositionStep, MetodoFalsaPosicionWindow
+
+
+def _run_illinois(
+    func: Callable[[float], float],
+    a: float,
+    b: float,
+    tol: float,
+    max_iterations: int = 1000,
+) -> Tuple[bq.IterationTrace, float, float, int]:
+    """Falsa posición modificada (Illinois / Anderson-Björck).
+
+    Cuando el mismo extremo se conserva dos iteraciones seguidas, su valor de f
+    usado en la interpolación se reduce con el factor de Anderson-Björck
+    m = 1 - f(c)/f(extremo reemplazado) (o 1/2, regla de Illinois, si m <= 0).
+    Así se evita el estancamiento de un extremo típico de la regla falsa.
+    La tabla muestra siempre los valores reales de f(a) y f(b).
+    """
+    fa = func(a)
+    fb = func(b)
+    if not (fa * fb < 0):
+        raise ValueError("El intervalo inicial debe contener la raíz (f(a) * f(b) < 0).")
+
+    steps = bq.IterationTrace(FalsePositionStep, max_iterations)
+    # Valores ponderados para la interpolación
+    ga, gb = fa, fb
+    # -1: se conservó a en la iteración anterior, +1: se conservó b
+    side = 0
+    iteration = 0
+
+    while iteration < max_iterations:
+        iteration += 1
+        c = b - gb * (b - a) / (gb - ga)
+        fc = func(c)
+        steps.append(iteration, a, b, c, fa, fb, fc)
+
+        if abs(fc) < tol:
+            return steps.finish(), c, fc, iteration
+
+        if ga * fc < 0:
+            # La raíz queda en [a, c]: c reemplaza a b y se conserva a
+            if side == -1:
+                m = 1.0 - fc / fb
+                ga *= m if m > 0 else 0.5
+            b, fb, gb = c, fc, fc
+            side = -1
+        else:
+            # La raíz queda en [c, b]: c reemplaza a a y se conserva b
+            if side == 1:
+                m = 1.0 - fc / fa
+                gb *= m if m > 0 else 0.5
+            a, fa, ga = c, fc, fc
+            side = 1
+
+    raise ValueError("El método excedió el máximo de iteraciones permitidas.")
+
+
+class MetodoIllinoisWindow(MetodoFalsaPosicionWindow):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Método de Illinois (falsa posición modificada)")
+        try:
+            for lbl in self.findChildren(QLabel):
+                if (lbl.text() or "").strip() == "Método de Falsa Posición":
+                    lbl.setText("Método de Illinois (falsa posición modificada)")
+        except Exception:
+            pass
+        try:
+            self.btn_calcular.setText("Calcular Illinois")
+        except Exception:
+            pass
+
+    def _solve_batch(self, expr: str, func, intervals, tol):
+        outcomes = []
+        for a, b in intervals:
+            try:
+                outcomes.append(_run_illinois(func, a, b, tol))
+            except Exception as exc:
+                outcomes.append(exc)
+        return outcomes
@@ -2,21 +2,16 @@ import math
 from dataclasses import dataclass
 from typing import Callable, List, Tuple
 
-from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QLabel,
     QMessageBox,
     QDialog,
-    QTableWidget,
-    QTableWidgetItem,
-    QSizePolicy,
-    QHeaderView,
 )
 
 from . import biseccion_qt as bq
 
 
-@dataclass
+@dataclass(slots=True)
 class NewtonRaphsonStep:
     iteration: int
     x: float
@@ -56,21 +51,45 @@ def _numeric_derivative(func: Callable[[float], float], x: float, h: float = 1e-
     return (fx_forward - fx_backward) / (2.0 * h)
 
 
+def _evaluar_con_derivada(fdf: Callable[[float], Tuple[float, float]], x: float) -> Tuple[float, float]:
+    try:
+        return fdf(x)
+    except Exception as exc:
+        raise ValueError(f"No fue posible evaluar la derivada en x = {x}: {exc}") from exc
+
+
 def _run_newton_raphson(
     func: Callable[[float], float],
     x0: float,
     tol: float,
     max_iterations: int = 100,
-) -> Tuple[List[NewtonRaphsonStep], float, float, int]:
-    steps: List[NewtonRaphsonStep] = []
+    fdf: Callable[[float], Tuple[float, float]] | None = None,
+) -> Tuple[bq.IterationTrace, float, float, int]:
+    """Newton-Raphson.
+
+    Si se da `fdf` (ver `bq._compile_derivative`), cada iteración obtiene f(x)
+    y la derivada exacta en una sola evaluación. Si no, se usa la derivada
+    numérica por diferencias centrales.
+
+    Las evaluaciones pasan por un `EvaluationLedger` (se puede pasar uno como
+    `func` o `fdf` para consultar después cuántas hubo) y los valores en xₙ₊₁
+    se reutilizan como los de xₙ en la siguiente iteración.
+    """
+    steps = bq.IterationTrace(NewtonRaphsonStep, max_iterations)
     x_n = x0
+    if fdf is not None:
+        fdf = bq.EvaluationLedger.wrap(fdf)
+        fx, dfx = _evaluar_con_derivada(fdf, x_n)
+    else:
+        func = bq.EvaluationLedger.wrap(func)
+        fx, dfx = func(x_n), None
 
     for iteration in range(1, max_iterations + 1):
-        fx = func(x_n)
-        try:
-            dfx = _numeric_derivative(func, x_n)
-        except Exception as exc:
-            raise ValueError(f"No fue posible evaluar la derivada en x = {x_n}: {exc}") from exc
+        if dfx is None:
+            try:
+                dfx = _numeric_derivative(func, x_n)
+            except Exception as exc:
+                raise ValueError(f"No fue posible evaluar la derivada en x = {x_n}: {exc}") from exc
 
         if not math.isfinite(dfx) or abs(dfx) < 1e-12:
             raise ValueError(f"La derivada es cero o no es finita en x = {x_n}.")
@@ -80,13 +99,16 @@ def _run_newton_raphson(
             raise ValueError("La iteración generó un valor no finito. Ajusta el valor inicial.")
 
         error = abs(x_next - x_n)
-        fx_next = func(x_next)
-        steps.append(NewtonRaphsonStep(iteration, x_n, fx, dfx, x_next, error))
+        if fdf is not None:
+            fx_next, dfx_next = _evaluar_con_derivada(fdf, x_next)
+        else:
+            fx_next, dfx_next = func(x_next), None
+        steps.append(iteration, x_n, fx, dfx, x_next, error)
 
         if abs(fx_next) < tol or error < tol:
-            return steps, x_next, fx_next, iteration
+            return steps.finish(), x_next, fx_next, iteration
 
-        x_n = x_next
+        x_n, fx, dfx = x_next, fx_next, dfx_next
 
     raise ValueError("El método excedió el máximo de iteraciones permitidas.")
 
@@ -288,9 +310,7 @@ class MetodoNewtonRaphsonWindow(bq.MetodoBiseccionWindow):
 
         ranges = []
         for (_idx, _expr, pasos, _raiz, _fc, _it, _ap) in resultados:
-            xs = []
-            for paso in pasos:
-                xs.extend([paso.x, paso.x_next])
+            xs = pasos.column("x") + pasos.column("x_next")
             if xs:
                 ranges.append((min(xs), max(xs)))
         if ranges:
@@ -608,40 +628,17 @@ class MetodoNewtonRaphsonWindow(bq.MetodoBiseccionWindow):
         self._store_plot_state("results", resultados)
         self._mpl["canvas"].draw_idle()
 
-    def _create_table_widget(self, pasos: List[NewtonRaphsonStep]) -> QTableWidget:
-        table = QTableWidget()
-        headers = ["Iteración", "xₙ", "f(xₙ)", "f'(xₙ)", "xₙ₊₁", "Error |xₙ₊₁ - xₙ|"]
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
-        table.setRowCount(len(pasos))
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
-        table.setSelectionMode(QTableWidget.NoSelection)
-        table.verticalHeader().setVisible(False)
-        table.setAlternatingRowColors(True)
-        table.setObjectName("ResultsTable")
-        table.setMinimumHeight(320)
-        table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        for row, paso in enumerate(pasos):
-            values = [
-                str(paso.iteration),
-                bq._format_number(paso.x),
-                bq._format_number(paso.fx),
-                bq._format_number(paso.dfx),
-                bq._format_number(paso.x_next),
-                bq._format_number(paso.error),
-            ]
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                item.setTextAlignment(Qt.AlignCenter)
-                table.setItem(row, col, item)
-
-        header = table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Stretch)
-        return table
+    _TABLE_COLUMNS = [
+        ("Iteración", "iteration"),
+        ("xₙ", "x"),
+        ("f(xₙ)", "fx"),
+        ("f'(xₙ)", "dfx"),
+        ("xₙ₊₁", "x_next"),
+        ("Error |xₙ₊₁ - xₙ|", "error"),
+    ]
 
     def _calcular(self):
-        resultados: List[Tuple[int, str, List[NewtonRaphsonStep], float, float, int, None]] = []
+        resultados: List[Tuple[int, str, bq.IterationTrace, float, float, int, None]] = []
         display_idx = 1
         skip_additional = False
 
@@ -700,10 +697,15 @@ class MetodoNewtonRaphsonWindow(bq.MetodoBiseccionWindow):
                 pass
             skip_additional = True
 
+        # Derivada exacta por diferenciación automática (None: derivada numérica)
+        fdf = bq._compile_derivative(expr1)
+        self._exact_derivative = fdf is not None
+        # Evaluaciones de f(x) por raíz, según el registro de cada cálculo
+        self._evaluations = {}
         any_success = False
         for guess in guesses:
             try:
-                pasos, raiz, fc, iteraciones = _run_newton_raphson(func, guess, tol)
+                pasos, raiz, fc, iteraciones = self._solve_from(func, fdf, guess, tol, display_idx)
                 resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, None))
                 display_idx += 1
                 any_success = True
@@ -733,7 +735,7 @@ class MetodoNewtonRaphsonWindow(bq.MetodoBiseccionWindow):
                     )
                     continue
                 try:
-                    pasos, raiz, fc, iteraciones = _run_newton_raphson(func, x_guess, tol)
+                    pasos, raiz, fc, iteraciones = self._solve_from(func, fdf, x_guess, tol, display_idx)
                     resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, None))
                     display_idx += 1
                 except Exception as exc:
@@ -767,6 +769,16 @@ class MetodoNewtonRaphsonWindow(bq.MetodoBiseccionWindow):
         except Exception:
             pass
 
+    def _solve_from(self, func, fdf, x0: float, tol: float, display_idx: int):
+        """Ejecuta Newton-Raphson desde x0 y registra sus evaluaciones de f."""
+        ledger = bq.EvaluationLedger(fdf if fdf is not None else func)
+        if fdf is not None:
+            result = _run_newton_raphson(func, x0, tol, fdf=ledger)
+        else:
+            result = _run_newton_raphson(ledger, x0, tol)
+        self._evaluations[display_idx] = ledger.evaluations
+        return result
+
     def _adjust_result_cards(self, resultados, tol) -> None:
         cards = []
         for i in range(self.results_layout.count()):
@@ -788,6 +800,14 @@ class MetodoNewtonRaphsonWindow(bq.MetodoBiseccionWindow):
                     f"La raíz es: {bq._format_number(raiz)}.",
                     f"Tolerancia: {tol_txt} — Error alcanzado: {err_txt} ({indicator})",
                 ]
+                evaluations = getattr(self, "_evaluations", {}).get(_idx)
+                if evaluations is not None:
+                    if getattr(self, "_exact_derivative", False):
+                        summary_lines.append(
+                            f"Evaluaciones de f(x) y f'(x): {evaluations} (derivada exacta por diferenciación automática)."
+                        )
+                    else:
+                        summary_lines.append(f"Evaluaciones de f(x): {evaluations} (derivada numérica).")
                 # Intentar obtener la derivada simbólica de la función y mostrarla.
                 try:
                     try:
@@ -2,23 +2,18 @@ import math
 from dataclasses import dataclass
 from typing import Callable, List, Tuple
 
-from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
     QLabel,
     QMessageBox,
     QDialog,
-    QTableWidget,
-    QTableWidgetItem,
-    QSizePolicy,
-    QHeaderView,
 )
 
 from . import biseccion_qt as bq
 
 
-@dataclass
+@dataclass(slots=True)
 class SecantStep:
     iteration: int
     x_prev: float
@@ -60,14 +55,20 @@ def _run_secante(
     x1: float,
     tol: float,
     max_iterations: int = 100,
-) -> Tuple[List[SecantStep], float, float, int]:
-    steps: List[SecantStep] = []
+) -> Tuple[bq.IterationTrace, float, float, int]:
+    """Método de la secante.
+
+    Cada iteración evalúa f una sola vez: f(xₙ₋₁) y f(xₙ) se arrastran de la
+    iteración anterior. Las evaluaciones pasan por un `EvaluationLedger`
+    (se puede pasar uno como `func` para consultar después cuántas hubo).
+    """
+    func = bq.EvaluationLedger.wrap(func)
+    steps = bq.IterationTrace(SecantStep, max_iterations)
     x_prev, x_curr = x0, x1
+    fx_prev = func(x_prev)
+    fx_curr = func(x_curr)
 
     for iteration in range(1, max_iterations + 1):
-        fx_prev = func(x_prev)
-        fx_curr = func(x_curr)
-
         denom = fx_prev - fx_curr
         if not math.isfinite(denom) or abs(denom) < 1e-12:
             raise ValueError("El denominador f(x_n-1) - f(x_n) es cero o no es finito.")
@@ -78,12 +79,13 @@ def _run_secante(
 
         error = abs(x_next - x_curr)
         fx_next = func(x_next)
-        steps.append(SecantStep(iteration, x_prev, x_curr, fx_prev, fx_curr, x_next, error))
+        steps.append(iteration, x_prev, x_curr, fx_prev, fx_curr, x_next, error)
 
         if abs(fx_next) < tol or error < tol:
-            return steps, x_next, fx_next, iteration
+            return steps.finish(), x_next, fx_next, iteration
 
         x_prev, x_curr = x_curr, x_next
+        fx_prev, fx_curr = fx_curr, fx_next
 
     raise ValueError("El metodo excedio el maximo de iteraciones permitidas.")
 
@@ -339,49 +341,18 @@ class MetodoSecanteWindow(bq.MetodoBiseccionWindow):
         self._store_plot_state("live")
         self._mpl["canvas"].draw_idle()
 
-    def _create_table_widget(self, pasos: List[SecantStep]) -> QTableWidget:
-        table = QTableWidget()
-        headers = [
-            "Iteracion",
-            "x(n-1)",
-            "x(n)",
-            "f(x(n-1))",
-            "f(x(n))",
-            "x(n+1)",
-            "Error |x(n+1)-x(n)|",
-        ]
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
-        table.setRowCount(len(pasos))
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
-        table.setSelectionMode(QTableWidget.NoSelection)
-        table.verticalHeader().setVisible(False)
-        table.setAlternatingRowColors(True)
-        table.setObjectName("ResultsTable")
-        table.setMinimumHeight(320)
-        table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        for row, paso in enumerate(pasos):
-            values = [
-                str(paso.iteration),
-                bq._format_number(paso.x_prev),
-                bq._format_number(paso.x_curr),
-                bq._format_number(paso.fx_prev),
-                bq._format_number(paso.fx_curr),
-                bq._format_number(paso.x_next),
-                bq._format_number(paso.error),
-            ]
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                item.setTextAlignment(Qt.AlignCenter)
-                table.setItem(row, col, item)
-
-        header = table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Stretch)
-        return table
+    _TABLE_COLUMNS = [
+        ("Iteracion", "iteration"),
+        ("x(n-1)", "x_prev"),
+        ("x(n)", "x_curr"),
+        ("f(x(n-1))", "fx_prev"),
+        ("f(x(n))", "fx_curr"),
+        ("x(n+1)", "x_next"),
+        ("Error |x(n+1)-x(n)|", "error"),
+    ]
 
     def _calcular(self):
-        resultados: List[Tuple[int, str, List[SecantStep], float, float, int, None]] = []
+        resultados: List[Tuple[int, str, bq.IterationTrace, float, float, int, None]] = []
         display_idx = 1
 
         if not self.root_cards:
@@ -496,9 +467,13 @@ class MetodoSecanteWindow(bq.MetodoBiseccionWindow):
             except Exception:
                 pass
 
+        # Evaluaciones de f(x) por raíz, según el registro de cada cálculo
+        self._evaluations = {}
         for x0_i, x1_i in seeds:
             try:
-                pasos, raiz, fc, iteraciones = _run_secante(func, x0_i, x1_i, tol)
+                ledger = bq.EvaluationLedger(func)
+                pasos, raiz, fc, iteraciones = _run_secante(ledger, x0_i, x1_i, tol)
+                self._evaluations[display_idx] = ledger.evaluations
                 resultados.append((display_idx, expr1, pasos, raiz, fc, iteraciones, None))
                 display_idx += 1
             except Exception as exc:
@@ -582,6 +557,9 @@ class MetodoSecanteWindow(bq.MetodoBiseccionWindow):
                     f"La raiz es: {bq._format_number(raiz)}.",
                     f"Tolerancia: {tol_txt} — Error alcanzado: {err_txt} ({indicator})",
                 ]
+                evaluations = getattr(self, "_evaluations", {}).get(_idx)
+                if evaluations is not None:
+                    summary_lines.append(f"Evaluaciones de f(x): {evaluations}.")
                 try:
                     if pasos:
                         x0 = pasos[0].x_prev
@@ -605,13 +583,11 @@ class MetodoSecanteWindow(bq.MetodoBiseccionWindow):
         ranges = []
         y_values = []
         for (_idx, _expr, pasos, _raiz, _fc, _it, _ap) in resultados:
-            xs = []
-            for paso in pasos:
-                xs.extend([paso.x_prev, paso.x_curr, paso.x_next])
-                for y in (paso.fx_prev, paso.fx_curr, 0.0):
-                    if math.isfinite(y):
-                        y_values.append(y)
+            xs = pasos.column("x_prev") + pasos.column("x_curr") + pasos.column("x_next")
+            ys = pasos.column("fx_prev") + pasos.column("fx_curr")
+            y_values.extend(y for y in ys if math.isfinite(y))
             if xs:
+                y_values.append(0.0)
                 ranges.append((min(xs), max(xs)))
         try:
             # Usar el rango ingresado por el usuario para no quedar demasiado acercados al eje.
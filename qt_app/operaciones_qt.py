@@ -21,12 +21,21 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QListWidget,
     QTabWidget,
+    QTableWidget,
+    QTableWidgetItem,
+    QFileDialog,
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QObject, Signal
 from PySide6.QtGui import QTextCursor
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
+import multiprocessing
+import os
 import re
+import time
 from determinante_matriz_app import determinante_con_pasos
+from . import cache_resultados
+from .algebra_exacta import LU
 from .theme import (
     bind_font_scale_stylesheet,
     bind_theme_icon,
@@ -58,7 +67,726 @@ def _fmt(x: Fraction) -> str:
     return f"{x.numerator}" if x.denominator == 1 else f"{x.numerator}/{x.denominator}"
 
 
-class OperacionesMatricesWindow(QMainWindow):
+class _AlgebraObjetos:
+    """Algebra sobre los objetos guardados, sin interfaz.
+
+    La comparten la ventana y el evaluador de los procesos por lotes; usa
+    `objects`, `_cse` y las caches `_versions`/`_derived` de quien la hereda.
+    """
+
+    def _touch_obj(self, name):
+        """Nueva versión de `name`: descarta sus propiedades derivadas."""
+        self._versions[name] = self._versions.get(name, 0) + 1
+        for key in [k for k in self._derived if k[0] == name]:
+            del self._derived[key]
+
+    def _node_deps(self, node):
+        """Nombres de objetos guardados que aparecen en el subárbol `node`."""
+        if node[0] == "id":
+            return frozenset((node[1],))
+        deps = frozenset()
+        for part in node[1:]:
+            if isinstance(part, tuple):
+                deps |= self._node_deps(part)
+        return deps
+
+    def _derived_for(self, node, prop, compute):
+        """(valor, pasos) de `prop` para el operando `node`.
+
+        Si el operando es un objeto guardado se reutiliza lo calculado en
+        expresiones anteriores mientras no cambie su versión.
+        """
+        if node[0] != "id" or node[1] not in self.objects:
+            return compute()
+        key = (node[1], self._versions.get(node[1], 0), prop)
+        hit = self._derived.get(key)
+        if hit is None:
+            hit = self._derived[key] = compute()
+        return hit
+
+    # ---------------- Algebra ----------------
+    def _add(self, a, b):
+        ta, tb = a["type"], b["type"]
+        if ta == 'identity_pending' and tb == 'identity_pending':
+            return {'type': 'identity_pending', 'scale': Fraction(a.get('scale', 1) + b.get('scale', 1))}
+        if ta == 'identity_pending' or tb == 'identity_pending':
+            a, b = self._coerce_identity_for_sum(a, b)
+            ta, tb = a["type"], b["type"]
+        if ta != tb:
+            raise ValueError("Solo se pueden sumar objetos del mismo tipo.")
+        if ta == "scalar":
+            return {"type": "scalar", "value": a["value"] + b["value"]}
+        if ta == "vector":
+            oa = a.get("orientation", "col"); ob = b.get("orientation", "col")
+            if oa != ob:
+                raise ValueError("Solo se pueden sumar vectores con la misma orientacion (fila o columna).")
+            if len(a["value"]) != len(b["value"]):
+                raise ValueError("Los vectores deben tener la misma dimension.")
+            return {"type": "vector", "value": [a["value"][i] + b["value"][i] for i in range(len(a['value']))], "orientation": oa}
+        ma = len(a["value"]); na = len(a["value"][0]) if ma else 0
+        mb = len(b["value"]); nb = len(b["value"][0]) if mb else 0
+        if ma != mb or na != nb:
+            raise ValueError("Las matrices deben tener la misma dimension.")
+        res = [[a["value"][i][j] + b["value"][i][j] for j in range(na)] for i in range(ma)]
+        return {"type": "matrix", "value": res}
+
+    def _sub(self, a, b):
+        return self._add(a, self._mul({"type": "scalar", "value": Fraction(-1)}, b))
+
+    def _mul(self, a, b):
+        ta, tb = a["type"], b["type"]
+        if ta == 'identity_pending' or tb == 'identity_pending':
+            # k*I (o I*I) sigue pendiente: el tamaño lo da el otro operando de la suma o el producto
+            if ta in ('scalar', 'identity_pending') and tb in ('scalar', 'identity_pending'):
+                scale = a.get('scale', 1) if ta == 'identity_pending' else a['value']
+                scale *= b.get('scale', 1) if tb == 'identity_pending' else b['value']
+                return {'type': 'identity_pending', 'scale': Fraction(scale)}
+            a, b = self._coerce_identity_for_mul(a, b)
+            ta, tb = a["type"], b["type"]
+        if ta == "scalar":
+            val = a["value"]
+            if tb == "scalar":
+                return {"type": "scalar", "value": val * b["value"]}
+            if tb == "vector":
+                return {"type": "vector", "value": [val * x for x in b["value"]], "orientation": b.get("orientation", "col")}
+            if tb == "matrix":
+                return {"type": "matrix", "value": [[val * x for x in row] for row in b["value"]]}
+        if tb == "scalar":
+            return self._mul(b, a)
+        # Producto entre vectores (considerando orientación)
+        if ta == "vector" and tb == "vector":
+            va = a["value"]; vb = b["value"]
+            oa = a.get("orientation", "col"); ob = b.get("orientation", "col")
+            if oa == "col" and ob == "row":
+                res = [[va[i] * vb[j] for j in range(len(vb))] for i in range(len(va))]
+                return {"type": "matrix", "value": res}
+            if oa == "row" and ob == "col":
+                if len(va) != len(vb):
+                    raise ValueError(f"Multiplicacion no definida: vector fila 1x{len(va)} por vector columna {len(vb)}x1 (se requiere longitudes iguales).")
+                return {"type": "scalar", "value": sum(va[i] * vb[i] for i in range(len(va)))}
+            if oa == "row" and ob == "row":
+                raise ValueError(f"Multiplicacion no definida: vector fila 1x{len(va)} por vector fila 1x{len(vb)}.")
+            if oa == "col" and ob == "col":
+                raise ValueError(f"Multiplicacion no definida: vector columna {len(va)}x1 por vector columna {len(vb)}x1.")
+            raise ValueError("Multiplicacion de vectores no definida para esta orientacion.")
+        # Permitir vector fila * matriz (producto de (x^T)*(A^T))
+        if ta == "vector" and tb == "matrix":
+            v = a["value"]
+            B = b["value"]
+            n = len(v)
+            m = len(B)
+            p = len(B[0]) if m else 0
+            oa = a.get("orientation", "col")
+            if oa == "row":
+                if m != n:
+                    raise ValueError(f"Multiplicacion no definida: vector fila 1x{n} con matriz {m}x{p} (se requiere 1x{n} * {n}x{p}).")
+                res = []
+                for j in range(p):
+                    res.append(sum(v[i] * B[i][j] for i in range(n)))
+                return {"type": "vector", "value": res, "orientation": "row"}
+            else:  # col * matrix
+                if m != 1:
+                    raise ValueError(f"Multiplicacion no definida: vector columna {n}x1 con matriz {m}x{p} (se requiere {n}x1 * 1x{p}).")
+                res = []
+                for j in range(p):
+                    res.append(sum(v[i] * B[0][j] for i in range(n)))
+                return {"type": "vector", "value": res, "orientation": "row"}
+        if ta == "vector":
+            raise ValueError("Solo se permite matriz * vector, no vector * matriz.")
+        if ta == "matrix" and tb == "vector":
+            A = a["value"]; v = b["value"]
+            m = len(A); n = len(A[0]) if m else 0
+            ob = b.get("orientation", "col")
+            if ob == "col":
+                if len(v) != n:
+                    raise ValueError(f"Multiplicacion no definida: matriz {m}x{n} con vector {len(v)}x1 (se requiere {m}x{n} * {n}x1).")
+                return {"type": "vector", "value": [sum(A[i][j] * v[j] for j in range(n)) for i in range(m)], "orientation": "col"}
+            else:  # row vector
+                if n != 1:
+                    raise ValueError(f"Multiplicacion no definida: matriz {m}x{n} con vector fila 1x{len(v)} (se requiere {m}x1 * 1x{len(v)} si se quiere permitir).")
+                res = []
+                for i in range(m):
+                    fila = [A[i][0] * v[j] for j in range(len(v))]
+                    res.append(fila)
+                return {"type": "matrix", "value": res}
+        if ta == "matrix" and tb == "matrix":
+            A, B = a["value"], b["value"]
+            m = len(A); n = len(A[0]) if m else 0
+            n2 = len(B); p = len(B[0]) if n2 else 0
+            if n != n2:
+                raise ValueError(f"Multiplicacion no definida: {m}x{n} por {n2}x{p} (se requiere {m}x{n} * {n}x{p}).")
+            res = []
+            for i in range(m):
+                fila = []
+                for j in range(p):
+                    fila.append(sum(A[i][k] * B[k][j] for k in range(n)))
+                res.append(fila)
+            return {"type": "matrix", "value": res}
+        raise ValueError("Operacion no soportada.")
+
+    def _eval(self, node):
+        # Reutiliza lo que ya evaluó _eval_with_log en el cálculo en curso
+        hit = self._cse.get(node)
+        if hit is not None:
+            return hit[0]
+        kind = node[0]
+        if kind == "scalar":
+            return {"type": "scalar", "value": node[1]}
+        if kind == "id":
+            return self.objects[node[1]]
+        if kind == "op":
+            op, left, right = node[1], node[2], node[3]
+            if op == "*" and left[0] == "^{-1}":
+                a = self._eval(left[1]); b = self._eval(right)
+                if self._solvable(a, b):
+                    return self._solve_with_log(left[1], a, "", b, "", [])[0]
+            a = self._eval(left); b = self._eval(right)
+            if op == "+":
+                return self._add(a, b)
+            if op == "-":
+                return self._sub(a, b)
+            if op == "*":
+                return self._mul(a, b)
+        if kind == "^T":
+            val = self._eval(node[1])
+            if val["type"] == "matrix":
+                A = val["value"]
+                m = len(A); n = len(A[0]) if m else 0
+                T = [[A[j][i] for j in range(m)] for i in range(n)]
+                return {"type": "matrix", "value": T}
+            if val["type"] == "vector":
+                v = val["value"]
+                orient = val.get("orientation", "col")
+                new_orient = "row" if orient == "col" else "col"
+                return {"type": "vector", "value": v, "orientation": new_orient}
+            raise ValueError("Solo se puede transponer matrices o vectores.")
+        if kind == "^{-1}":
+            val = self._eval(node[1])
+            if val["type"] != "matrix":
+                raise ValueError("Solo se puede invertir matrices.")
+            A = val["value"]
+            inv, _ = self._derived_for(node[1], "inv", lambda: self._inv_with_steps(A))
+            return {"type": "matrix", "value": inv}
+        if kind == "det":
+            val = self._eval(node[1])
+            if val["type"] != "matrix":
+                raise ValueError("Solo se puede calcular el determinante de matrices.")
+            A = val["value"]
+            return {"type": "scalar", "value": self._mat_det(A)}
+        if kind == "^":
+            return self._pow_with_log(node[1], self._eval(node[1]), "", node[2], [])[0]
+        if kind == "solve":
+            a = self._eval(node[1]); b = self._eval(node[2])
+            self._check_solve(a, b)
+            return self._solve_with_log(node[1], a, "", b, "", [])[0]
+        raise ValueError("Nodo invalido.")
+
+    def _mat_det(self, A):
+        # Determinante por recursión (Laplace)
+        m = len(A)
+        n = len(A[0]) if m else 0
+        if m != n:
+            raise ValueError("La matriz no es cuadrada.")
+        if m == 1:
+            return A[0][0]
+        if m == 2:
+            return A[0][0]*A[1][1] - A[0][1]*A[1][0]
+        det = Fraction(0)
+        for j in range(n):
+            minor = [[A[i][k] for k in range(n) if k != j] for i in range(1, m)]
+            det += ((-1)**j) * A[0][j] * self._mat_det(minor)
+        return det
+
+    def _mat_inv(self, A):
+        # Inversa por Gauss-Jordan
+        m = len(A)
+        n = len(A[0]) if m else 0
+        if m != n:
+            raise ValueError("La matriz no es cuadrada.")
+        # Construir matriz aumentada [A | I]
+        M = [[A[i][j] for j in range(n)] + [Fraction(int(i==j)) for j in range(n)] for i in range(n)]
+        # Gauss-Jordan
+        for i in range(n):
+            # Buscar pivote
+            if M[i][i] == 0:
+                for k in range(i+1, n):
+                    if M[k][i] != 0:
+                        M[i], M[k] = M[k], M[i]
+                        break
+                else:
+                    raise ValueError("La matriz no es invertible.")
+            piv = M[i][i]
+            for j in range(2*n):
+                M[i][j] /= piv
+            for k in range(n):
+                if k != i:
+                    fac = M[k][i]
+                    for j in range(2*n):
+                        M[k][j] -= fac * M[i][j]
+        # Extraer inversa
+        inv = [row[n:] for row in M]
+        return inv
+
+    # ---------- Helpers con pasos detallados ----------
+    def _ensure_identity(self, n=None):
+        if n is not None:
+            if n <= 0:
+                raise ValueError("Dimension de identidad invalida.")
+            I = [[Fraction(1 if i == j else 0) for j in range(n)] for i in range(n)]
+            self.objects['I'] = {'type': 'matrix', 'value': I}
+            self._touch_obj('I')
+            return self.objects['I']
+        if 'I' in self.objects and self.objects['I'].get('type') == 'matrix':
+            return self.objects['I']
+        # Busca la primera matriz cuadrada guardada para inferir dimension
+        for name in sorted(self.objects.keys()):
+            obj = self.objects[name]
+            if obj.get('type') == 'matrix':
+                m = len(obj['value']); p = len(obj['value'][0]) if m else 0
+                if m == p and m > 0:
+                    I = [[Fraction(1 if i == j else 0) for j in range(m)] for i in range(m)]
+                    self.objects['I'] = {'type': 'matrix', 'value': I}
+                    self._touch_obj('I')
+                    return self.objects['I']
+        raise ValueError("No se puede inferir la matriz identidad: guarda antes una matriz cuadrada.")
+
+    def _transpose_with_steps(self, A):
+        m = len(A); n = len(A[0]) if m else 0
+        steps = [f"Dimensiones: {m}x{n}. Se intercambian filas por columnas."]
+        T = [[A[j][i] for j in range(m)] for i in range(n)]
+        for i in range(n):
+            col_vals = [_fmt(A[j][i]) for j in range(m)]
+            row_vals = [_fmt(T[i][k]) for k in range(len(T[i]))]
+            steps.append(f"Fila {i+1} de A^T se forma con columna {i+1} de A: ({', '.join(col_vals)}) -> [{', '.join(row_vals)}]")
+        return T, steps
+
+    def _det_with_steps(self, A):
+        def calcular():
+            det, steps = determinante_con_pasos(A)
+            return det, [s.replace("—", "-") for s in steps]
+
+        return cache_resultados.calcular("operaciones_det", (A,), calcular)
+
+    def _inv_with_steps(self, A):
+        # Una matriz singular lanza ValueError y no queda guardada
+        return cache_resultados.calcular("operaciones_inv", (A,), lambda: self._reducir_inversa(A))
+
+    def _reducir_inversa(self, A):
+        n = len(A)
+        if n == 0 or len(A[0]) != n:
+            raise ValueError("La matriz no es cuadrada.")
+        # Matriz aumentada
+        I = [[Fraction(1 if i == j else 0) for j in range(n)] for i in range(n)]
+        M = [A[i][:] + I[i][:] for i in range(n)]
+        steps = ["Construir matriz aumentada [A|I]:"]
+        steps.extend(self._format_aug_lines(M, n))
+
+        for col in range(n):
+            # buscar pivote
+            pivot = None
+            for r in range(col, n):
+                if M[r][col] != 0:
+                    pivot = r; break
+            if pivot is None:
+                raise ValueError("La matriz no es invertible.")
+            if pivot != col:
+                M[col], M[pivot] = M[pivot], M[col]
+                steps.append(f"Intercambiar R{col+1} con R{pivot+1} (pivote a la posicion {col+1}).")
+                steps.extend(self._format_aug_lines(M, n))
+            piv = M[col][col]
+            if piv == 0:
+                raise ValueError("La matriz no es invertible.")
+            if piv != 1:
+                M[col] = [x / piv for x in M[col]]
+                steps.append(f"Normalizar R{col+1} dividiendo por {_fmt(piv)} para hacer pivote = 1.")
+                steps.extend(self._format_aug_lines(M, n))
+            for r in range(n):
+                if r == col:
+                    continue
+                factor = M[r][col]
+                if factor == 0:
+                    continue
+                M[r] = [M[r][c] - factor * M[col][c] for c in range(2*n)]
+                steps.append(f"R{r+1} = R{r+1} - ({_fmt(factor)})·R{col+1} para anular columna {col+1}.")
+                steps.extend(self._format_aug_lines(M, n))
+        inv = [row[n:] for row in M]
+        steps.append("Resultado: [I|A^{-1}] obtenido. Extraemos la parte derecha.")
+        steps.extend(self._format_aug_lines(M, n))
+        return inv, steps
+
+    def _format_aug_lines(self, M, n):
+        lines = []
+        if not M:
+            return lines
+        left_cols = n
+        maxw = max(len(_fmt(v)) for row in M for v in row)
+        for row in M:
+            left = " ".join(_fmt(v).rjust(maxw) for v in row[:left_cols])
+            right = " ".join(_fmt(v).rjust(maxw) for v in row[left_cols:])
+            lines.append(f"  {left} | {right}")
+        return lines
+
+    # ---------- Identidad dinámica ----------
+    def _sized_identity(self, pend, n):
+        """La identidad pendiente `pend` (quizá escalada, k*I) ya con tamaño n."""
+        I = self._ensure_identity(n)
+        k = pend.get('scale')
+        if k is None:
+            return I
+        return {'type': 'matrix', 'value': [[k * v for v in row] for row in I['value']]}
+
+    def _resolve_identity(self, obj):
+        """Si el resultado final quedó como identidad pendiente, le da tamaño."""
+        if obj['type'] != 'identity_pending':
+            return obj
+        I = self._ensure_identity()
+        return self._sized_identity(obj, len(I['value']))
+
+    def _coerce_identity_for_sum(self, a, b):
+        # Para suma/resta: ambos deben ser matrices mismas dimensiones
+        if a['type'] == 'identity_pending' and b['type'] == 'matrix':
+            m = len(b['value']); n = len(b['value'][0]) if m else 0
+            if m != n:
+                raise ValueError("La identidad debe ser cuadrada y del mismo tamaño que la otra matriz.")
+            a = self._sized_identity(a, m)
+        if b['type'] == 'identity_pending' and a['type'] == 'matrix':
+            m = len(a['value']); n = len(a['value'][0]) if m else 0
+            if m != n:
+                raise ValueError("La identidad debe ser cuadrada y del mismo tamaño que la otra matriz.")
+            b = self._sized_identity(b, m)
+        return a, b
+
+    def _coerce_identity_for_mul(self, a, b):
+        # I * A  -> n = filas de A
+        # A * I  -> n = columnas de A
+        if a['type'] == 'identity_pending':
+            if b['type'] != 'matrix':
+                raise ValueError("La identidad solo puede multiplicarse con matrices.")
+            n = len(b['value'])
+            a = self._sized_identity(a, n)
+        if b['type'] == 'identity_pending':
+            if a['type'] != 'matrix':
+                raise ValueError("La identidad solo puede multiplicarse con matrices.")
+            n = len(a['value'][0]) if len(a['value']) else 0
+            b = self._sized_identity(b, n)
+        return a, b
+
+    # ---------- Potencias enteras ----------
+    def _pow_with_log(self, a_node, val, val_label, k, log):
+        base = f"({val_label})"
+        if val["type"] == "scalar":
+            if val["value"] == 0 and k < 0:
+                raise ValueError("0 no tiene potencias negativas.")
+            res = {"type": "scalar", "value": val["value"] ** k}
+            log.append(f"{base}^{k} = {_fmt(res['value'])}")
+            return res, f"{base}^{{{k}}}"
+        if val["type"] != "matrix":
+            raise ValueError("Solo se pueden elevar a una potencia escalares y matrices cuadradas.")
+        A = val["value"]
+        n = len(A)
+        if n == 0 or len(A[0]) != n:
+            raise ValueError("Solo se pueden elevar a una potencia matrices cuadradas.")
+        P, pasos = self._derived_for(a_node, ("pow", k), lambda: self._pow_with_steps(a_node, A, base, k))
+        log.append(f"Operacion: Potencia {base}^{k} por cuadrados sucesivos")
+        log.extend([f"  {p}" for p in pasos])
+        return {"type": "matrix", "value": P}, f"{base}^{{{k}}}"
+
+    def _pow_with_steps(self, a_node, A, base, k):
+        """A^k por exponenciación binaria: unas log2(k) multiplicaciones en vez de k-1."""
+        n = len(A)
+        steps = []
+        if k < 0:
+            A, inv_steps = self._derived_for(a_node, "inv", lambda: self._inv_with_steps(A))
+            steps.append(f"Exponente negativo: {base}^{k} = ({base}^{{-1}})^{-k}. Inversa de {base} por Gauss-Jordan:")
+            steps.extend([f"  {p}" for p in inv_steps])
+            base, k = f"{base}^{{-1}}", -k
+        if k == 0:
+            steps.append(f"{base}^0 = I (identidad {n}x{n})")
+            return [[Fraction(1 if i == j else 0) for j in range(n)] for i in range(n)], steps
+        bits = bin(k)[2:]
+        sumandos = " + ".join(str(1 << i) for i in range(len(bits) - 1, -1, -1) if (k >> i) & 1)
+        steps.append(f"k = {k} = {bits} en binario = {sumandos}: se eleva al cuadrado {len(bits) - 1} veces y se multiplican las potencias de los bits en 1")
+        power, exp = {"type": "matrix", "value": A}, 1
+        result, res_exp = None, 0
+        mults = 0
+        for i, bit in enumerate(reversed(bits)):
+            if i:
+                steps.append(f"Cuadrado: {base}^{2 * exp} = {base}^{exp} · {base}^{exp}")
+                power, _ = self._mul_with_log(power, f"{base}^{exp}", power, f"{base}^{exp}", steps)
+                exp *= 2
+                mults += 1
+            if bit != "1":
+                continue
+            if result is None:
+                result, res_exp = power, exp
+                continue
+            steps.append(f"Bit en 1: {base}^{res_exp + exp} = {base}^{res_exp} · {base}^{exp}")
+            result, _ = self._mul_with_log(result, f"{base}^{res_exp}", power, f"{base}^{exp}", steps)
+            res_exp += exp
+            mults += 1
+        steps.append(f"Total: {mults} multiplicaciones de matrices (multiplicando {k} veces serían {k - 1})")
+        return result["value"], steps
+
+    # ---------- Sistemas A·X = b por LU ----------
+    def _solvable(self, a, b):
+        """Indica si a^{-1}*b puede resolverse como el sistema a·X = b."""
+        if a["type"] != "matrix":
+            return False
+        n = len(a["value"])
+        if n == 0 or len(a["value"][0]) != n:
+            return False
+        if b["type"] == "vector":
+            return b.get("orientation", "col") == "col" and len(b["value"]) == n
+        return b["type"] == "matrix" and len(b["value"]) == n
+
+    def _check_solve(self, a, b):
+        if a["type"] != "matrix":
+            raise ValueError("solve(A, b): A debe ser una matriz.")
+        n = len(a["value"])
+        if n == 0 or len(a["value"][0]) != n:
+            raise ValueError("solve(A, b): A debe ser cuadrada.")
+        if b["type"] == "vector" and b.get("orientation", "col") != "col":
+            raise ValueError("solve(A, b): b debe ser un vector columna o una matriz.")
+        if b["type"] not in ("vector", "matrix"):
+            raise ValueError("solve(A, b): b debe ser un vector columna o una matriz.")
+        if len(b["value"]) != n:
+            raise ValueError(f"solve(A, b): A es {n}x{n} y b tiene {len(b['value'])} filas.")
+
+    def _solve_with_log(self, a_node, a, a_label, b, b_label, log, memo=None):
+        """Resuelve a·X = b con la factorización LU de `a`, sin calcular a^{-1}.
+
+        La LU se guarda como propiedad derivada del objeto (y en `memo` para el
+        cálculo en curso), así que otros lados derechos solo pagan las sustituciones.
+        """
+        A = a["value"]
+        key = ("LU", a_node)
+        log.append(f"Operacion: ({a_label})^{{-1}}*{b_label} se resuelve como el sistema {a_label}·X = {b_label} con PA = LU, sin formar la inversa")
+        if memo is not None and key in memo:
+            lu = memo[key]
+            log.append(f"  Factorizacion LU de {a_label}: ya calculada arriba, se reutiliza")
+        else:
+            lu, pasos = self._derived_for(a_node, "LU", lambda: self._lu_with_steps(A))
+            log.extend([f"  {p}" for p in pasos])
+            if memo is not None:
+                memo[key] = lu
+        if b["type"] == "vector":
+            log.append("  Sustitucion hacia adelante L·y = P·b y luego hacia atras U·x = y:")
+            pasos = []
+            x = lu.resolver(b["value"], pasos)
+            log.extend([f"    {p}" for p in pasos])
+            return {"type": "vector", "value": x, "orientation": "col"}, f"({a_label})^{{-1}}*{b_label}"
+        B = b["value"]
+        cols = []
+        for j in range(len(B[0]) if B else 0):
+            log.append(f"  Columna {j+1} de {b_label}: L·y = P·b{j+1}, U·x = y")
+            pasos = []
+            cols.append(lu.resolver([fila[j] for fila in B], pasos))
+            log.extend([f"    {p}" for p in pasos])
+        X = [[col[i] for col in cols] for i in range(len(A))]
+        return {"type": "matrix", "value": X}, f"({a_label})^{{-1}}*{b_label}"
+
+    def _lu_with_steps(self, A):
+        lu = LU(A)
+        return lu, lu.pasos
+
+    def _mul_with_log(self, a, a_label, b, b_label, log):
+        res = self._mul(a, b)
+        log.append(f"{a_label} * {b_label} -> {self._describe_obj(res)}")
+        # Detallar segun tipos
+        if a['type'] == 'scalar' and b['type'] == 'scalar':
+            log.append(f"  {_fmt(a['value'])} * {_fmt(b['value'])} = {_fmt(res['value'])}")
+        elif a['type'] == 'scalar' and b['type'] == 'vector':
+            for i, val in enumerate(res['value']):
+                log.append(f"  v[{i+1}]: {_fmt(a['value'])} * {_fmt(b['value'][i])} = {_fmt(val)}")
+        elif a['type'] == 'scalar' and b['type'] == 'matrix':
+            m = len(res['value']); n = len(res['value'][0]) if m else 0
+            for i in range(m):
+                parts = []
+                for j in range(n):
+                    parts.append(f"{_fmt(a['value'])}*{_fmt(b['value'][i][j])}={_fmt(res['value'][i][j])}")
+                log.append(f"  fila {i+1}: " + ", ".join(parts))
+        elif a['type'] == 'matrix' and b['type'] == 'vector':
+            A = a['value']; v = b['value']
+            for i in range(len(res['value'])):
+                parts = [f"{_fmt(A[i][j])}*{_fmt(v[j])}" for j in range(len(v))]
+                summ = " + ".join(parts)
+                log.append(f"  fila {i+1}: {summ} = {_fmt(res['value'][i])}")
+        elif a['type'] == 'matrix' and b['type'] == 'matrix':
+            A = a['value']; B = b['value']
+            m = len(res['value']); p = len(res['value'][0]) if m else 0
+            for i in range(m):
+                for j in range(p):
+                    parts = [f"{_fmt(A[i][k])}*{_fmt(B[k][j])}" for k in range(len(B))]
+                    summ = " + ".join(parts)
+                    log.append(f"  fila {i+1},col {j+1}: {summ} = {_fmt(res['value'][i][j])}")
+        elif a['type'] == 'matrix' and b['type'] == 'scalar':
+            m = len(res['value']); n = len(res['value'][0]) if m else 0
+            for i in range(m):
+                parts = []
+                for j in range(n):
+                    parts.append(f"{_fmt(a['value'][i][j])}*{_fmt(b['value'])}={_fmt(res['value'][i][j])}")
+                log.append(f"  fila {i+1}: " + ", ".join(parts))
+        elif a['type'] == 'vector' and b['type'] == 'scalar':
+            for i, val in enumerate(res['value']):
+                log.append(f"  v[{i+1}]: {_fmt(a['value'][i])} * {_fmt(b['value'])} = {_fmt(val)}")
+        elif a['type'] == 'vector' and b['type'] == 'vector':
+            if res['type'] == 'scalar':
+                log.append(f"  dot: sum(a_i*b_i) = {_fmt(res['value'])}")
+            elif res['type'] == 'matrix':
+                m = len(res['value']); n = len(res['value'][0]) if m else 0
+                for i in range(m):
+                    parts = []
+                    for j in range(n):
+                        parts.append(f"{_fmt(a['value'][i])}*{_fmt(b['value'][j])}={_fmt(res['value'][i][j])}")
+                    log.append(f"  fila {i+1}: " + ", ".join(parts))
+        return res, f"{a_label}*{b_label}"
+
+    def _describe_obj(self, obj):
+        if obj["type"] == "scalar":
+            return "escalar"
+        if obj["type"] == "vector":
+            return f"vector dim {len(obj['value'])}"
+        if obj["type"] == "matrix":
+            m = len(obj["value"]); n = len(obj["value"][0]) if m else 0
+            return f"matriz {m}x{n}"
+        if obj["type"] == "identity_pending":
+            return "identidad (tamaño por definir)"
+        return "objeto"
+
+    # ---------- Forma y orden de las cadenas de productos ----------
+    def _shape_of(self, val):
+        """Forma de un valor: ("scalar",), ("vector", n, orientacion) o ("matrix", m, n)."""
+        if val["type"] == "scalar":
+            return ("scalar",)
+        if val["type"] == "vector":
+            return ("vector", len(val["value"]), val.get("orientation", "col"))
+        if val["type"] == "matrix":
+            m = len(val["value"])
+            return ("matrix", m, len(val["value"][0]) if m else 0)
+        return None
+
+    def _shape(self, node):
+        """Forma del resultado de `node` sin evaluarlo; None si no se puede saber."""
+        kind = node[0]
+        if kind == "scalar" or kind == "det":
+            return ("scalar",)
+        if kind == "id":
+            obj = self.objects.get(node[1])
+            return self._shape_of(obj) if obj is not None else None
+        if kind == "^T":
+            sh = self._shape(node[1])
+            if sh is None or sh[0] == "scalar":
+                return None
+            if sh[0] == "vector":
+                return ("vector", sh[1], "row" if sh[2] == "col" else "col")
+            return ("matrix", sh[2], sh[1])
+        if kind in ("^{-1}", "^"):
+            sh = self._shape(node[1])
+            if sh is not None and (sh[0] == "scalar" and kind == "^" or sh[0] == "matrix" and sh[1] == sh[2]):
+                return sh
+            return None
+        if kind == "solve":
+            return self._shape(node[2])
+        left, right = self._shape(node[2]), self._shape(node[3])
+        if left is None or right is None:
+            return None
+        if node[1] in "+-":
+            return left if left == right else None
+        if left[0] == "scalar":
+            return right
+        if right[0] == "scalar":
+            return left
+        dims = self._chain_dims([left, right])
+        if dims is None:
+            return None
+        m, p = dims[0][0], dims[1][1]
+        if left[0] == "vector" and right[0] == "vector":
+            return ("scalar",) if m == 1 else ("matrix", m, p)
+        if left[0] == "vector":
+            return ("vector", p, "row")
+        if right[0] == "vector":
+            return ("vector", m, "col")
+        return ("matrix", m, p)
+
+    def _flatten_product(self, node):
+        if node[0] == "op" and node[1] == "*":
+            return self._flatten_product(node[2]) + self._flatten_product(node[3])
+        return [node]
+
+    def _chain_dims(self, shapes):
+        """Dimensiones (filas, columnas) de los factores no escalares de una cadena.
+
+        Devuelve None si la cadena no es un producto de matrices usual: un vector
+        fila solo puede ir primero y uno columna solo al final; con la identidad
+        pendiente o dimensiones incompatibles se conserva el orden escrito.
+        """
+        dims = []
+        last = len(shapes) - 1
+        for pos, sh in enumerate(shapes):
+            if sh is None:
+                return None
+            if sh[0] == "matrix":
+                dims.append((sh[1], sh[2]))
+            elif sh[0] == "vector" and sh[2] == "col" and pos == last:
+                dims.append((sh[1], 1))
+            elif sh[0] == "vector" and sh[2] == "row" and pos == 0:
+                dims.append((1, sh[1]))
+            else:
+                return None
+        for (_, n), (m, _) in zip(dims, dims[1:]):
+            if n != m:
+                return None
+        return dims
+
+    def _chain_split(self, dims):
+        """Programación dinámica de la cadena de matrices: (costo, corte) por tramo."""
+        k = len(dims)
+        cost = [[0] * k for _ in range(k)]
+        split = [[0] * k for _ in range(k)]
+        for length in range(2, k + 1):
+            for i in range(k - length + 1):
+                j = i + length - 1
+                cost[i][j] = None
+                for t in range(i, j):
+                    c = cost[i][t] + cost[t + 1][j] + dims[i][0] * dims[t][1] * dims[j][1]
+                    if cost[i][j] is None or c < cost[i][j]:
+                        cost[i][j], split[i][j] = c, t
+        return cost, split
+
+    def _plan_products(self, node):
+        """Reescribe las cadenas de productos de `node` con el orden más barato.
+
+        Es el mismo orden que elige _eval_chain_with_log, pero decidido una vez
+        a partir de las formas, para evaluar luego el árbol tal cual con _eval.
+        """
+        if node[0] in ("scalar", "id"):
+            return node
+        if node[0] == "op" and node[1] == "*":
+            factors = [self._plan_products(f) for f in self._flatten_product(node)]
+            shapes = [self._shape(f) for f in factors]
+            scalars = [f for f, sh in zip(factors, shapes) if sh == ("scalar",)]
+            rest = [f for f, sh in zip(factors, shapes) if sh != ("scalar",)]
+            dims = self._chain_dims([sh for sh in shapes if sh != ("scalar",)]) if len(rest) >= 3 else None
+            if dims is not None:
+                _, split = self._chain_split(dims)
+
+                def tree(i, j):
+                    if i == j:
+                        return rest[i]
+                    t = split[i][j]
+                    return ("op", "*", tree(i, t), tree(t + 1, j))
+
+                res = tree(0, len(rest) - 1)
+                if not scalars:
+                    return res
+                c = scalars[0]
+                for f in scalars[1:]:
+                    c = ("op", "*", c, f)
+                return ("op", "*", c, res)
+        return tuple(self._plan_products(p) if isinstance(p, tuple) else p for p in node)
+
+
+class OperacionesMatricesWindow(QMainWindow, _AlgebraObjetos):
     """
     Interprete de expresiones con matrices, vectores y escalares.
     Ejemplos: A(u+v), Au + Av, 3A + 2B, A(Bu + Cv), M*(u - 3v)
@@ -72,8 +800,20 @@ class OperacionesMatricesWindow(QMainWindow):
         self.objects = {}  # nombre -> {"type": "matrix"/"vector"/"scalar", "value": ...}
         self.matrix_entries = []
         self.vector_entries = []
-        self.saved_results = []  # lista de {'name', 'expr', 'proc', 'result'}
+        self.saved_results = []  # lista de {'name', 'expr', 'proc', 'result', 'ast', 'deps', ...}
         self._last_eval = None
+        # Subexpresiones ya evaluadas en el último cálculo: nodo del AST -> (valor, etiqueta)
+        self._cse = {}
+        # Propiedades derivadas de los objetos guardados (det, inversa, transpuesta...):
+        # (nombre, versión, propiedad) -> (valor, pasos). La versión cambia al editar,
+        # renombrar o eliminar el objeto, y con ella dejan de valer sus entradas.
+        self._versions = {}
+        self._derived = {}
+        # Resultados guardados con nombre de una letra que se publican como objetos:
+        # nombre -> entrada de saved_results. Se recalculan al cambiar sus datos.
+        self._published = {}
+        # Subexpresiones sembradas desde un cálculo anterior al recalcular
+        self._reused = set()
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -149,6 +889,8 @@ class OperacionesMatricesWindow(QMainWindow):
         text = (
             "Define matrices (A, B...), vectores (u, v...) y escalares, "
             "asígnales un nombre y luego escribe la expresión a evaluar (ej: A(u+v), 3A+2B, A(Bu+Cv)).\n"
+            "Para resolver A·x = b usa solve(A, b); A^{-1}*b también se resuelve sin calcular la inversa.\n"
+            "Las potencias enteras se escriben A^{k} (k negativo usa la inversa).\n"
             "Requisitos: dimensiones compatibles y uso de nombres guardados. "
             "El panel derecho muestra los resultados y pasos.\n\n"
             "Consejo: guarda resultados con nombres claros para reutilizarlos en nuevas expresiones."
@@ -313,9 +1055,11 @@ class OperacionesMatricesWindow(QMainWindow):
         clear_btn = QPushButton("Limpiar pantalla"); clear_btn.clicked.connect(self._limpiar_pantalla)
         save_btn = QPushButton("Guardar resultado"); save_btn.clicked.connect(self._guardar_resultado)
         show_btn = QPushButton("Mostrar guardados"); show_btn.clicked.connect(self._mostrar_guardados)
+        batch_btn = QPushButton("Evaluar por lotes"); batch_btn.clicked.connect(self._evaluar_por_lotes)
         btn_row.addWidget(clear_btn)
         btn_row.addWidget(save_btn)
         btn_row.addWidget(show_btn)
+        btn_row.addWidget(batch_btn)
         btn_row.addStretch(1)
         lay.addLayout(btn_row)
 
@@ -392,6 +1136,9 @@ class OperacionesMatricesWindow(QMainWindow):
             return
         final_name = self._unique_name(nombre)
         self.objects[final_name] = {"type": "matrix", "value": A}
+        self._detach(final_name)
+        self._touch_obj(final_name)
+        self._objects_changed({final_name})
         self._refresh_objects_view()
 
     def _guardar_vector(self):
@@ -412,6 +1159,9 @@ class OperacionesMatricesWindow(QMainWindow):
         orientation = self.vec_orientation.currentData() or "col"
         final_name = self._unique_name(nombre)
         self.objects[final_name] = {"type": "vector", "value": vec, "orientation": orientation}
+        self._detach(final_name)
+        self._touch_obj(final_name)
+        self._objects_changed({final_name})
         self._refresh_objects_view()
 
     def _guardar_escalar(self):
@@ -429,6 +1179,9 @@ class OperacionesMatricesWindow(QMainWindow):
             return
         final_name = self._unique_name(nombre)
         self.objects[final_name] = {"type": "scalar", "value": val}
+        self._detach(final_name)
+        self._touch_obj(final_name)
+        self._objects_changed({final_name})
         self._refresh_objects_view()
 
     def _unique_name(self, base):
@@ -447,6 +1200,8 @@ class OperacionesMatricesWindow(QMainWindow):
             else:
                 m = len(obj["value"]); n = len(obj["value"][0]) if m else 0
                 label = f"{k}: matriz {m}x{n}"
+            if k in self._published:
+                label += f"  = {self._published[k]['expr']}"
             self.objects_list.addItem(label)
         has_objs = self.objects_list.count() > 0
         for b in getattr(self, "_object_action_buttons", []):
@@ -511,6 +1266,9 @@ class OperacionesMatricesWindow(QMainWindow):
             return
         try:
             self.objects.pop(name, None)
+            self._detach(name)
+            self._touch_obj(name)
+            self._objects_changed({name})
             self._refresh_objects_view()
         except Exception as exc:
             QMessageBox.warning(self, "Error", f"No se pudo eliminar: {exc}")
@@ -533,6 +1291,10 @@ class OperacionesMatricesWindow(QMainWindow):
             return
         try:
             self.objects[new] = self.objects.pop(name)
+            self._detach(name)
+            self._touch_obj(name)
+            self._touch_obj(new)
+            self._objects_changed({name, new})
             self._refresh_objects_view()
         except Exception as exc:
             QMessageBox.warning(self, "Error", f"No se pudo renombrar: {exc}")
@@ -566,11 +1328,85 @@ class OperacionesMatricesWindow(QMainWindow):
         try:
             new_obj = self._parse_edit_content(tip, editor.toPlainText(), obj=obj)
             self.objects[name] = new_obj
+            self._detach(name)
+            self._touch_obj(name)
+            self._objects_changed({name})
             self._refresh_objects_view()
         except Exception as exc:
             QMessageBox.warning(self, "Error", f"No se pudo guardar: {exc}")
         self._sync_object_actions()
 
+    def _detach(self, name):
+        # El objeto deja de ser un resultado publicado: el usuario lo reemplazó
+        entry = self._published.pop(name, None)
+        if entry is not None:
+            entry["publica"] = False
+
+    def _objects_changed(self, names):
+        """Recalcula, en orden de guardado, los resultados que dependen de `names`.
+
+        Los resultados publicados como objetos propagan el cambio a los que los
+        usan; el orden de guardado es un orden topológico del grafo, porque un
+        resultado solo puede usar objetos que ya existían al calcularlo.
+        """
+        changed = set(names)
+        updated = []
+        for entry in self.saved_results:
+            hit = entry.get("deps", frozenset()) & changed
+            if not hit:
+                continue
+            name = entry["name"]
+            try:
+                self._recompute_saved(entry, changed)
+                entry["estado"] = f"recalculado tras cambiar {', '.join(sorted(hit))}"
+                if entry.get("publica"):
+                    self.objects[name] = entry["value"]
+                    self._touch_obj(name)
+                    changed.add(name)
+            except Exception as exc:
+                entry["estado"] = f"no se pudo recalcular: {exc}"
+                if entry.get("publica") and name in self.objects:
+                    # Sin valor válido, quienes lo usan tampoco pueden recalcularse
+                    self.objects.pop(name)
+                    self._touch_obj(name)
+                    changed.add(name)
+            updated.append(name)
+        return updated
+
+    def _recompute_saved(self, entry, changed):
+        """Reevalúa `entry` reutilizando los subárboles que no dependen de `changed`."""
+        expr = entry["expr"]
+        ast = entry.get("ast")
+        if ast is None:
+            special = self._solve_a_plus_x_eq_zero(expr)
+            if not special:
+                raise ValueError("la expresion ya no se puede resolver")
+            res, pasos, _, _, name_used = special
+            memo = {}
+            prefix = f"X = -{name_used}\n"
+        else:
+            for dep in sorted(entry["deps"]):
+                if dep == "I" and dep not in self.objects:
+                    self.objects["I"] = {"type": "identity_pending"}
+                elif dep not in self.objects:
+                    raise ValueError(f"el objeto '{dep}' ya no existe")
+            # La identidad puede cambiar de tamaño entre cálculos: nunca se reutiliza
+            stale = set(changed) | {"I"}
+            memo = {n: v for n, v in entry.get("memo", {}).items() if not (self._node_deps(n) & stale)}
+            self._reused = set(memo)
+            pasos = []
+            try:
+                res = self._resolve_identity(self._eval_with_log(ast, pasos, memo)[0])
+            finally:
+                self._reused = set()
+            prefix = ""
+        proc = [f"Operacion: {expr}", f"Recalculado tras cambiar: {', '.join(sorted(entry['deps'] & changed))}", "", "Procedimiento paso a paso:"]
+        proc.extend(pasos if pasos else ["Pasos no disponibles para esta expresion."])
+        entry["proc"] = "\n".join(proc)
+        entry["result"] = prefix + self._format_value(res)
+        entry["value"] = res
+        entry["memo"] = memo
+
     def _edit_hint(self, tip: str) -> str:
         if tip == "scalar":
             return "Escalar: escribe un numero (fraccion opcional, ej. 3/2)."
@@ -587,207 +1423,94 @@ class OperacionesMatricesWindow(QMainWindow):
             return "\n".join(" ".join(_fmt(x) for x in row) for row in obj["value"])
         return ""
 
-    def _parse_edit_content(self, tip: str, text: str, obj=None):
-        text = (text or "").strip()
-        if tip == "scalar":
-            return {"type": "scalar", "value": _parse_fraction(text or "0")}
-        lines = [ln.strip() for ln in text.splitlines() if ln.strip() != ""]
-        if tip == "vector":
-            vals = [_parse_fraction(x) for x in lines] if lines else [Fraction(0)]
-            orient = (obj or {}).get("orientation", "col")
-            return {"type": "vector", "value": vals, "orientation": orient}
-        # matrix
-        rows = []
-        for ln in lines:
-            parts = [p for p in ln.replace(",", " ").split() if p]
-            rows.append([_parse_fraction(p) for p in parts])
-        if not rows:
-            rows = [[Fraction(0)]]
-        # ensure rectangular
-        widths = {len(r) for r in rows}
-        if len(widths) != 1:
-            raise ValueError("Todas las filas deben tener la misma cantidad de columnas.")
-        return {"type": "matrix", "value": rows}
-
-    def _sync_object_actions(self):
-        selected = self._selected_object_name()
-        enabled = selected is not None
-        for b in getattr(self, "_object_action_buttons", []):
-            b.setEnabled(enabled)
-
-    def _apply_template(self, text: str):
-        self.expr_edit.setPlainText(text)
-        cursor = self.expr_edit.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.expr_edit.setTextCursor(cursor)
-        self.expr_edit.setFocus()
-
-    def _template_buttons(self):
-        def first_of_type(t, fallback):
-            obj = self.objects.get(fallback)
-            if obj and obj.get("type") == t:
-                return fallback
-            return fallback
-
-        def second_matrix(primary):
-            return "B" if primary != "B" else "C"
-
-        def template_av():
-            A = first_of_type("matrix", "A")
-            u = first_of_type("vector", "u")
-            v = "v" if u != "v" else "w"
-            return f"{A}({u}+{v})"
-
-        def template_distrib():
-            A = first_of_type("matrix", "A")
-            u = first_of_type("vector", "u")
-            v = "v" if u != "v" else "w"
-            return f"{A}{u} + {A}{v}"
-
-        def template_lineal_combo():
-            A = first_of_type("matrix", "A")
-            B = second_matrix(A)
-            return f"3{A} + 2{B}"
-
-        def template_nested():
-            A = first_of_type("matrix", "A")
-            B = second_matrix(A)
-            u = first_of_type("vector", "u")
-            c = first_of_type("scalar", "c")
-            v = "v" if u != "v" else "w"
-            return f"{A}({B}{u} + {c}{v})"
-
-        def template_mix():
-            A = first_of_type("matrix", "A")
-            u = first_of_type("vector", "u")
-            v = "v" if u != "v" else "w"
-            return f"{A}*({u} - 3{v})"
-
-        def template_cancel_zero():
-            A = first_of_type("matrix", "A")
-            return f"{A}+X=0"
-
-        return [
-            ("A(u+v)", template_av),
-            ("Au + Av", template_distrib),
-            ("3A + 2B", template_lineal_combo),
-            ("A(Bu+Cv)", template_nested),
-            ("A*(u-3v)", template_mix),
-            ("A + X = 0", template_cancel_zero),
-        ]
-
-    # ---------------- Algebra ----------------
-    def _add(self, a, b):
-        ta, tb = a["type"], b["type"]
-        if ta == 'identity_pending' or tb == 'identity_pending':
-            a, b = self._coerce_identity_for_sum(a, b)
-            ta, tb = a["type"], b["type"]
-        if ta != tb:
-            raise ValueError("Solo se pueden sumar objetos del mismo tipo.")
-        if ta == "scalar":
-            return {"type": "scalar", "value": a["value"] + b["value"]}
-        if ta == "vector":
-            oa = a.get("orientation", "col"); ob = b.get("orientation", "col")
-            if oa != ob:
-                raise ValueError("Solo se pueden sumar vectores con la misma orientacion (fila o columna).")
-            if len(a["value"]) != len(b["value"]):
-                raise ValueError("Los vectores deben tener la misma dimension.")
-            return {"type": "vector", "value": [a["value"][i] + b["value"][i] for i in range(len(a['value']))], "orientation": oa}
-        ma = len(a["value"]); na = len(a["value"][0]) if ma else 0
-        mb = len(b["value"]); nb = len(b["value"][0]) if mb else 0
-        if ma != mb or na != nb:
-            raise ValueError("Las matrices deben tener la misma dimension.")
-        res = [[a["value"][i][j] + b["value"][i][j] for j in range(na)] for i in range(ma)]
-        return {"type": "matrix", "value": res}
-
-    def _sub(self, a, b):
-        return self._add(a, self._mul({"type": "scalar", "value": Fraction(-1)}, b))
-
-    def _mul(self, a, b):
-        ta, tb = a["type"], b["type"]
-        if ta == 'identity_pending' or tb == 'identity_pending':
-            a, b = self._coerce_identity_for_mul(a, b)
-            ta, tb = a["type"], b["type"]
-        if ta == "scalar":
-            val = a["value"]
-            if tb == "scalar":
-                return {"type": "scalar", "value": val * b["value"]}
-            if tb == "vector":
-                return {"type": "vector", "value": [val * x for x in b["value"]]}
-            if tb == "matrix":
-                return {"type": "matrix", "value": [[val * x for x in row] for row in b["value"]]}
-        if tb == "scalar":
-            return self._mul(b, a)
-        # Producto entre vectores (considerando orientación)
-        if ta == "vector" and tb == "vector":
-            va = a["value"]; vb = b["value"]
-            oa = a.get("orientation", "col"); ob = b.get("orientation", "col")
-            if oa == "col" and ob == "row":
-                res = [[va[i] * vb[j] for j in range(len(vb))] for i in range(len(va))]
-                return {"type": "matrix", "value": res}
-            if oa == "row" and ob == "col":
-                if len(va) != len(vb):
-                    raise ValueError(f"Multiplicacion no definida: vector fila 1x{len(va)} por vector columna {len(vb)}x1 (se requiere longitudes iguales).")
-                return {"type": "scalar", "value": sum(va[i] * vb[i] for i in range(len(va)))}
-            if oa == "row" and ob == "row":
-                raise ValueError(f"Multiplicacion no definida: vector fila 1x{len(va)} por vector fila 1x{len(vb)}.")
-            if oa == "col" and ob == "col":
-                raise ValueError(f"Multiplicacion no definida: vector columna {len(va)}x1 por vector columna {len(vb)}x1.")
-            raise ValueError("Multiplicacion de vectores no definida para esta orientacion.")
-        # Permitir vector fila * matriz (producto de (x^T)*(A^T))
-        if ta == "vector" and tb == "matrix":
-            v = a["value"]
-            B = b["value"]
-            n = len(v)
-            m = len(B)
-            p = len(B[0]) if m else 0
-            oa = a.get("orientation", "col")
-            if oa == "row":
-                if m != n:
-                    raise ValueError(f"Multiplicacion no definida: vector fila 1x{n} con matriz {m}x{p} (se requiere 1x{n} * {n}x{p}).")
-                res = []
-                for j in range(p):
-                    res.append(sum(v[i] * B[i][j] for i in range(n)))
-                return {"type": "vector", "value": res, "orientation": "row"}
-            else:  # col * matrix
-                if m != 1:
-                    raise ValueError(f"Multiplicacion no definida: vector columna {n}x1 con matriz {m}x{p} (se requiere {n}x1 * 1x{p}).")
-                res = []
-                for j in range(p):
-                    res.append(sum(v[i] * B[0][j] for i in range(n)))
-                return {"type": "vector", "value": res, "orientation": "row"}
-        if ta == "vector":
-            raise ValueError("Solo se permite matriz * vector, no vector * matriz.")
-        if ta == "matrix" and tb == "vector":
-            A = a["value"]; v = b["value"]
-            m = len(A); n = len(A[0]) if m else 0
-            ob = b.get("orientation", "col")
-            if ob == "col":
-                if len(v) != n:
-                    raise ValueError(f"Multiplicacion no definida: matriz {m}x{n} con vector {len(v)}x1 (se requiere {m}x{n} * {n}x1).")
-                return {"type": "vector", "value": [sum(A[i][j] * v[j] for j in range(n)) for i in range(m)], "orientation": "col"}
-            else:  # row vector
-                if n != 1:
-                    raise ValueError(f"Multiplicacion no definida: matriz {m}x{n} con vector fila 1x{len(v)} (se requiere {m}x1 * 1x{len(v)} si se quiere permitir).")
-                res = []
-                for i in range(m):
-                    fila = [A[i][0] * v[j] for j in range(len(v))]
-                    res.append(fila)
-                return {"type": "matrix", "value": res}
-        if ta == "matrix" and tb == "matrix":
-            A, B = a["value"], b["value"]
-            m = len(A); n = len(A[0]) if m else 0
-            n2 = len(B); p = len(B[0]) if n2 else 0
-            if n != n2:
-                raise ValueError(f"Multiplicacion no definida: {m}x{n} por {n2}x{p} (se requiere {m}x{n} * {n}x{p}).")
-            res = []
-            for i in range(m):
-                fila = []
-                for j in range(p):
-                    fila.append(sum(A[i][k] * B[k][j] for k in range(n)))
-                res.append(fila)
-            return {"type": "matrix", "value": res}
-        raise ValueError("Operacion no soportada.")
+    def _parse_edit_content(self, tip: str, text: str, obj=None):
+        text = (text or "").strip()
+        if tip == "scalar":
+            return {"type": "scalar", "value": _parse_fraction(text or "0")}
+        lines = [ln.strip() for ln in text.splitlines() if ln.strip() != ""]
+        if tip == "vector":
+            vals = [_parse_fraction(x) for x in lines] if lines else [Fraction(0)]
+            orient = (obj or {}).get("orientation", "col")
+            return {"type": "vector", "value": vals, "orientation": orient}
+        # matrix
+        rows = []
+        for ln in lines:
+            parts = [p for p in ln.replace(",", " ").split() if p]
+            rows.append([_parse_fraction(p) for p in parts])
+        if not rows:
+            rows = [[Fraction(0)]]
+        # ensure rectangular
+        widths = {len(r) for r in rows}
+        if len(widths) != 1:
+            raise ValueError("Todas las filas deben tener la misma cantidad de columnas.")
+        return {"type": "matrix", "value": rows}
+
+    def _sync_object_actions(self):
+        selected = self._selected_object_name()
+        enabled = selected is not None
+        for b in getattr(self, "_object_action_buttons", []):
+            b.setEnabled(enabled)
+
+    def _apply_template(self, text: str):
+        self.expr_edit.setPlainText(text)
+        cursor = self.expr_edit.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        self.expr_edit.setTextCursor(cursor)
+        self.expr_edit.setFocus()
+
+    def _template_buttons(self):
+        def first_of_type(t, fallback):
+            obj = self.objects.get(fallback)
+            if obj and obj.get("type") == t:
+                return fallback
+            return fallback
+
+        def second_matrix(primary):
+            return "B" if primary != "B" else "C"
+
+        def template_av():
+            A = first_of_type("matrix", "A")
+            u = first_of_type("vector", "u")
+            v = "v" if u != "v" else "w"
+            return f"{A}({u}+{v})"
+
+        def template_distrib():
+            A = first_of_type("matrix", "A")
+            u = first_of_type("vector", "u")
+            v = "v" if u != "v" else "w"
+            return f"{A}{u} + {A}{v}"
+
+        def template_lineal_combo():
+            A = first_of_type("matrix", "A")
+            B = second_matrix(A)
+            return f"3{A} + 2{B}"
+
+        def template_nested():
+            A = first_of_type("matrix", "A")
+            B = second_matrix(A)
+            u = first_of_type("vector", "u")
+            c = first_of_type("scalar", "c")
+            v = "v" if u != "v" else "w"
+            return f"{A}({B}{u} + {c}{v})"
+
+        def template_mix():
+            A = first_of_type("matrix", "A")
+            u = first_of_type("vector", "u")
+            v = "v" if u != "v" else "w"
+            return f"{A}*({u} - 3{v})"
+
+        def template_cancel_zero():
+            A = first_of_type("matrix", "A")
+            return f"{A}+X=0"
+
+        return [
+            ("A(u+v)", template_av),
+            ("Au + Av", template_distrib),
+            ("3A + 2B", template_lineal_combo),
+            ("A(Bu+Cv)", template_nested),
+            ("A*(u-3v)", template_mix),
+            ("A + X = 0", template_cancel_zero),
+        ]
 
     # ---------------- Parser ----------------
     def _tokenize(self, expr: str):
@@ -796,324 +1519,163 @@ class OperacionesMatricesWindow(QMainWindow):
         i = 0
         while i < len(expr):
             ch = expr[i]
-            if ch in "+-*()":
+            if ch in "+-*(),":
                 tokens.append(ch); i += 1; continue
             if ch == '^':
-                # Soporta ^T, ^{-1} y ^(-1)
+                # Soporta ^T, ^{-1}, ^(-1) y potencias enteras ^{k} o ^(k)
                 if expr[i:i+2] == '^T':
                     tokens.append('^T'); i += 2; continue
                 if expr[i:i+5] == '^{-1}':
                     tokens.append('^{-1}'); i += 5; continue
                 if expr[i:i+5] == '^(-1)':
                     tokens.append('^{-1}'); i += 5; continue
+                m = re.match(r"\^\{(-?\d+)\}|\^\((-?\d+)\)", expr[i:])
+                if m:
+                    tokens.append(f"^{{{int(m.group(1) or m.group(2))}}}"); i += m.end(); continue
                 raise ValueError(f"Operador desconocido: {expr[i:i+5]}")
             if expr[i:i+4] == 'det(':  # det(A)
                 tokens.append('det'); i += 3; continue
+            if expr[i:i+6] == 'solve(':  # solve(A, b)
+                tokens.append('solve'); i += 5; continue
             if ch.isdigit():
-                j = i
-                while j < len(expr) and (expr[j].isdigit() or expr[j] == "/"):
-                    j += 1
-                tokens.append(expr[i:j]); i = j; continue
-            if ch.isalpha():
-                tokens.append(ch); i += 1; continue
-            raise ValueError(f"Caracter invalido: {ch}")
-        out = []
-        def is_value(t):
-            return t not in {'+', '-', '*', '(', ')', '^T', '^{-1}', 'det'}
-        for idx, tok in enumerate(tokens):
-            out.append(tok)
-            if idx + 1 < len(tokens):
-                a, b = tok, tokens[idx + 1]
-                if (is_value(a) or a == ")") and (is_value(b) or b == "("):
-                    out.append("*")
-        return out
-
-    def _parse(self, tokens):
-        self._pos = 0
-        self._tokens = tokens
-        return self._parse_expr()
-
-    def _peek(self):
-        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
-
-    def _eat(self, tok=None):
-        cur = self._peek()
-        if tok is not None and cur != tok:
-            raise ValueError(f"Se esperaba '{tok}'")
-        self._pos += 1
-        return cur
-
-    def _parse_expr(self):
-        node = self._parse_term()
-        while self._peek() in ("+", "-"):
-            op = self._eat()
-            rhs = self._parse_term()
-            node = ("op", op, node, rhs)
-        return node
-
-    def _parse_term(self):
-        node = self._parse_factor()
-        while self._peek() == "*":
-            self._eat("*")
-            rhs = self._parse_factor()
-            node = ("op", "*", node, rhs)
-        return node
-
-    def _parse_factor(self):
-        tok = self._peek()
-        if tok == "+":
-            self._eat("+"); return self._parse_factor()
-        if tok == "-":
-            self._eat("-"); return ("op", "*", ("scalar", Fraction(-1)), self._parse_factor())
-        if tok == "(":
-            self._eat("(")
-            node = self._parse_expr()
-            if self._peek() != ")":
-                raise ValueError("Falta cerrar parentesis")
-            self._eat(")")
-            # Soporta operadores postfijos ^T y ^{-1}
-            if self._peek() in ["^T", "^{-1}"]:
-                op = self._eat()
-                return (op, node)
-            return node
-        if tok == "det":
-            self._eat("det")
-            if self._peek() != "(":
-                raise ValueError("Se esperaba '('")
-            self._eat("(")
-            node = self._parse_expr()
-            if self._peek() != ")":
-                raise ValueError("Falta cerrar parentesis en det")
-            self._eat(")")
-            return ("det", node)
-        if tok is None:
-            raise ValueError("Expresion incompleta")
-        self._eat()
-        if tok.replace("/", "").isdigit():
-            return ("scalar", _parse_fraction(tok))
-        if tok.isalpha():
-            if tok not in self.objects:
-                if tok == "I":
-                    self.objects['I'] = {'type': 'identity_pending'}
-                else:
-                    raise ValueError(f"Objeto '{tok}' no definido.")
-            # Soporta operadores postfijos ^T y ^{-1}
-            node = ("id", tok)
-            if self._peek() in ["^T", "^{-1}"]:
-                op = self._eat()
-                return (op, node)
-            return node
-        raise ValueError(f"Token inesperado: {tok}")
-
-    # ---------------- Evaluacion ----------------
-    def _eval(self, node):
-        kind = node[0]
-        if kind == "scalar":
-            return {"type": "scalar", "value": node[1]}
-        if kind == "id":
-            return self.objects[node[1]]
-        if kind == "op":
-            op, left, right = node[1], node[2], node[3]
-            a = self._eval(left); b = self._eval(right)
-            if op == "+":
-                return self._add(a, b)
-            if op == "-":
-                return self._sub(a, b)
-            if op == "*":
-                return self._mul(a, b)
-        if kind == "^T":
-            val = self._eval(node[1])
-            if val["type"] == "matrix":
-                A = val["value"]
-                m = len(A); n = len(A[0]) if m else 0
-                T = [[A[j][i] for j in range(m)] for i in range(n)]
-                return {"type": "matrix", "value": T}
-            if val["type"] == "vector":
-                v = val["value"]
-                orient = val.get("orientation", "col")
-                new_orient = "row" if orient == "col" else "col"
-                return {"type": "vector", "value": v, "orientation": new_orient}
-            raise ValueError("Solo se puede transponer matrices o vectores.")
-        if kind == "^{-1}":
-            val = self._eval(node[1])
-            if val["type"] != "matrix":
-                raise ValueError("Solo se puede invertir matrices.")
-            A = val["value"]
-            return {"type": "matrix", "value": self._mat_inv(A)}
-        if kind == "det":
-            val = self._eval(node[1])
-            if val["type"] != "matrix":
-                raise ValueError("Solo se puede calcular el determinante de matrices.")
-            A = val["value"]
-            return {"type": "scalar", "value": self._mat_det(A)}
-        raise ValueError("Nodo invalido.")
-    def _mat_det(self, A):
-        # Determinante por recursión (Laplace)
-        m = len(A)
-        n = len(A[0]) if m else 0
-        if m != n:
-            raise ValueError("La matriz no es cuadrada.")
-        if m == 1:
-            return A[0][0]
-        if m == 2:
-            return A[0][0]*A[1][1] - A[0][1]*A[1][0]
-        det = Fraction(0)
-        for j in range(n):
-            minor = [[A[i][k] for k in range(n) if k != j] for i in range(1, m)]
-            det += ((-1)**j) * A[0][j] * self._mat_det(minor)
-        return det
-
-    def _mat_inv(self, A):
-        # Inversa por Gauss-Jordan
-        m = len(A)
-        n = len(A[0]) if m else 0
-        if m != n:
-            raise ValueError("La matriz no es cuadrada.")
-        # Construir matriz aumentada [A | I]
-        M = [[A[i][j] for j in range(n)] + [Fraction(int(i==j)) for j in range(n)] for i in range(n)]
-        # Gauss-Jordan
-        for i in range(n):
-            # Buscar pivote
-            if M[i][i] == 0:
-                for k in range(i+1, n):
-                    if M[k][i] != 0:
-                        M[i], M[k] = M[k], M[i]
-                        break
-                else:
-                    raise ValueError("La matriz no es invertible.")
-            piv = M[i][i]
-            for j in range(2*n):
-                M[i][j] /= piv
-            for k in range(n):
-                if k != i:
-                    fac = M[k][i]
-                    for j in range(2*n):
-                        M[k][j] -= fac * M[i][j]
-        # Extraer inversa
-        inv = [row[n:] for row in M]
-        return inv
+                j = i
+                while j < len(expr) and (expr[j].isdigit() or expr[j] == "/"):
+                    j += 1
+                tokens.append(expr[i:j]); i = j; continue
+            if ch.isalpha():
+                tokens.append(ch); i += 1; continue
+            raise ValueError(f"Caracter invalido: {ch}")
+        out = []
+        def is_value(t):
+            return t not in {'+', '-', '*', '(', ')', ',', 'det', 'solve'} and not t.startswith('^')
+        for idx, tok in enumerate(tokens):
+            out.append(tok)
+            if idx + 1 < len(tokens):
+                a, b = tok, tokens[idx + 1]
+                if (is_value(a) or a == ")" or a.startswith("^")) and (is_value(b) or b == "("):
+                    out.append("*")
+        return out
 
-    # ---------- Helpers con pasos detallados ----------
-    def _ensure_identity(self, n=None):
-        if n is not None:
-            if n <= 0:
-                raise ValueError("Dimension de identidad invalida.")
-            I = [[Fraction(1 if i == j else 0) for j in range(n)] for i in range(n)]
-            self.objects['I'] = {'type': 'matrix', 'value': I}
-            return self.objects['I']
-        if 'I' in self.objects and self.objects['I'].get('type') == 'matrix':
-            return self.objects['I']
-        # Busca la primera matriz cuadrada guardada para inferir dimension
-        for name in sorted(self.objects.keys()):
-            obj = self.objects[name]
-            if obj.get('type') == 'matrix':
-                m = len(obj['value']); p = len(obj['value'][0]) if m else 0
-                if m == p and m > 0:
-                    I = [[Fraction(1 if i == j else 0) for j in range(m)] for i in range(m)]
-                    self.objects['I'] = {'type': 'matrix', 'value': I}
-                    return self.objects['I']
-        raise ValueError("No se puede inferir la matriz identidad: guarda antes una matriz cuadrada.")
+    def _parse(self, tokens):
+        self._pos = 0
+        self._tokens = tokens
+        node = self._parse_expr()
+        # Un sobrante (p. ej. un ")" de mas) no puede descartarse en silencio
+        if self._pos < len(self._tokens):
+            raise ValueError(f"Token inesperado: {self._tokens[self._pos]}")
+        return node
 
-    def _transpose_with_steps(self, A):
-        m = len(A); n = len(A[0]) if m else 0
-        steps = [f"Dimensiones: {m}x{n}. Se intercambian filas por columnas."]
-        T = [[A[j][i] for j in range(m)] for i in range(n)]
-        for i in range(n):
-            col_vals = [_fmt(A[j][i]) for j in range(m)]
-            row_vals = [_fmt(T[i][k]) for k in range(len(T[i]))]
-            steps.append(f"Fila {i+1} de A^T se forma con columna {i+1} de A: ({', '.join(col_vals)}) -> [{', '.join(row_vals)}]")
-        return T, steps
+    def _peek(self):
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
 
-    def _det_with_steps(self, A):
-        det, steps = determinante_con_pasos(A)
-        return det, [s.replace("—", "-") for s in steps]
+    def _eat(self, tok=None):
+        cur = self._peek()
+        if tok is not None and cur != tok:
+            raise ValueError(f"Se esperaba '{tok}'")
+        self._pos += 1
+        return cur
 
-    def _inv_with_steps(self, A):
-        n = len(A)
-        if n == 0 or len(A[0]) != n:
-            raise ValueError("La matriz no es cuadrada.")
-        # Matriz aumentada
-        I = [[Fraction(1 if i == j else 0) for j in range(n)] for i in range(n)]
-        M = [A[i][:] + I[i][:] for i in range(n)]
-        steps = ["Construir matriz aumentada [A|I]:"]
-        steps.extend(self._format_aug_lines(M, n))
+    def _parse_expr(self):
+        node = self._parse_term()
+        while self._peek() in ("+", "-"):
+            op = self._eat()
+            rhs = self._parse_term()
+            node = ("op", op, node, rhs)
+        return node
 
-        for col in range(n):
-            # buscar pivote
-            pivot = None
-            for r in range(col, n):
-                if M[r][col] != 0:
-                    pivot = r; break
-            if pivot is None:
-                raise ValueError("La matriz no es invertible.")
-            if pivot != col:
-                M[col], M[pivot] = M[pivot], M[col]
-                steps.append(f"Intercambiar R{col+1} con R{pivot+1} (pivote a la posicion {col+1}).")
-                steps.extend(self._format_aug_lines(M, n))
-            piv = M[col][col]
-            if piv == 0:
-                raise ValueError("La matriz no es invertible.")
-            if piv != 1:
-                M[col] = [x / piv for x in M[col]]
-                steps.append(f"Normalizar R{col+1} dividiendo por {_fmt(piv)} para hacer pivote = 1.")
-                steps.extend(self._format_aug_lines(M, n))
-            for r in range(n):
-                if r == col:
-                    continue
-                factor = M[r][col]
-                if factor == 0:
-                    continue
-                M[r] = [M[r][c] - factor * M[col][c] for c in range(2*n)]
-                steps.append(f"R{r+1} = R{r+1} - ({_fmt(factor)})·R{col+1} para anular columna {col+1}.")
-                steps.extend(self._format_aug_lines(M, n))
-        inv = [row[n:] for row in M]
-        steps.append("Resultado: [I|A^{-1}] obtenido. Extraemos la parte derecha.")
-        steps.extend(self._format_aug_lines(M, n))
-        return inv, steps
+    def _parse_term(self):
+        node = self._parse_factor()
+        while self._peek() == "*":
+            self._eat("*")
+            rhs = self._parse_factor()
+            node = ("op", "*", node, rhs)
+        return node
 
-    def _format_aug_lines(self, M, n):
-        lines = []
-        if not M:
-            return lines
-        left_cols = n
-        maxw = max(len(_fmt(v)) for row in M for v in row)
-        for row in M:
-            left = " ".join(_fmt(v).rjust(maxw) for v in row[:left_cols])
-            right = " ".join(_fmt(v).rjust(maxw) for v in row[left_cols:])
-            lines.append(f"  {left} | {right}")
-        return lines
+    def _parse_factor(self):
+        tok = self._peek()
+        if tok == "+":
+            self._eat("+"); return self._parse_factor()
+        if tok == "-":
+            self._eat("-"); return ("op", "*", ("scalar", Fraction(-1)), self._parse_factor())
+        if tok == "(":
+            self._eat("(")
+            node = self._parse_expr()
+            if self._peek() != ")":
+                raise ValueError("Falta cerrar parentesis")
+            self._eat(")")
+            return self._parse_postfix(node)
+        if tok == "det":
+            self._eat("det")
+            if self._peek() != "(":
+                raise ValueError("Se esperaba '('")
+            self._eat("(")
+            node = self._parse_expr()
+            if self._peek() != ")":
+                raise ValueError("Falta cerrar parentesis en det")
+            self._eat(")")
+            return ("det", node)
+        if tok == "solve":
+            self._eat("solve")
+            self._eat("(")
+            a_node = self._parse_expr()
+            if self._peek() != ",":
+                raise ValueError("solve necesita dos argumentos: solve(A, b)")
+            self._eat(",")
+            b_node = self._parse_expr()
+            if self._peek() != ")":
+                raise ValueError("Falta cerrar parentesis en solve")
+            self._eat(")")
+            return ("solve", a_node, b_node)
+        if tok is None:
+            raise ValueError("Expresion incompleta")
+        self._eat()
+        if tok.replace("/", "").isdigit():
+            return self._parse_postfix(("scalar", _parse_fraction(tok)))
+        if tok.isalpha():
+            if tok not in self.objects:
+                if tok == "I":
+                    self.objects['I'] = {'type': 'identity_pending'}
+                else:
+                    raise ValueError(f"Objeto '{tok}' no definido.")
+            return self._parse_postfix(("id", tok))
+        raise ValueError(f"Token inesperado: {tok}")
 
-    # ---------- Identidad dinámica ----------
-    def _coerce_identity_for_sum(self, a, b):
-        # Para suma/resta: ambos deben ser matrices mismas dimensiones
-        if a['type'] == 'identity_pending' and b['type'] == 'matrix':
-            m = len(b['value']); n = len(b['value'][0]) if m else 0
-            if m != n:
-                raise ValueError("La identidad debe ser cuadrada y del mismo tamaño que la otra matriz.")
-            a = self._ensure_identity(m)
-        if b['type'] == 'identity_pending' and a['type'] == 'matrix':
-            m = len(a['value']); n = len(a['value'][0]) if m else 0
-            if m != n:
-                raise ValueError("La identidad debe ser cuadrada y del mismo tamaño que la otra matriz.")
-            b = self._ensure_identity(m)
-        return a, b
+    def _parse_postfix(self, node):
+        # Soporta operadores postfijos ^T, ^{-1} y potencias enteras ^{k}
+        tok = self._peek()
+        if tok in ("^T", "^{-1}"):
+            self._eat()
+            return self._parse_postfix((tok, node))
+        if tok is not None and tok.startswith("^{"):
+            self._eat()
+            return self._parse_postfix(("^", node, int(tok[2:-1])))
+        return node
 
-    def _coerce_identity_for_mul(self, a, b):
-        # I * A  -> n = filas de A
-        # A * I  -> n = columnas de A
-        if a['type'] == 'identity_pending':
-            if b['type'] != 'matrix':
-                raise ValueError("La identidad solo puede multiplicarse con matrices.")
-            n = len(b['value'])
-            a = self._ensure_identity(n)
-        if b['type'] == 'identity_pending':
-            if a['type'] != 'matrix':
-                raise ValueError("La identidad solo puede multiplicarse con matrices.")
-            n = len(a['value'][0]) if len(a['value']) else 0
-            b = self._ensure_identity(n)
-        return a, b
+    # ---------------- Evaluacion ----------------
+    def _eval_with_log(self, node, log, memo=None):
+        """Evalúa `node` registrando los pasos; cada subexpresión distinta se calcula una vez.
+
+        Los nodos del AST son tuplas, así que subárboles iguales comparten clave
+        en `memo`: el AST se recorre como un DAG y la segunda aparición reutiliza
+        el valor en lugar de repetir, por ejemplo, una inversa o un determinante.
+        """
+        if memo is None:
+            memo = self._cse = {}
+        if node[0] in ("scalar", "id"):
+            return self._eval_node_with_log(node, log, memo)
+        hit = memo.get(node)
+        if hit is not None:
+            res, label = hit
+            if node in self._reused:
+                log.append(f"{label}: sin cambios desde el calculo anterior ({self._describe_obj(res)}), se reutiliza ese resultado")
+            else:
+                log.append(f"{label}: ya calculado arriba ({self._describe_obj(res)}), se reutiliza ese resultado")
+            return hit
+        hit = self._eval_node_with_log(node, log, memo)
+        memo[node] = hit
+        return hit
 
-    def _eval_with_log(self, node, log):
+    def _eval_node_with_log(self, node, log, memo):
         kind = node[0]
         if kind == "scalar":
             return {"type": "scalar", "value": node[1]}, _fmt(node[1])
@@ -1121,8 +1683,23 @@ class OperacionesMatricesWindow(QMainWindow):
             return self.objects[node[1]], node[1]
         if kind == "op":
             op, left, right = node[1], node[2], node[3]
-            a, a_label = self._eval_with_log(left, log)
-            b, b_label = self._eval_with_log(right, log)
+            if op == "*":
+                chain = self._eval_chain_with_log(node, log, memo)
+                if chain is not None:
+                    return chain
+                # X^{-1}*b: se resuelve el sistema en vez de formar la inversa
+                if left[0] == "^{-1}" and left not in memo:
+                    a, a_label = self._eval_with_log(left[1], log, memo)
+                    b, b_label = self._eval_with_log(right, log, memo)
+                    if self._solvable(a, b):
+                        return self._solve_with_log(left[1], a, a_label, b, b_label, log, memo)
+                    a, a_label = self._eval_with_log(left, log, memo)
+                    return self._mul_with_log(a, a_label, b, b_label, log)
+            a, a_label = self._eval_with_log(left, log, memo)
+            b, b_label = self._eval_with_log(right, log, memo)
+            if op in "+-" and "identity_pending" in (a["type"], b["type"]):
+                # El detalle elemento a elemento usa la identidad ya con tamaño
+                a, b = self._coerce_identity_for_sum(a, b)
             # compute result
             if op == "+":
                 res = self._add(a, b)
@@ -1158,61 +1735,12 @@ class OperacionesMatricesWindow(QMainWindow):
                         log.append(f"  fila {i+1}: " + ", ".join(parts))
                 return res, f"({a_label}-{b_label})"
             if op == "*":
-                res = self._mul(a, b)
-                log.append(f"{a_label} * {b_label} -> {self._describe_obj(res)}")
-                # Detallar segun tipos
-                if a['type'] == 'scalar' and b['type'] == 'scalar':
-                    log.append(f"  {_fmt(a['value'])} * {_fmt(b['value'])} = {_fmt(res['value'])}")
-                elif a['type'] == 'scalar' and b['type'] == 'vector':
-                    for i, val in enumerate(res['value']):
-                        log.append(f"  v[{i+1}]: {_fmt(a['value'])} * {_fmt(b['value'][i])} = {_fmt(val)}")
-                elif a['type'] == 'scalar' and b['type'] == 'matrix':
-                    m = len(res['value']); n = len(res['value'][0]) if m else 0
-                    for i in range(m):
-                        parts = []
-                        for j in range(n):
-                            parts.append(f"{_fmt(a['value'])}*{_fmt(b['value'][i][j])}={_fmt(res['value'][i][j])}")
-                        log.append(f"  fila {i+1}: " + ", ".join(parts))
-                elif a['type'] == 'matrix' and b['type'] == 'vector':
-                    A = a['value']; v = b['value']
-                    for i in range(len(res['value'])):
-                        parts = [f"{_fmt(A[i][j])}*{_fmt(v[j])}" for j in range(len(v))]
-                        summ = " + ".join(parts)
-                        log.append(f"  fila {i+1}: {summ} = {_fmt(res['value'][i])}")
-                elif a['type'] == 'matrix' and b['type'] == 'matrix':
-                    A = a['value']; B = b['value']
-                    m = len(res['value']); p = len(res['value'][0]) if m else 0
-                    for i in range(m):
-                        for j in range(p):
-                            parts = [f"{_fmt(A[i][k])}*{_fmt(B[k][j])}" for k in range(len(B))]
-                            summ = " + ".join(parts)
-                            log.append(f"  fila {i+1},col {j+1}: {summ} = {_fmt(res['value'][i][j])}")
-                elif a['type'] == 'matrix' and b['type'] == 'scalar':
-                    m = len(res['value']); n = len(res['value'][0]) if m else 0
-                    for i in range(m):
-                        parts = []
-                        for j in range(n):
-                            parts.append(f"{_fmt(a['value'][i][j])}*{_fmt(b['value'])}={_fmt(res['value'][i][j])}")
-                        log.append(f"  fila {i+1}: " + ", ".join(parts))
-                elif a['type'] == 'vector' and b['type'] == 'scalar':
-                    for i, val in enumerate(res['value']):
-                        log.append(f"  v[{i+1}]: {_fmt(a['value'][i])} * {_fmt(b['value'])} = {_fmt(val)}")
-                elif a['type'] == 'vector' and b['type'] == 'vector':
-                    if res['type'] == 'scalar':
-                        log.append(f"  dot: sum(a_i*b_i) = {_fmt(res['value'])}")
-                    elif res['type'] == 'matrix':
-                        m = len(res['value']); n = len(res['value'][0]) if m else 0
-                        for i in range(m):
-                            parts = []
-                            for j in range(n):
-                                parts.append(f"{_fmt(a['value'][i])}*{_fmt(b['value'][j])}={_fmt(res['value'][i][j])}")
-                            log.append(f"  fila {i+1}: " + ", ".join(parts))
-                return res, f"{a_label}*{b_label}"
+                return self._mul_with_log(a, a_label, b, b_label, log)
         if kind == "^T":
-            val, val_label = self._eval_with_log(node[1], log)
+            val, val_label = self._eval_with_log(node[1], log, memo)
             if val["type"] == "matrix":
                 A = val["value"]
-                T, pasos = self._transpose_with_steps(A)
+                T, pasos = self._derived_for(node[1], "T", lambda: self._transpose_with_steps(A))
                 log.append(f"Operacion: Transpuesta de {val_label}")
                 log.extend([f"  {p}" for p in pasos])
                 return {"type": "matrix", "value": T}, f"({val_label})^T"
@@ -1224,34 +1752,149 @@ class OperacionesMatricesWindow(QMainWindow):
                 return {"type": "vector", "value": v, "orientation": new_orient}, f"({val_label})^T"
             raise ValueError("Solo se puede transponer matrices o vectores.")
         if kind == "^{-1}":
-            val, val_label = self._eval_with_log(node[1], log)
+            val, val_label = self._eval_with_log(node[1], log, memo)
             if val["type"] != "matrix":
                 raise ValueError("Solo se puede invertir matrices.")
             A = val["value"]
-            inv, pasos = self._inv_with_steps(A)
+            inv, pasos = self._derived_for(node[1], "inv", lambda: self._inv_with_steps(A))
             log.append(f"Operacion: Inversa de {val_label} usando Gauss-Jordan")
             log.extend([f"  {p}" for p in pasos])
             return {"type": "matrix", "value": inv}, f"({val_label})^{{-1}}"
         if kind == "det":
-            val, val_label = self._eval_with_log(node[1], log)
+            val, val_label = self._eval_with_log(node[1], log, memo)
             if val["type"] != "matrix":
                 raise ValueError("Solo se puede calcular el determinante de matrices.")
             A = val["value"]
-            det, pasos = self._det_with_steps(A)
+            det, pasos = self._derived_for(node[1], "det", lambda: self._det_with_steps(A))
             log.append(f"Operacion: Determinante de {val_label}")
             log.extend([f"  {p}" for p in pasos])
             return {"type": "scalar", "value": det}, f"det({val_label})"
+        if kind == "^":
+            val, val_label = self._eval_with_log(node[1], log, memo)
+            return self._pow_with_log(node[1], val, val_label, node[2], log)
+        if kind == "solve":
+            a, a_label = self._eval_with_log(node[1], log, memo)
+            b, b_label = self._eval_with_log(node[2], log, memo)
+            self._check_solve(a, b)
+            res, _ = self._solve_with_log(node[1], a, a_label, b, b_label, log, memo)
+            return res, f"solve({a_label}, {b_label})"
         raise ValueError("Nodo invalido.")
 
-    def _describe_obj(self, obj):
-        if obj["type"] == "scalar":
-            return "escalar"
-        if obj["type"] == "vector":
-            return f"vector dim {len(obj['value'])}"
-        if obj["type"] == "matrix":
-            m = len(obj["value"]); n = len(obj["value"][0]) if m else 0
-            return f"matriz {m}x{n}"
-        return "objeto"
+    # ---------- Cadenas de productos ----------
+    def _eval_chain_with_log(self, node, log, memo):
+        """Evalúa A*B*...*x eligiendo el orden de los productos que menos multiplica.
+
+        El parser arma los productos asociando a la izquierda; aquí la cadena
+        se aplana, los escalares se apartan (conmutan) y el orden de las
+        matrices se elige con la programación dinámica clásica de la cadena de
+        matrices. Si la cadena no es un producto de matrices usual se evalúa tal
+        como fue escrita. Devuelve None para cadenas de menos de tres factores.
+        """
+        factors = self._flatten_product(node)
+        if len(factors) < 3:
+            return None
+        # Las inversas X^{-1} que no se calcularon antes quedan pendientes: si
+        # terminan multiplicando por la izquierda se resuelve un sistema por LU
+        evaluated = []
+        pending = {}
+        for pos, f in enumerate(factors):
+            if f[0] == "^{-1}" and f not in memo:
+                val, val_label = self._eval_with_log(f[1], log, memo)
+                square = val["type"] == "matrix" and val["value"] and len(val["value"][0]) == len(val["value"])
+                if square:
+                    pending[pos] = (val, val_label)
+                    evaluated.append((val, f"({val_label})^{{-1}}"))
+                    continue
+            evaluated.append(self._eval_with_log(f, log, memo))
+
+        def materialize(pos):
+            if pending.pop(pos, None) is not None:
+                evaluated[pos] = self._eval_with_log(factors[pos], log, memo)
+            return evaluated[pos]
+
+        scalars = [i for i, (val, _) in enumerate(evaluated) if val["type"] == "scalar"]
+        rest = [i for i, (val, _) in enumerate(evaluated) if val["type"] != "scalar"]
+        dims = self._chain_dims([self._shape_of(evaluated[i][0]) for i in rest]) if len(rest) >= 3 else None
+
+        if dims is None:
+            by_node = {f: pos for pos, f in enumerate(factors)}
+
+            # Mismo árbol que escribió el usuario, sin volver a registrar los factores
+            def written(n):
+                if n in by_node:
+                    return materialize(by_node[n])
+                left = by_node.get(n[2])
+                if left in pending:
+                    b, b_label = written(n[3])
+                    a, a_label = pending[left]
+                    if self._solvable(a, b):
+                        return self._solve_with_log(n[2][1], a, a_label, b, b_label, log, memo)
+                    a, a_label = materialize(left)
+                    return self._mul_with_log(a, a_label, b, b_label, log)
+                a, a_label = written(n[2])
+                b, b_label = written(n[3])
+                return self._mul_with_log(a, a_label, b, b_label, log)
+
+            return written(node)
+
+        k = len(rest)
+        cost, split = self._chain_split(dims)
+        left_to_right = sum(dims[0][0] * dims[t][0] * dims[t][1] for t in range(1, k))
+
+        def tree(i, j):
+            if i == j:
+                return factors[rest[i]]
+            t = split[i][j]
+            return ("op", "*", tree(i, t), tree(t + 1, j))
+
+        def label(i, j):
+            if i == j:
+                return evaluated[rest[i]][1]
+            t = split[i][j]
+            return f"({label(i, t)}*{label(t + 1, j)})"
+
+        log.append(
+            f"Orden de los productos: {label(0, k - 1)[1:-1]} "
+            f"({cost[0][k - 1]} multiplicaciones de entradas; de izquierda a derecha serían {left_to_right})"
+        )
+
+        def product(i, j):
+            if i == j:
+                return materialize(rest[i])
+            key = tree(i, j)
+            hit = memo.get(key)
+            if hit is not None:
+                log.append(f"{hit[1]}: ya calculado arriba ({self._describe_obj(hit[0])}), se reutiliza ese resultado")
+                return hit
+            t = split[i][j]
+            if t == i and rest[i] in pending:
+                b, b_label = product(t + 1, j)
+                if j > t + 1:
+                    b_label = f"({b_label})"
+                a, a_label = pending[rest[i]]
+                if self._solvable(a, b):
+                    memo[key] = self._solve_with_log(factors[rest[i]][1], a, a_label, b, b_label, log, memo)
+                else:
+                    a, a_label = materialize(rest[i])
+                    memo[key] = self._mul_with_log(a, a_label, b, b_label, log)
+                return memo[key]
+            a, a_label = product(i, t)
+            b, b_label = product(t + 1, j)
+            if t > i:
+                a_label = f"({a_label})"
+            if j > t + 1:
+                b_label = f"({b_label})"
+            memo[key] = self._mul_with_log(a, a_label, b, b_label, log)
+            return memo[key]
+
+        res, res_label = product(0, k - 1)
+        if not scalars:
+            return res, res_label
+        # Los escalares se combinan entre sí y escalan el resultado al final
+        c, c_label = evaluated[scalars[0]]
+        for i in scalars[1:]:
+            c, c_label = self._mul_with_log(c, c_label, evaluated[i][0], evaluated[i][1], log)
+        return self._mul_with_log(c, c_label, res, f"({res_label})", log)
 
     def _ast_lines(self, node, depth=0):
         pad = "  " * depth
@@ -1300,10 +1943,9 @@ class OperacionesMatricesWindow(QMainWindow):
         if node[0] == "id":
             return self.objects.get(node[1], {}).get("type", "desconocido")
         if node[0] == "op":
-            try:
-                return self._eval(node)["type"]
-            except Exception:
-                return "expr"
+            # Basta la forma: no hace falta calcular el subárbol
+            shape = self._shape(node)
+            return shape[0] if shape is not None else "expr"
         return "expr"
 
     def _rule_from_ast(self, ast):
@@ -1381,6 +2023,7 @@ class OperacionesMatricesWindow(QMainWindow):
         try:
             # Caso especial: resolver A + X = 0 (X = -A)
             special_label = None
+            self._cse = {}
             special = self._solve_a_plus_x_eq_zero(expr)
             if special:
                 res, pasos, rule, types_lines, name_used = special
@@ -1390,7 +2033,7 @@ class OperacionesMatricesWindow(QMainWindow):
                 tokens = self._tokenize(expr)
                 ast = self._parse(tokens)
                 pasos = []
-                res, _ = self._eval_with_log(ast, pasos)
+                res = self._resolve_identity(self._eval_with_log(ast, pasos)[0])
 
             # Valores guardados (lista con representacion y tamano)
             saved_lines = []
@@ -1481,6 +2124,10 @@ class OperacionesMatricesWindow(QMainWindow):
                 "proc_text": "\n".join(proc),
                 "steps_text": "\n".join(pasos) if pasos else "Pasos no disponibles para esta expresion.",
                 "result_text": (f"{special_label}\n" if special_label else "") + self._format_value(res),
+                "ast": ast,
+                "deps": self._node_deps(ast) if ast else frozenset((name_used,)),
+                "value": res,
+                "memo": dict(self._cse) if ast else {},
             }
         except Exception as exc:
             QMessageBox.warning(self, "Error", f"No se pudo evaluar: {exc}")
@@ -1510,9 +2157,34 @@ class OperacionesMatricesWindow(QMainWindow):
             "expr": self._last_eval.get("expr", ""),
             "proc": self._last_eval.get("proc_text", ""),
             "result": self._last_eval.get("result_text", ""),
+            "ast": self._last_eval.get("ast"),
+            "deps": self._last_eval.get("deps", frozenset()),
+            "value": self._last_eval.get("value"),
+            "memo": self._last_eval.get("memo", {}),
+            "publica": False,
         }
+        # Con nombre de una letra (libre o de otro resultado) queda disponible
+        # como objeto y se recalcula cuando cambian los datos de los que depende
+        publish = len(name) == 1 and name.isalpha() and (name not in self.objects or name in self._published)
+        if publish and name in entry["deps"]:
+            publish = False
+        if publish:
+            self._detach(name)
+            entry["publica"] = True
+            self._published[name] = entry
+            self.objects[name] = entry["value"]
+            self._touch_obj(name)
+            self._objects_changed({name})
         self.saved_results.append(entry)
-        QMessageBox.information(self, "Guardado", f"Se guardo el resultado como '{name}'.")
+        if publish:
+            self._refresh_objects_view()
+            QMessageBox.information(
+                self, "Guardado",
+                f"Se guardo el resultado como '{name}'. Puedes usarlo en otras expresiones; "
+                "se recalcula solo al editar los objetos de los que depende.",
+            )
+        else:
+            QMessageBox.information(self, "Guardado", f"Se guardo el resultado como '{name}'.")
 
     def _mostrar_guardados(self):
         if not self.saved_results:
@@ -1524,7 +2196,7 @@ class OperacionesMatricesWindow(QMainWindow):
 
         combo = QComboBox()
         for item in self.saved_results:
-            combo.addItem(item["name"])
+            combo.addItem(f"{item['name']} ({item['estado']})" if item.get("estado") else item["name"])
         lay.addWidget(combo)
 
         tabs = QTabWidget()
@@ -1546,6 +2218,287 @@ class OperacionesMatricesWindow(QMainWindow):
         dlg.resize(640, 480)
         dlg.exec()
 
+    # ---------------- Evaluacion por lotes ----------------
+    def _leer_valores_lote(self, text: str, variable: str):
+        """Valores de un archivo: uno por bloque, separados por una linea en blanco.
+
+        Cada bloque usa el formato del editor de objetos; las lineas que
+        empiezan con '#' se ignoran. Sin un objeto previo con ese nombre, el
+        tipo se deduce: un numero es escalar, una columna es vector y el resto matriz.
+        """
+        base = self.objects.get(variable)
+        if base is not None and base.get("type") not in ("scalar", "vector", "matrix"):
+            base = None
+        blocks, current = [], []
+        for line in text.splitlines() + [""]:
+            line = line.strip()
+            if line.startswith("#"):
+                continue
+            if line:
+                current.append(line)
+            elif current:
+                blocks.append(current)
+                current = []
+        values = []
+        for block in blocks:
+            if base is not None:
+                tip = base["type"]
+            elif len(block) == 1 and len(block[0].replace(",", " ").split()) == 1:
+                tip = "scalar"
+            elif all(len(ln.replace(",", " ").split()) == 1 for ln in block):
+                tip = "vector"
+            else:
+                tip = "matrix"
+            values.append(self._parse_edit_content(tip, "\n".join(block), obj=base))
+        return values
+
+    def _rango_lote(self, desde: str, hasta: str, paso: str):
+        a, b, h = _parse_fraction(desde), _parse_fraction(hasta), _parse_fraction(paso)
+        if h == 0 or (b - a) * h < 0:
+            raise ValueError("El paso debe ser distinto de cero y avanzar desde el inicio hacia el final.")
+        count = int((b - a) / h) + 1
+        if count > _LOTE_MAX:
+            raise ValueError(f"El rango genera {count} valores; el maximo es {_LOTE_MAX}.")
+        return [{"type": "scalar", "value": a + i * h} for i in range(count)]
+
+    def _evaluar_por_lotes(self):
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Evaluar por lotes")
+        lay = QVBoxLayout(dlg)
+        info = QLabel(
+            "Evalua la misma expresion para muchos valores de un objeto: un rango de escalares "
+            "o los valores de un archivo de texto (uno por bloque, separados por una linea en blanco)."
+        )
+        info.setWordWrap(True)
+        lay.addWidget(info)
+
+        row = QHBoxLayout(); row.setSpacing(8)
+        expr_edit = QLineEdit(self.expr_edit.toPlainText().strip())
+        var_edit = QLineEdit("k"); var_edit.setFixedWidth(50)
+        row.addWidget(QLabel("Expresion:")); row.addWidget(expr_edit, 1)
+        row.addWidget(QLabel("Variable:")); row.addWidget(var_edit)
+        lay.addLayout(row)
+
+        row = QHBoxLayout(); row.setSpacing(8)
+        mode = QComboBox()
+        mode.addItem("Rango de escalares", "rango")
+        mode.addItem("Valores de un archivo", "archivo")
+        row.addWidget(mode)
+        desde = QLineEdit("0"); hasta = QLineEdit("10"); paso = QLineEdit("1")
+        range_widgets = []
+        for label, edit in (("Desde:", desde), ("Hasta:", hasta), ("Paso:", paso)):
+            lbl = QLabel(label)
+            edit.setFixedWidth(70)
+            row.addWidget(lbl); row.addWidget(edit)
+            range_widgets += [lbl, edit]
+        file_btn = QPushButton("Elegir archivo...")
+        file_lbl = QLabel("(ninguno)")
+        row.addWidget(file_btn); row.addWidget(file_lbl)
+        row.addStretch(1)
+        lay.addLayout(row)
+        chosen = {"path": None}
+
+        def sync_mode():
+            by_file = mode.currentData() == "archivo"
+            for wdg in range_widgets:
+                wdg.setVisible(not by_file)
+            file_btn.setVisible(by_file); file_lbl.setVisible(by_file)
+
+        def choose_file():
+            path, _ = QFileDialog.getOpenFileName(dlg, "Valores para la variable", "", "Texto (*.txt);;Todos (*)")
+            if path:
+                chosen["path"] = path
+                file_lbl.setText(os.path.basename(path))
+
+        mode.currentIndexChanged.connect(sync_mode)
+        file_btn.clicked.connect(choose_file)
+        sync_mode()
+
+        run_row = QHBoxLayout()
+        status = QLabel("")
+        run_btn = QPushButton("Evaluar")
+        run_row.addWidget(status, 1); run_row.addWidget(run_btn)
+        lay.addLayout(run_row)
+
+        table = QTableWidget(0, 3)
+        table.setHorizontalHeaderLabels(["#", "Valor", "Resultado"])
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        bind_font_scale_stylesheet(table, "font-family:Consolas,monospace;font-size:{body}px;", body=12)
+        lay.addWidget(table, 1)
+
+        # Lote en curso: se cancela al cerrar el dialogo o al lanzar otro
+        run = {"pool": None, "activo": False}
+
+        def stop():
+            run["activo"] = False
+            if run["pool"] is not None:
+                run["pool"].shutdown(wait=False, cancel_futures=True)
+                run["pool"] = None
+
+        def receive(results):
+            if not run["activo"]:
+                return
+            for idx, res, err in results:
+                text = f"Error: {err}" if err is not None else self._format_value(res).replace("\n", " ")
+                table.setItem(idx, 2, QTableWidgetItem(text))
+            run["hechos"] += len(results)
+            status.setText(f"{run['hechos']} de {run['total']} evaluados{run['detalle']}")
+            if run["hechos"] >= run["total"]:
+                status.setText(f"{run['total']} evaluados{run['detalle']} en {time.perf_counter() - run['inicio']:.2f} s")
+                stop()
+                run_btn.setEnabled(True)
+
+        receiver = _ReceptorLote()
+        receiver.parcial.connect(receive)
+
+        def start():
+            stop()
+            expr = expr_edit.text().strip()
+            variable = var_edit.text().strip()
+            if not expr:
+                QMessageBox.warning(dlg, "Aviso", "Escribe una expresion.")
+                return
+            if not (variable.isalpha() and len(variable) == 1):
+                QMessageBox.warning(dlg, "Aviso", "La variable debe ser un nombre de una sola letra.")
+                return
+            try:
+                if mode.currentData() == "archivo":
+                    if not chosen["path"]:
+                        raise ValueError("Elige primero un archivo de valores.")
+                    with open(chosen["path"], encoding="utf-8") as fh:
+                        values = self._leer_valores_lote(fh.read(), variable)
+                else:
+                    values = self._rango_lote(desde.text(), hasta.text(), paso.text())
+                if not values:
+                    raise ValueError("No hay valores para evaluar.")
+                if len(values) > _LOTE_MAX:
+                    raise ValueError(f"Hay {len(values)} valores; el maximo es {_LOTE_MAX}.")
+                # Se analiza una sola vez, con el primer valor en lugar de la variable.
+                # El analisis puede agregar una I pendiente: solo va a los procesos,
+                # los objetos de la ventana quedan como estaban
+                snapshot = dict(self.objects)
+                self.objects[variable] = values[0]
+                try:
+                    ast = self._parse(self._tokenize(expr))
+                    # Como en el calculo normal, las cadenas de productos se hacen en el
+                    # orden mas barato; se decide aqui una vez, con las formas del primer valor
+                    ast = self._plan_products(ast)
+                    objects = {k: v for k, v in self.objects.items() if k != variable}
+                finally:
+                    self.objects.clear()
+                    self.objects.update(snapshot)
+                if variable not in self._node_deps(ast):
+                    raise ValueError(f"La expresion no usa '{variable}'.")
+            except Exception as exc:
+                QMessageBox.warning(dlg, "Error", f"No se pudo preparar el lote: {exc}")
+                return
+
+            table.setRowCount(len(values))
+            for i, val in enumerate(values):
+                table.setItem(i, 0, QTableWidgetItem(str(i + 1)))
+                table.setItem(i, 1, QTableWidgetItem(self._format_value(val).replace("\n", " ")))
+                table.setItem(i, 2, QTableWidgetItem(""))
+            jobs = list(enumerate(values))
+            chunks = [jobs[i:i + _LOTE_TROZO] for i in range(0, len(jobs), _LOTE_TROZO)]
+            workers = min(os.cpu_count() or 1, len(chunks))
+            run.update(activo=True, hechos=0, total=len(values), inicio=time.perf_counter(), detalle="")
+            run_btn.setEnabled(False)
+            if len(values) < _LOTE_MIN_POOL or workers <= 1:
+                # Lote chico: arrancar procesos costaria mas que evaluarlo aqui
+                _iniciar_lote(ast, objects, variable)
+                receive(_evaluar_lote(jobs))
+                return
+            run["detalle"] = f" con {workers} procesos"
+            status.setText(f"0 de {len(values)} evaluados{run['detalle']}")
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_iniciar_lote,
+                initargs=(ast, objects, variable),
+            )
+            run["pool"] = pool
+            for chunk in chunks:
+                def done(fut, chunk=chunk):
+                    try:
+                        results = fut.result()
+                    except Exception as exc:
+                        results = [(i, None, f"fallo del proceso de trabajo: {exc}") for i, _ in chunk]
+                    receiver.parcial.emit(results)
+                pool.submit(_evaluar_lote, chunk).add_done_callback(done)
+
+        run_btn.clicked.connect(start)
+        dlg.finished.connect(lambda _: stop())
+        dlg.resize(820, 560)
+        dlg.exec()
+
+
+# ---------------- Evaluacion por lotes (procesos de trabajo) ----------------
+# Valores maximos por lote, tamano de cada envio a un proceso y lote minimo
+# desde el que conviene pagar el arranque de los procesos
+_LOTE_MAX = 10000
+_LOTE_TROZO = 16
+_LOTE_MIN_POOL = 64
+
+
+class _ReceptorLote(QObject):
+    # Los resultados llegan desde el hilo del pool y se muestran en el de la interfaz
+    parcial = Signal(object)
+
+
+class _Evaluador(_AlgebraObjetos):
+    """Evaluador sin interfaz para los procesos del modo por lotes."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self._cse = {}
+        self._versions = {}
+        self._derived = {}
+
+
+_lote = {}
+
+
+def _iniciar_lote(ast, objects, variable):
+    # Una vez por proceso: el AST y los objetos fijos se comparten entre valores
+    _lote["ast"] = ast
+    _lote["variable"] = variable
+    _lote["evaluador"] = ev = _Evaluador(dict(objects))
+    _constantes_lote(ev, ast, variable)
+
+
+def _constantes_lote(ev, node, variable):
+    """Evalua una sola vez los subarboles que no dependen de la variable."""
+    if node[0] in ("scalar", "id"):
+        return
+    if variable not in ev._node_deps(node):
+        try:
+            ev._cse[node] = (ev._eval(node), None)
+        except Exception:
+            pass
+        return
+    for part in node[1:]:
+        if isinstance(part, tuple):
+            _constantes_lote(ev, part, variable)
+
+
+def _evaluar_lote(jobs):
+    """Evalua el AST del lote para cada (indice, valor); devuelve (indice, resultado, error)."""
+    ev = _lote["evaluador"]
+    variable = _lote["variable"]
+    out = []
+    for idx, value in jobs:
+        ev.objects[variable] = value
+        try:
+            out.append((idx, ev._resolve_identity(ev._eval(_lote["ast"])), None))
+        except Exception as exc:
+            out.append((idx, None, str(exc)))
+        finally:
+            # Las propiedades derivadas de los objetos fijos (inversas, LU...) se conservan
+            ev._touch_obj(variable)
+    return out
+
 
 # Modo directo
 if __name__ == "__main__":
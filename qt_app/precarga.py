@@ -0,0 +1,135 @@
+"""Precarga en segundo plano tras mostrar el selector de inicio.
+
+Las importaciones de NumPy y matplotlib (más de medio segundo) corren en un
+hilo aparte; la figura plantilla y la última ventana usada se construyen en el
+hilo de la interfaz, un paso por vuelta del bucle de eventos. Si el usuario
+abre una ventana antes de que termine, simplemente hace el trabajo él mismo.
+"""
+
+import threading
+
+from PySide6.QtCore import QObject, QSettings, QTimer, Signal
+
+from .ventanas import VENTANAS, clase_ventana, reservar, tiene_instancia
+
+
+# Espera antes de empezar, para no competir con el primer pintado
+_ESPERA_MS = 300
+_CLAVE_ULTIMA = "ventanas/ultima"
+# Ventanas baratas de construir: no vale la pena preconstruirlas
+_SIN_RESERVA = {"selector", "menu_algebra", "menu_numerico", "menu_sistemas", "menu_matrices", "menu_metodos"}
+
+_plantillas = []
+_estado = {"activa": False}
+
+
+def _ajustes() -> QSettings:
+    return QSettings("Calculadora Nexus", "Calculadora Nexus")
+
+
+def registrar_uso(nombre: str) -> None:
+    """Recuerda la última ventana abierta para precargarla en la próxima sesión."""
+    if nombre in _SIN_RESERVA:
+        return
+    try:
+        _ajustes().setValue(_CLAVE_ULTIMA, nombre)
+    except Exception:
+        pass
+
+
+def ultima_ventana():
+    try:
+        nombre = _ajustes().value(_CLAVE_ULTIMA)
+    except Exception:
+        return None
+    return nombre if nombre in VENTANAS and nombre not in _SIN_RESERVA else None
+
+
+def tomar_grafica():
+    """Devuelve una tupla (fig, ax, canvas) lista para usar, o None.
+
+    Al consumirla se prepara otra en el próximo momento ocioso.
+    """
+    if not _plantillas:
+        return None
+    plantilla = _plantillas.pop()
+    if _estado["activa"]:
+        QTimer.singleShot(0, _crear_grafica)
+    return plantilla
+
+
+def _importar():
+    # Solo importa módulos: los widgets se crean en el hilo de la interfaz
+    try:
+        import numpy  # noqa: F401
+    except Exception:
+        pass
+    try:
+        import matplotlib.pyplot  # noqa: F401
+        from matplotlib.backends import backend_qtagg  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+
+def _crear_grafica():
+    if _plantillas:
+        return
+    try:
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        import matplotlib.pyplot as plt
+    except Exception:
+        return
+    try:
+        fig, ax = plt.subplots(figsize=(8, 4))
+        canvas = FigureCanvas(fig)
+        # Un primer dibujado deja listas las fuentes y el renderizador Agg
+        canvas.draw()
+        _plantillas.append((fig, ax, canvas))
+    except Exception:
+        pass
+
+
+def _preconstruir():
+    nombre = ultima_ventana()
+    if nombre is None or tiene_instancia(nombre):
+        return
+    try:
+        reservar(nombre, clase_ventana(nombre)())
+    except Exception:
+        pass
+
+
+class _Precarga(QObject):
+    importado = Signal(bool)
+
+    def __init__(self, preconstruir: bool):
+        super().__init__()
+        self._preconstruir = preconstruir
+        self.importado.connect(self._continuar)
+
+    def empezar(self):
+        threading.Thread(target=lambda: self.importado.emit(_importar()), name="precarga", daemon=True).start()
+
+    def _continuar(self, matplotlib_ok: bool):
+        pasos = [_crear_grafica] if matplotlib_ok else []
+        if self._preconstruir:
+            pasos.append(_preconstruir)
+        self._siguiente(pasos)
+
+    def _siguiente(self, pasos):
+        if not pasos:
+            return
+        pasos[0]()
+        QTimer.singleShot(0, lambda: self._siguiente(pasos[1:]))
+
+
+def iniciar(preconstruir: bool = True) -> None:
+    """Programa la precarga; llamar después de mostrar la primera ventana."""
+    if _estado["activa"]:
+        return
+    _estado["activa"] = True
+    precarga = _Precarga(preconstruir)
+    # Se guarda a nivel de módulo para que la señal del hilo tenga receptor
+    _estado["objeto"] = precarga
+    QTimer.singleShot(_ESPERA_MS, precarga.empezar)
@@ -14,8 +14,6 @@ from PySide6.QtGui import QPixmap
 from PySide6.QtCore import Qt
 import os
 
-from .menu_principal_qt import MenuPrincipalWindow
-from .menu_principal_numerico_qt import MenuNumericoPrincipalWindow
 from .theme import (
     install_toggle_shortcut,
     bind_font_scale_stylesheet,
@@ -26,6 +24,7 @@ from .theme import (
     help_icon_preferred,
 )
 from .settings_qt import open_settings_dialog
+from .ventanas import crear_ventana
 
 
 class SelectorInicioWindow(QMainWindow):
@@ -149,7 +148,7 @@ class SelectorInicioWindow(QMainWindow):
         text = (
             "Elige uno de los dos módulos principales:\n"
             "- Álgebra Lineal abre el menú con sistemas, matrices y transformaciones.\n"
-            "- Métodos Numéricos abre el menú con Bisección, Falsa Posición, Newton-Raphson y Secante.\n\n"
+            "- Métodos Numéricos abre el menú con Bisección, Falsa Posición, Newton-Raphson, Secante, Illinois y Brent.\n\n"
             "Usa el menú de tres puntos para Configuración o para regresar a esta ayuda."
         )
         try:
@@ -219,14 +218,14 @@ class SelectorInicioWindow(QMainWindow):
             pass
 
     def _open_algebra(self):
-        w = MenuPrincipalWindow(module="algebra", on_exit=self._restore_focus)
+        w = crear_ventana("menu_algebra", module="algebra", on_exit=self._restore_focus)
         w.setAttribute(Qt.WA_DeleteOnClose, True)
         w.showMaximized()
         self._child = w
         self.hide()
 
     def _open_numerico(self):
-        w = MenuNumericoPrincipalWindow(on_exit=self._restore_focus)
+        w = crear_ventana("menu_numerico", on_exit=self._restore_focus)
         w.setAttribute(Qt.WA_DeleteOnClose, True)
         w.showMaximized()
         self._child = w
@@ -14,9 +14,10 @@ from ..theme import (
     help_icon_preferred,
 )
 from ..settings_qt import open_settings_dialog
+from .. import cache_resultados
 from fractions import Fraction
 from ..matrices_qt import determinante_con_pasos as determinante_con_pasos_ascii
-import re
+from .gauss_jordan_qt import _parse_equations_text
 
 
 def _fmt_fraction(x: Fraction) -> str:
@@ -30,6 +31,26 @@ def _fmt_fraction(x: Fraction) -> str:
         return str(x)
 
 
+def cramer_determinantes(A, b):
+    """Calcula det(A) y |A_i| (columna i sustituida por b) con sus pasos.
+
+    Devuelve (det(A), [|A_1|, ..., |A_n|], pasos) donde `pasos` tiene las claves
+    "detA" y "det_var_i".
+    """
+    n = len(A)
+    detA, pasosA = determinante_con_pasos_ascii(A)
+    det_vars = []
+    det_steps = {"detA": pasosA}
+    for col in range(n):
+        # construir matriz con columna col reemplazada por b
+        M = [row[:] for row in A]
+        for i in range(n):
+            M[i][col] = b[i]
+        detk, pasosk = determinante_con_pasos_ascii(M)
+        det_vars.append(detk)
+        det_steps[f"det_var_{col+1}"] = pasosk
+    return detA, det_vars, det_steps
+
 
 class DetallesDeterminantesWindow(QMainWindow):
     """Ventana que muestra los procedimientos de determinantes uno por uno con navegación."""
@@ -413,85 +434,7 @@ class CramerWindow(QMainWindow):
                 self._entries[i][j].setText(str(M[i][j]))
 
     def _parse_equations_text(self, text: str):
-        import fractions as _fra
-        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-        if not lines:
-            raise ValueError("No hay lA-neas.")
-        var_names = []
-        var_indexed = False
-        max_index = 0
-        term_re = re.compile(r'([+-]?\s*(?:\d+(?:/\d+)?|\d*\.\d+)?)([a-zA-Z]\w*)')
-        const_re = re.compile(r'([+-]?\s*(?:\d+(?:/\d+)?|\d*\.\d+))')
-        parsed = []
-        for ln in lines:
-            if '=' not in ln:
-                raise ValueError(f"Falta '=' en la lA-nea: {ln}")
-            left, right = ln.split('=', 1)
-            left = left.strip(); right = right.strip()
-            terms = term_re.findall(left)
-            vars_in_line = [v for (_coef, v) in terms]
-            for v in vars_in_line:
-                m_idx = re.match(r'^[a-zA-Z]+(\d+)$', v)
-                if m_idx:
-                    var_indexed = True
-                    max_index = max(max_index, int(m_idx.group(1)))
-                if v not in var_names:
-                    var_names.append(v)
-            parsed.append((left, right))
-
-        if not var_names:
-            raise ValueError("No se detectaron variables en las ecuaciones.")
-
-        if var_indexed:
-            num_vars = max_index
-            mapping = {}
-            next_idx = num_vars
-            for name in var_names:
-                m = re.match(r'^([a-zA-Z]+)(\d+)$', name)
-                if m:
-                    idx = int(m.group(2)) - 1
-                else:
-                    idx = next_idx
-                    next_idx += 1
-                mapping[name] = idx
-            num_vars = max(mapping.values()) + 1 if mapping else num_vars
-        else:
-            num_vars = len(var_names)
-            mapping = {name: idx for idx, name in enumerate(var_names)}
-
-        M = []
-        for left, right in parsed:
-            coeffs = [_fra.Fraction(0) for _ in range(num_vars)]
-            for m in term_re.finditer(left):
-                raw_coef = m.group(1).replace(' ', '')
-                var = m.group(2)
-                if raw_coef in ('', '+'):
-                    coef = _fra.Fraction(1)
-                elif raw_coef == '-':
-                    coef = _fra.Fraction(-1)
-                else:
-                    coef = _fra.Fraction(raw_coef)
-                idx = mapping.get(var, None)
-                if idx is None or idx < 0 or idx >= num_vars:
-                    raise ValueError(f"Variable inesperada '{var}' en la ecuaciA3n: {left}={right}")
-                coeffs[idx] += coef
-            left_consts = 0
-            cleaned = term_re.sub(' ', left)
-            for m in const_re.finditer(cleaned):
-                s = m.group(1).replace(' ', '')
-                try:
-                    left_consts += _fra.Fraction(s)
-                except Exception:
-                    pass
-            try:
-                rhs = _fra.Fraction(right.replace(',', '.'))
-            except Exception:
-                raise ValueError(f"Constante derecha invalida: '{right}'")
-            rhs = rhs - left_consts
-            row = coeffs + [rhs]
-            M.append(row)
-
-        return M
+        return _parse_equations_text(text)
 
     def _leer_matriz(self):
         if not self._entries:
@@ -646,25 +589,15 @@ class CramerWindow(QMainWindow):
         A = [[A_aug[i][j] for j in range(m - 1)] for i in range(n)]
         b = [A_aug[i][-1] for i in range(n)]
 
-        # calculo de det(A)
-        detA, pasosA = determinante_con_pasos_ascii(A)
+        # calculo de det(A) y de los determinantes de cada variable
+        detA, det_vars, det_steps = cache_resultados.calcular("cramer", (A, b), lambda: cramer_determinantes(A, b))
+        pasosA = det_steps["detA"]
         # mostrar detA distintivo
         self.det_label.setText(f"det(A) = {_fmt_fraction(detA)}")
 
         if detA == 0:
             # mostrar mensaje y detallar pasos en la sección de determinantes
             QMessageBox.critical(self, "No se puede aplicar Cramer", "El determinante de la matriz de coeficientes es cero. No se puede resolver por el método de Cramer.")
-        # calcular determinantes para cada variable
-        det_vars = []
-        det_steps = {"detA": pasosA}
-        for col in range(n):
-            # construir matriz con columna col reemplazada por b
-            M = [row[:] for row in A]
-            for i in range(n):
-                M[i][col] = b[i]
-            detk, pasosk = determinante_con_pasos_ascii(M)
-            det_vars.append(detk)
-            det_steps[f"det_var_{col+1}"] = pasosk
 
         # preparar items paginados para la ventana de detalles: lista de (titulo, lineas)
         self._det_steps_items = []
@@ -15,6 +15,7 @@ from ..theme import (
     help_icon_preferred,
 )
 from ..settings_qt import open_settings_dialog
+from .. import cache_resultados
 
 
 def _fmt(x):
@@ -315,89 +316,7 @@ class GaussJordanWindow(QMainWindow):
 
     def _parse_equations_text(self, text: str):
         """Parsea texto con una ecuacion por linea y devuelve la matriz aumentada inferida."""
-        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-        if not lines:
-            raise ValueError("No hay lineas.")
-        # inferir variables: si aparecen x1,x2.. usamos indices; si no, letras en orden de aparicion
-        var_names = []
-        var_indexed = False
-        max_index = 0
-        term_re = re.compile(r'([+-]?\s*(?:\d+(?:/\d+)?|\d*\.\d+)?)([a-zA-Z]\w*)')
-        const_re = re.compile(r'([+-]?\s*(?:\d+(?:/\d+)?|\d*\.\d+))')
-        parsed = []
-        for ln in lines:
-            if '=' not in ln:
-                raise ValueError(f"Falta '=' en la linea: {ln}")
-            left, right = ln.split('=', 1)
-            left = left.strip()
-            right = right.strip()
-            terms = term_re.findall(left)
-            vars_in_line = [v for (_coef, v) in terms]
-            for v in vars_in_line:
-                m_idx = re.match(r'^[a-zA-Z]+(\d+)$', v)
-                if m_idx:
-                    var_indexed = True
-                    max_index = max(max_index, int(m_idx.group(1)))
-                if v not in var_names:
-                    var_names.append(v)
-            parsed.append((left, right))
-
-        if not var_names:
-            raise ValueError("No se detectaron variables en las ecuaciones.")
-
-        if var_indexed:
-            num_vars = max_index
-            mapping = {}
-            next_idx = num_vars
-            for name in var_names:
-                m = re.match(r'^([a-zA-Z]+)(\d+)$', name)
-                if m:
-                    idx = int(m.group(2)) - 1
-                else:
-                    idx = next_idx
-                    next_idx += 1
-                mapping[name] = idx
-            num_vars = max(mapping.values()) + 1 if mapping else num_vars
-        else:
-            num_vars = len(var_names)
-            mapping = {name: idx for idx, name in enumerate(var_names)}
-
-        from fractions import Fraction as _F
-        M = []
-        for left, right in parsed:
-            coeffs = [_F(0) for _ in range(num_vars)]
-            # extraer terminos con variables
-            for m in term_re.finditer(left):
-                raw_coef = m.group(1).replace(' ', '')
-                var = m.group(2)
-                if raw_coef in ('', '+'):
-                    coef = _F(1)
-                elif raw_coef == '-':
-                    coef = _F(-1)
-                else:
-                    coef = _F(raw_coef)
-                idx = mapping.get(var, None)
-                if idx is None or idx < 0 or idx >= num_vars:
-                    raise ValueError(f"Variable inesperada '{var}' en la ecuacion: {left}={right}")
-                coeffs[idx] += coef
-            # constantes sueltas en el lado izquierdo: se mueven a la derecha
-            left_consts = 0
-            cleaned = term_re.sub(' ', left)
-            for m in const_re.finditer(cleaned):
-                s = m.group(1).replace(' ', '')
-                try:
-                    left_consts += _F(s)
-                except Exception:
-                    pass
-            try:
-                rhs = _F(right.replace(',', '.'))
-            except Exception:
-                raise ValueError(f"Constante derecha invalida: '{right}'")
-            rhs = rhs - left_consts
-            row = coeffs + [rhs]
-            M.append(row)
-
-        return M
+        return _parse_equations_text(text)
 
     def _leer_matriz(self):
         if not self._entries:
@@ -556,7 +475,12 @@ class GaussJordanWindow(QMainWindow):
             filas = len(A)
             cols = len(A[0])
             self.matriz_original = deepcopy(A)
-            pasos = gauss_jordan(A, filas, cols)
+
+            def reducir():
+                pasos = gauss_jordan(A, filas, cols)
+                return A, pasos
+
+            A, pasos = cache_resultados.calcular("gauss_jordan", (self.matriz_original,), reducir)
             self.pasos_guardados = pasos
             self.matriz_final = A
             self._mostrar_resumen()
@@ -689,6 +613,93 @@ class GaussJordanWindow(QMainWindow):
             self.close()
 
 
+def _parse_equations_text(text: str):
+    """Parsea texto con una ecuacion por linea y devuelve la matriz aumentada inferida."""
+    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+    if not lines:
+        raise ValueError("No hay lineas.")
+    # inferir variables: si aparecen x1,x2.. usamos indices; si no, letras en orden de aparicion
+    var_names = []
+    var_indexed = False
+    max_index = 0
+    term_re = re.compile(r'([+-]?\s*(?:\d+(?:/\d+)?|\d*\.\d+)?)([a-zA-Z]\w*)')
+    const_re = re.compile(r'([+-]?\s*(?:\d+(?:/\d+)?|\d*\.\d+))')
+    parsed = []
+    for ln in lines:
+        if '=' not in ln:
+            raise ValueError(f"Falta '=' en la linea: {ln}")
+        left, right = ln.split('=', 1)
+        left = left.strip()
+        right = right.strip()
+        terms = term_re.findall(left)
+        vars_in_line = [v for (_coef, v) in terms]
+        for v in vars_in_line:
+            m_idx = re.match(r'^[a-zA-Z]+(\d+)$', v)
+            if m_idx:
+                var_indexed = True
+                max_index = max(max_index, int(m_idx.group(1)))
+            if v not in var_names:
+                var_names.append(v)
+        parsed.append((left, right))
+
+    if not var_names:
+        raise ValueError("No se detectaron variables en las ecuaciones.")
+
+    if var_indexed:
+        num_vars = max_index
+        mapping = {}
+        next_idx = num_vars
+        for name in var_names:
+            m = re.match(r'^([a-zA-Z]+)(\d+)$', name)
+            if m:
+                idx = int(m.group(2)) - 1
+            else:
+                idx = next_idx
+                next_idx += 1
+            mapping[name] = idx
+        num_vars = max(mapping.values()) + 1 if mapping else num_vars
+    else:
+        num_vars = len(var_names)
+        mapping = {name: idx for idx, name in enumerate(var_names)}
+
+    from fractions import Fraction as _F
+    M = []
+    for left, right in parsed:
+        coeffs = [_F(0) for _ in range(num_vars)]
+        # extraer terminos con variables
+        for m in term_re.finditer(left):
+            raw_coef = m.group(1).replace(' ', '')
+            var = m.group(2)
+            if raw_coef in ('', '+'):
+                coef = _F(1)
+            elif raw_coef == '-':
+                coef = _F(-1)
+            else:
+                coef = _F(raw_coef)
+            idx = mapping.get(var, None)
+            if idx is None or idx < 0 or idx >= num_vars:
+                raise ValueError(f"Variable inesperada '{var}' en la ecuacion: {left}={right}")
+            coeffs[idx] += coef
+        # constantes sueltas en el lado izquierdo: se mueven a la derecha
+        left_consts = 0
+        cleaned = term_re.sub(' ', left)
+        for m in const_re.finditer(cleaned):
+            s = m.group(1).replace(' ', '')
+            try:
+                left_consts += _F(s)
+            except Exception:
+                pass
+        try:
+            rhs = _F(right.replace(',', '.'))
+        except Exception:
+            raise ValueError(f"Constante derecha invalida: '{right}'")
+        rhs = rhs - left_consts
+        row = coeffs + [rhs]
+        M.append(row)
+
+    return M
+
+
 def gauss_jordan(A, n, m):
     pasos = []
     fila_pivote = 0
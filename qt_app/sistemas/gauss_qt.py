@@ -7,7 +7,6 @@ from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QTextCursor
 from fractions import Fraction
 from copy import deepcopy
-import re
 from ..theme import (
     bind_font_scale_stylesheet,
     bind_theme_icon,
@@ -16,6 +15,7 @@ from ..theme import (
     help_icon_preferred,
 )
 from ..settings_qt import open_settings_dialog
+from .gauss_jordan_qt import _parse_equations_text, format_matriz_lines, format_operacion_vertical_lines
 
 
 def _fmt(x):
@@ -515,111 +515,10 @@ class GaussWindow(QMainWindow):
         self.result.insertPlainText("\n\n")
 
     def _gauss_eliminacion(self, A, n, m):
-        pasos = []
-        fila_pivote = 0
-        for col in range(m - 1):
-            pivote = None
-            for f in range(fila_pivote, n):
-                if A[f][col] != 0:
-                    pivote = f
-                    break
-            if pivote is None:
-                continue
-
-            if pivote != fila_pivote:
-                A[fila_pivote], A[pivote] = A[pivote], A[fila_pivote]
-                pasos.append({
-                    "titulo": f"F{fila_pivote+1} ↔ F{pivote+1}",
-                    "comentario": f"Intercambio de filas para colocar pivote en columna {col+1}",
-                    "oper_lines": [],
-                    "matriz_lines": self._format_matriz_lines(A)
-                })
-
-            divisor = A[fila_pivote][col]
-            if divisor == 0:
-                fila_pivote += 1
-                continue
-            if divisor != 1:
-                A[fila_pivote] = [val / divisor for val in A[fila_pivote]]
-                pasos.append({
-                    "titulo": f"F{fila_pivote+1} → F{fila_pivote+1}/{divisor}",
-                    "comentario": f"Normalización del pivote en columna {col+1}",
-                    "oper_lines": [],
-                    "matriz_lines": self._format_matriz_lines(A)
-                })
-
-            for f in range(fila_pivote + 1, n):
-                if A[f][col] != 0:
-                    factor = A[f][col]
-                    original_fila = A[f][:]
-                    A[f] = [original_fila[j] - factor * A[fila_pivote][j] for j in range(m)]
-                    oper_lines = self._format_operacion_vertical_lines(
-                        A[fila_pivote], original_fila, factor, A[f], fila_pivote + 1, f + 1
-                    )
-                    pasos.append({
-                        "titulo": f"F{f+1} → F{f+1} - ({factor})F{fila_pivote+1}",
-                        "comentario": f"Anular elemento en columna {col+1}",
-                        "oper_lines": oper_lines,
-                        "matriz_lines": self._format_matriz_lines(A)
-                    })
-            fila_pivote += 1
-            if fila_pivote >= n:
-                break
-        return pasos, A
+        return gauss_eliminacion(A, n, m)
 
     def _rref_para_soluciones(self, A):
-        n = len(A)
-        m = len(A[0]) if A else 0
-        fila_pivote = 0
-        for col in range(m - 1):
-            pivote = None
-            for f in range(fila_pivote, n):
-                if A[f][col] != 0:
-                    pivote = f
-                    break
-            if pivote is None:
-                continue
-
-            if pivote != fila_pivote:
-                A[fila_pivote], A[pivote] = A[pivote], A[fila_pivote]
-
-            divisor = A[fila_pivote][col]
-            if divisor == 0:
-                fila_pivote += 1
-                continue
-            if divisor != 1:
-                A[fila_pivote] = [val / divisor for val in A[fila_pivote]]
-
-            for f in range(n):
-                if f != fila_pivote and A[f][col] != 0:
-                    factor = A[f][col]
-                    A[f] = [A[f][j] - factor * A[fila_pivote][j] for j in range(m)]
-
-            fila_pivote += 1
-            if fila_pivote >= n:
-                break
-        return A
-
-    def _format_operacion_vertical_lines(self, fila_pivote, fila_actual, factor, fila_result, idx_piv, idx_obj):
-        ancho = max(len(str(x)) for x in fila_result) if fila_result else 1
-
-        def fmt(lst):
-            return " ".join(str(x).rjust(ancho) for x in lst)
-
-        escala = [(-factor) * val for val in fila_pivote]
-
-        if factor < 0:
-            factor_str = f"+{abs(factor)}"
-        else:
-            factor_str = f"-{factor}"
-
-        lines = [
-            f"{factor_str}F{idx_piv} : {fmt(escala)}",
-            f"+F{idx_obj}   : {fmt(fila_actual)}",
-            " " * 10 + "-" * (ancho * len(fila_result) + len(fila_result) - 1),
-            f"=F{idx_obj}   : {fmt(fila_result)}"
-        ]
-        return lines
+        return rref_para_soluciones(A)
 
     def _format_matriz_lines(self, A):
         ancho = max((len(str(x)) for fila in A for x in fila), default=1)
@@ -880,54 +779,94 @@ class GaussWindow(QMainWindow):
 
     def _parse_equations_text(self, text: str):
         """Parsea texto con una ecuación por línea y devuelve la matriz aumentada inferida."""
-        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-        if not lines:
-            raise ValueError("No hay líneas.")
-        var_names = []
-        var_indexed = False
-        max_index = 0
-        term_re = re.compile(r'([+-]?\s*(?:\d+(?:/\d+)?|\d*\.\d+)?)([a-zA-Z]\w*)')
-        const_re = re.compile(r'([+-]?\s*(?:\d+(?:/\d+)?|\d*\.\d+))')
-        parsed = []
-        for ln in lines:
-            if '=' not in ln:
-                raise ValueError(f"Falta '=' en la línea: {ln}")
-            left, right = ln.split('=', 1)
-            left = left.strip()
-            right = right.strip()
-            terms = term_re.findall(left)
-            vars_in_line = [v for (_coef, v) in terms]
-            for v in vars_in_line:
-                m_idx = re.match(r'^[a-zA-Z]+(\d+)$', v)
-                if m_idx:
-                    var_indexed = True
-                    max_index = max(max_index, int(m_idx.group(1)))
-                if v not in var_names:
-                    var_names.append(v)
-            coef_map = {}
-            for coef_str, var in terms:
-                cstr = coef_str.replace(" ", "")
-                if cstr in ("", "+", "-"):
-                    coef_val = Fraction(1 if cstr != "-" else -1, 1)
-                else:
-                    coef_val = Fraction(cstr)
-                coef_map[var] = coef_map.get(var, Fraction(0)) + coef_val
-            const_match = const_re.findall(right)
-            if len(const_match) != 1:
-                raise ValueError(f"No se pudo leer el término independiente en: {ln}")
-            b_val = Fraction(const_match[0].replace(" ", ""))
-            parsed.append((coef_map, b_val))
-        if var_indexed:
-            num_vars = max_index
-            var_order = [f"x{i}" for i in range(1, num_vars + 1)]
-        else:
-            var_order = var_names
-            num_vars = len(var_order)
-        matriz = []
-        for coef_map, b_val in parsed:
-            fila = []
-            for var in var_order:
-                fila.append(coef_map.get(var, Fraction(0)))
-            fila.append(b_val)
-            matriz.append(fila)
-        return matriz
+        return _parse_equations_text(text)
+
+
+def gauss_eliminacion(A, n, m):
+    """Eliminación hacia adelante (forma escalonada) con pasos; modifica A."""
+    pasos = []
+    fila_pivote = 0
+    for col in range(m - 1):
+        pivote = None
+        for f in range(fila_pivote, n):
+            if A[f][col] != 0:
+                pivote = f
+                break
+        if pivote is None:
+            continue
+
+        if pivote != fila_pivote:
+            A[fila_pivote], A[pivote] = A[pivote], A[fila_pivote]
+            pasos.append({
+                "titulo": f"F{fila_pivote+1} ↔ F{pivote+1}",
+                "comentario": f"Intercambio de filas para colocar pivote en columna {col+1}",
+                "oper_lines": [],
+                "matriz_lines": format_matriz_lines(A)
+            })
+
+        divisor = A[fila_pivote][col]
+        if divisor == 0:
+            fila_pivote += 1
+            continue
+        if divisor != 1:
+            A[fila_pivote] = [val / divisor for val in A[fila_pivote]]
+            pasos.append({
+                "titulo": f"F{fila_pivote+1} → F{fila_pivote+1}/{divisor}",
+                "comentario": f"Normalización del pivote en columna {col+1}",
+                "oper_lines": [],
+                "matriz_lines": format_matriz_lines(A)
+            })
+
+        for f in range(fila_pivote + 1, n):
+            if A[f][col] != 0:
+                factor = A[f][col]
+                original_fila = A[f][:]
+                A[f] = [original_fila[j] - factor * A[fila_pivote][j] for j in range(m)]
+                oper_lines = format_operacion_vertical_lines(
+                    A[fila_pivote], original_fila, factor, A[f], fila_pivote + 1, f + 1
+                )
+                pasos.append({
+                    "titulo": f"F{f+1} → F{f+1} - ({factor})F{fila_pivote+1}",
+                    "comentario": f"Anular elemento en columna {col+1}",
+                    "oper_lines": oper_lines,
+                    "matriz_lines": format_matriz_lines(A)
+                })
+        fila_pivote += 1
+        if fila_pivote >= n:
+            break
+    return pasos, A
+
+
+def rref_para_soluciones(A):
+    """Lleva A a forma escalonada reducida sin registrar pasos; modifica A."""
+    n = len(A)
+    m = len(A[0]) if A else 0
+    fila_pivote = 0
+    for col in range(m - 1):
+        pivote = None
+        for f in range(fila_pivote, n):
+            if A[f][col] != 0:
+                pivote = f
+                break
+        if pivote is None:
+            continue
+
+        if pivote != fila_pivote:
+            A[fila_pivote], A[pivote] = A[pivote], A[fila_pivote]
+
+        divisor = A[fila_pivote][col]
+        if divisor == 0:
+            fila_pivote += 1
+            continue
+        if divisor != 1:
+            A[fila_pivote] = [val / divisor for val in A[fila_pivote]]
+
+        for f in range(n):
+            if f != fila_pivote and A[f][col] != 0:
+                factor = A[f][col]
+                A[f] = [A[f][j] - factor * A[fila_pivote][j] for j in range(m)]
+
+        fila_pivote += 1
+        if fila_pivote >= n:
+            break
+    return A
@@ -1,5 +1,7 @@
 import weakref
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 
 from PySide6.QtWidgets import QApplication, QCheckBox
 from PySide6.QtGui import (
@@ -68,8 +70,9 @@ def set_font_scale(app: QApplication, scale: float) -> None:
     if current_font_scale(app) == scale:
         return
     app.setProperty("font_scale", scale)
-    apply_theme(app, current_mode(app))
-    font_scale_signal().emit(scale)
+    with _batched_updates(app):
+        apply_theme(app, current_mode(app))
+        font_scale_signal().emit(scale)
 
 
 def _scaled_px(base: int, scale: float) -> int:
@@ -124,13 +127,22 @@ def bind_font_scale_stylesheet(widget, template: str, **size_map: int):
     template debe contener placeholders {nombre}px; size_map asocia nombre->tamaño base.
     """
 
+    sizes = tuple(sorted(size_map.items()))
+
     def _apply(w, scale):
-        values = {name: _scaled_px(base, scale) for name, base in size_map.items()}
-        w.setStyleSheet(template.format(**values))
+        sheet = _format_scaled_template(template, sizes, scale)
+        # Volver a asignar la misma hoja obliga a Qt a repulir el widget
+        if w.styleSheet() != sheet:
+            w.setStyleSheet(sheet)
 
     bind_font_scale(widget, _apply)
 
 
+@lru_cache(maxsize=512)
+def _format_scaled_template(template: str, sizes, scale: float) -> str:
+    return template.format(**{name: _scaled_px(base, scale) for name, base in sizes})
+
+
 def scaled_font_px(base: int) -> int:
     app = QApplication.instance()
     if app is None:
@@ -138,10 +150,33 @@ def scaled_font_px(base: int) -> int:
     return _scaled_px(base, current_font_scale(app))
 
 
-def apply_theme(app: QApplication, mode: str = "light") -> None:
-    app.setStyle("Fusion")
-    app.setProperty("theme_mode", mode)
-    scale = current_font_scale(app)
+_batch_depth = [0]
+
+
+@contextmanager
+def _batched_updates(app: QApplication):
+    """Agrupa cambios de estilo: las ventanas visibles no repintan hasta el final."""
+    if _batch_depth[0]:
+        yield
+        return
+    windows = [w for w in app.topLevelWidgets() if w.isVisible() and w.updatesEnabled()]
+    for w in windows:
+        w.setUpdatesEnabled(False)
+    _batch_depth[0] += 1
+    try:
+        yield
+    finally:
+        _batch_depth[0] -= 1
+        for w in windows:
+            try:
+                w.setUpdatesEnabled(True)
+            except Exception:
+                pass
+
+
+@lru_cache(maxsize=16)
+def _compile_theme(mode: str, scale: float, family: str):
+    """Paleta, fuente y hoja de estilo del tema; se arman una sola vez por combinación."""
     base_font_size = _scaled_px(11, scale)
     title_font = _scaled_px(28, scale)
     subtitle_font = _scaled_px(14, scale)
@@ -149,7 +184,6 @@ def apply_theme(app: QApplication, mode: str = "light") -> None:
     back_button_font = _scaled_px(20, scale)
     settings_icon_font = _scaled_px(28, scale)
 
-    family = current_font_family(app)
     palette = QPalette()
     if mode == "dark":
         # Modo oscuro complementario (dusty rose como acento)
@@ -172,10 +206,7 @@ def apply_theme(app: QApplication, mode: str = "light") -> None:
         palette.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
         palette.setColor(QPalette.PlaceholderText, QColor("#8F8697"))
 
-        app.setPalette(palette)
-        app.setFont(QFont(family, base_font_size))
-        app.setStyleSheet(
-            f"""
+        sheet = f"""
             QWidget {{ background: #1F1D22; color: #F7F4F1; }}
             QMainWindow {{ background: #1F1D22; }}
             QFrame#Card {{ background: #15131A; border: 1px solid #3A3542; border-radius: 16px; }}
@@ -265,7 +296,6 @@ def apply_theme(app: QApplication, mode: str = "light") -> None:
             }}
             QToolButton#SettingsButton:hover {{ color: #B07A8C; }}
             """
-        )
     else:
         # Claro Ivory Chic
         bg = QColor("#FAF7F5")
@@ -285,10 +315,7 @@ def apply_theme(app: QApplication, mode: str = "light") -> None:
         palette.setColor(QPalette.Highlight, accent)
         palette.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
         palette.setColor(QPalette.PlaceholderText, QColor("#B09CA7"))
-        app.setPalette(palette)
-        app.setFont(QFont(family, base_font_size))
-        app.setStyleSheet(
-            f"""
+        sheet = f"""
             QWidget {{ background: #FAF7F5; color: #4F3A47; }}
             QMainWindow {{ background: #FAF7F5; }}
             QFrame#Card {{ background: #F1E6E4; border: 1px solid #D9C8C5; border-radius: 16px; }}
@@ -379,11 +406,28 @@ def apply_theme(app: QApplication, mode: str = "light") -> None:
             }}
             QToolButton#SettingsButton:hover {{ color: #9A5D73; }}
             """
-        )
-    try:
-        _theme_bus.themeChanged.emit(mode)
-    except Exception:
-        pass
+    return palette, QFont(family, base_font_size), sheet
+
+
+def apply_theme(app: QApplication, mode: str = "light") -> None:
+    palette, font, sheet = _compile_theme(mode, current_font_scale(app), current_font_family(app))
+    with _batched_updates(app):
+        # setStyle y setStyleSheet repulen todos los widgets: solo si algo cambió
+        # Con hoja de estilo activa app.style() ya no informa el nombre del estilo base
+        if app.property("base_style") != "Fusion":
+            app.setStyle("Fusion")
+            app.setProperty("base_style", "Fusion")
+        app.setProperty("theme_mode", mode)
+        if app.palette() != palette:
+            app.setPalette(palette)
+        if app.font() != font:
+            app.setFont(font)
+        if app.styleSheet() != sheet:
+            app.setStyleSheet(sheet)
+        try:
+            _theme_bus.themeChanged.emit(mode)
+        except Exception:
+            pass
 
 
 def current_mode(app: QApplication) -> str:
@@ -0,0 +1,150 @@
+"""Registro de ventanas con importación diferida.
+
+Los menús piden cada ventana por nombre y su módulo se importa recién la
+primera vez que se abre; así el arranque solo carga el selector de inicio.
+Las ventanas cerradas se conservan ocultas (hasta un límite, descartando la
+de uso más antiguo) y se reutilizan al volver a abrirlas.
+"""
+
+import importlib
+from collections import OrderedDict
+
+
+# nombre: (módulo dentro de qt_app, clase)
+VENTANAS = {
+    "selector": ("selector_inicio_qt", "SelectorInicioWindow"),
+    "menu_algebra": ("menu_principal_qt", "MenuPrincipalWindow"),
+    "menu_numerico": ("menu_principal_numerico_qt", "MenuNumericoPrincipalWindow"),
+    "menu_sistemas": ("menu_sistemas_qt", "MenuSistemasWindow"),
+    "menu_matrices": ("menu_matrices_qt", "MenuMatricesWindow"),
+    "menu_metodos": ("menu_metodos_numericos_qt", "MenuMetodosNumericosWindow"),
+    "independencia": ("independencia_qt", "IndependenciaWindow"),
+    "transformaciones": ("transformaciones_qt", "TransformacionesWindow"),
+    "suma": ("matrices_qt", "SumaMatricesWindow"),
+    "resta": ("matrices_qt", "RestaMatricesWindow"),
+    "multiplicacion": ("matrices_qt", "MultiplicacionMatricesWindow"),
+    "determinante": ("matrices_qt", "DeterminanteMatrizWindow"),
+    "transpuesta": ("matrices_qt", "TranspuestaMatrizWindow"),
+    "inversa": ("matrices_qt", "InversaMatrizWindow"),
+    "operaciones": ("operaciones_qt", "OperacionesMatricesWindow"),
+    "gauss_jordan": ("sistemas.gauss_jordan_qt", "GaussJordanWindow"),
+    "gauss": ("sistemas.gauss_qt", "GaussWindow"),
+    "cramer": ("sistemas.cramer_qt", "CramerWindow"),
+    "leontief": ("sistemas.leontief_qt", "LeontiefWindow"),
+    "biseccion": ("metodos.biseccion_qt", "MetodoBiseccionWindow"),
+    "falsa_posicion": ("metodos.falsa_posicion_qt", "MetodoFalsaPosicionWindow"),
+    "newton_raphson": ("metodos.newton_raphson_qt", "MetodoNewtonRaphsonWindow"),
+    "secante": ("metodos.secante_qt", "MetodoSecanteWindow"),
+    "illinois": ("metodos.illinois_qt", "MetodoIllinoisWindow"),
+    "brent": ("metodos.brent_qt", "MetodoBrentWindow"),
+}
+
+_clases = {}
+# nombre -> última instancia entregada, en orden de uso (la más reciente al final)
+_abiertas = OrderedDict()
+_reutilizacion = {"limite": 6, "reiniciar": False}
+# Métodos que vacían entradas y resultados, según la ventana
+_LIMPIEZA = ("_limpiar", "limpiar", "_limpiar_pantalla")
+
+
+def modulo_ventana(nombre: str) -> str:
+    """Nombre completo del módulo que define la ventana `nombre`."""
+    return f"{__package__}.{VENTANAS[nombre][0]}"
+
+
+def clase_ventana(nombre: str):
+    """Devuelve la clase de la ventana `nombre`, importando su módulo si hace falta."""
+    cls = _clases.get(nombre)
+    if cls is None:
+        modulo, clase = VENTANAS[nombre]
+        cls = getattr(importlib.import_module(modulo_ventana(nombre)), clase)
+        _clases[nombre] = cls
+    return cls
+
+
+def configurar_reutilizacion(limite: int = None, reiniciar: bool = None) -> None:
+    """Ajusta cuántas ventanas cerradas se conservan y si se limpian al reabrirlas.
+
+    Con `limite` 0 no se reutiliza ninguna.
+    """
+    if limite is not None:
+        _reutilizacion["limite"] = max(0, int(limite))
+    if reiniciar is not None:
+        _reutilizacion["reiniciar"] = bool(reiniciar)
+    _recortar()
+
+
+def reservar(nombre: str, ventana) -> None:
+    """Deja `ventana` (oculta) disponible para la próxima apertura de `nombre`."""
+    if _reutilizacion["limite"] <= 0:
+        return
+    _abiertas[nombre] = ventana
+    _abiertas.move_to_end(nombre)
+    # Recién creada todavía no está a la vista, pero está por mostrarse
+    _recortar(conservar=nombre)
+
+
+def tiene_instancia(nombre: str) -> bool:
+    """Indica si ya hay una instancia de `nombre` guardada para reutilizar."""
+    ventana = _abiertas.get(nombre)
+    return ventana is not None and _valida(ventana)
+
+
+def _valida(ventana) -> bool:
+    try:
+        from shiboken6 import isValid
+    except Exception:
+        return True
+    return isValid(ventana)
+
+
+def _recortar(conservar: str = None):
+    for nombre in list(_abiertas):
+        if not _valida(_abiertas[nombre]):
+            del _abiertas[nombre]
+    sobrantes = len(_abiertas) - _reutilizacion["limite"]
+    for nombre in list(_abiertas):
+        if sobrantes <= 0:
+            break
+        ventana = _abiertas[nombre]
+        # Las que siguen a la vista no se descartan
+        if nombre == conservar or ventana.isVisible():
+            continue
+        del _abiertas[nombre]
+        ventana.deleteLater()
+        sobrantes -= 1
+
+
+def _reutilizar(nombre: str, parent):
+    ventana = _abiertas.get(nombre)
+    if ventana is None or not _valida(ventana) or ventana.isVisible():
+        return None
+    if ventana.parent() is not parent:
+        ventana.setParent(parent, ventana.windowFlags())
+    if _reutilizacion["reiniciar"]:
+        for metodo in _LIMPIEZA:
+            if hasattr(ventana, metodo):
+                try:
+                    getattr(ventana, metodo)()
+                except Exception:
+                    pass
+                break
+    return ventana
+
+
+def crear_ventana(nombre: str, *args, **kwargs):
+    """Construye la ventana `nombre` con los argumentos dados.
+
+    Si solo se pide `parent`, se reutiliza la instancia anterior de `nombre`
+    cuando está cerrada (o la que dejó lista la precarga).
+    """
+    from .precarga import registrar_uso
+
+    registrar_uso(nombre)
+    if args or not set(kwargs) <= {"parent"}:
+        return clase_ventana(nombre)(*args, **kwargs)
+    ventana = _reutilizar(nombre, kwargs.get("parent"))
+    if ventana is None:
+        ventana = clase_ventana(nombre)(*args, **kwargs)
+    reservar(nombre, ventana)
+    return ventana
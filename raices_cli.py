@@ -0,0 +1,269 @@
+"""Cálculo de raíces por lotes, sin interfaz gráfica.
+
+Lee trabajos en CSV o JSONL (una fila por función) y escribe un resultado
+JSONL por fila, en el mismo orden de entrada y a medida que se resuelven.
+
+Campos de cada fila:
+    expresion   f(x) con la misma sintaxis de la aplicación (p. ej. "x^3 - 2x - 5")
+    metodo      biseccion, falsa_posicion, illinois, brent, newton o secante
+    a, b        intervalo (métodos de intervalo); si falta se detectan los
+                cambios de signo en [-10, 10] como en la ventana
+    x0, x1      valor inicial (newton) o valores iniciales (secante)
+    tol         tolerancia (por defecto 1e-6)
+    max_iter    máximo de iteraciones (opcional)
+
+Ejemplo:
+    python raices_cli.py trabajos.csv -o resultados.jsonl -j 8
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+from qt_app.metodos import biseccion_qt as bq
+from qt_app.metodos.brent_qt import _run_brent
+from qt_app.metodos.falsa_posicion_qt import _run_false_position
+from qt_app.metodos.illinois_qt import _run_illinois
+from qt_app.metodos.newton_raphson_qt import _run_newton_raphson
+from qt_app.metodos.secante_qt import _run_secante
+
+
+_METODOS_INTERVALO = {
+    "biseccion": bq._run_bisection,
+    "falsa_posicion": _run_false_position,
+    "illinois": _run_illinois,
+    "brent": _run_brent,
+}
+
+# Nombres alternativos aceptados en la columna `metodo`
+_ALIAS_METODOS = {
+    "bisection": "biseccion",
+    "false_position": "falsa_posicion",
+    "regula_falsi": "falsa_posicion",
+    "anderson_bjorck": "illinois",
+    "newton_raphson": "newton",
+    "secant": "secante",
+}
+
+# Nombres alternativos de las columnas
+_ALIAS_CAMPOS = {
+    "expression": "expresion",
+    "funcion": "expresion",
+    "f": "expresion",
+    "method": "metodo",
+    "tolerancia": "tol",
+    "max_iterations": "max_iter",
+}
+
+_TOL_POR_DEFECTO = 1e-6
+
+
+def _sin_acentos(texto: str) -> str:
+    texto = unicodedata.normalize("NFKD", texto)
+    return "".join(ch for ch in texto if not unicodedata.combining(ch))
+
+
+def _normalizar_fila(fila: dict) -> dict:
+    normalizada = {}
+    for clave, valor in fila.items():
+        if clave is None:
+            continue
+        clave = _sin_acentos(str(clave)).strip().lower()
+        clave = _ALIAS_CAMPOS.get(clave, clave)
+        if isinstance(valor, str):
+            valor = valor.strip()
+        if valor is None or valor == "":
+            continue
+        normalizada[clave] = valor
+    return normalizada
+
+
+def _nombre_metodo(texto: str) -> str:
+    nombre = _sin_acentos(str(texto)).strip().lower().replace("-", "_").replace(" ", "_")
+    return _ALIAS_METODOS.get(nombre, nombre)
+
+
+def _numero(fila: dict, campo: str, requerido: bool = True):
+    if campo not in fila:
+        if requerido:
+            raise ValueError(f"Falta el campo '{campo}'.")
+        return None
+    valor = fila[campo]
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return float(valor)
+    return bq._parse_numeric(str(valor))
+
+
+def _json_float(valor):
+    """Los valores no finitos se escriben como null para mantener JSON válido."""
+    try:
+        valor = float(valor)
+    except Exception:
+        return None
+    return valor if math.isfinite(valor) else None
+
+
+def _resultado(salida, registro: bq.EvaluationLedger, inicio: dict) -> dict:
+    if isinstance(salida, Exception):
+        return {**inicio, "error": str(salida)}
+    _pasos, raiz, fc, iteraciones = salida
+    return {
+        **inicio,
+        "raiz": _json_float(raiz),
+        "f_raiz": _json_float(fc),
+        "iteraciones": iteraciones,
+        "evaluaciones": registro.evaluations,
+    }
+
+
+def _resolver(trabajo):
+    """Resuelve una fila. Se ejecuta en los procesos del pool."""
+    numero, fila = trabajo
+    fila = _normalizar_fila(fila)
+    salida = {
+        "fila": numero,
+        "expresion": fila.get("expresion"),
+        "metodo": fila.get("metodo"),
+        "raices": [],
+        "error": None,
+    }
+    try:
+        if "_error" in fila:
+            raise ValueError(fila["_error"])
+        expr = fila.get("expresion")
+        if not expr:
+            raise ValueError("Falta la expresión f(x).")
+        metodo = _nombre_metodo(fila.get("metodo", "biseccion"))
+        salida["metodo"] = metodo
+        func = bq._compile_function(str(expr))
+        tol = _numero(fila, "tol", requerido=False)
+        if tol is None:
+            tol = _TOL_POR_DEFECTO
+        if tol <= 0:
+            raise ValueError("La tolerancia debe ser positiva.")
+        extra = {}
+        max_iter = _numero(fila, "max_iter", requerido=False)
+        if max_iter is not None:
+            extra["max_iterations"] = int(max_iter)
+
+        if metodo in _METODOS_INTERVALO:
+            resolver = _METODOS_INTERVALO[metodo]
+            if "a" in fila or "b" in fila:
+                intervalos = [(_numero(fila, "a"), _numero(fila, "b"))]
+            else:
+                intervalos = bq._detect_sign_change_intervals(func, -10.0, 10.0, 0.5)
+                if not intervalos:
+                    raise ValueError("No se detectaron intervalos donde la función cambie de signo.")
+            for a, b in intervalos:
+                registro = bq.EvaluationLedger(func)
+                try:
+                    res = resolver(registro, a, b, tol, **extra)
+                except Exception as exc:
+                    res = exc
+                salida["raices"].append(_resultado(res, registro, {"a": a, "b": b}))
+        elif metodo == "newton":
+            x0 = _numero(fila, "x0")
+            fdf = bq._compile_derivative(str(expr))
+            registro = bq.EvaluationLedger(fdf if fdf is not None else func)
+            try:
+                if fdf is not None:
+                    res = _run_newton_raphson(func, x0, tol, fdf=registro, **extra)
+                else:
+                    res = _run_newton_raphson(registro, x0, tol, **extra)
+            except Exception as exc:
+                res = exc
+            salida["raices"].append(_resultado(res, registro, {"x0": x0}))
+        elif metodo == "secante":
+            x0 = _numero(fila, "x0")
+            x1 = _numero(fila, "x1")
+            registro = bq.EvaluationLedger(func)
+            try:
+                res = _run_secante(registro, x0, x1, tol, **extra)
+            except Exception as exc:
+                res = exc
+            salida["raices"].append(_resultado(res, registro, {"x0": x0, "x1": x1}))
+        else:
+            raise ValueError(f"Método desconocido: {fila.get('metodo')!r}.")
+    except Exception as exc:
+        salida["error"] = str(exc)
+    return salida
+
+
+def _leer_trabajos(flujo, formato: str):
+    """Genera (número de fila, diccionario) desde CSV o JSONL."""
+    if formato == "csv":
+        for numero, fila in enumerate(csv.DictReader(flujo), start=1):
+            yield numero, fila
+        return
+    for numero, linea in enumerate(flujo, start=1):
+        linea = linea.strip()
+        if not linea or linea.startswith("#"):
+            continue
+        try:
+            fila = json.loads(linea)
+        except ValueError as exc:
+            fila = {"_error": f"JSON inválido: {exc}"}
+        if not isinstance(fila, dict):
+            fila = {"_error": "Cada línea debe ser un objeto JSON."}
+        yield numero, fila
+
+
+def _detectar_formato(ruta: str, flujo) -> str:
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".json", ".ndjson"):
+        return "jsonl"
+    # Entrada estándar o extensión desconocida: mirar el primer carácter
+    primero = flujo.buffer.peek(1)[:1] if hasattr(flujo, "buffer") and hasattr(flujo.buffer, "peek") else b""
+    return "jsonl" if primero == b"{" else "csv"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Calcula raíces por lotes (bisección, falsa posición, Illinois, Brent, Newton, secante)."
+    )
+    parser.add_argument("entrada", help="archivo CSV o JSONL con los trabajos ('-' para la entrada estándar)")
+    parser.add_argument("-o", "--salida", default="-", help="archivo JSONL de resultados (por defecto, salida estándar)")
+    parser.add_argument("-f", "--formato", choices=("auto", "csv", "jsonl"), default="auto")
+    parser.add_argument(
+        "-j", "--procesos", type=int, default=os.cpu_count() or 1,
+        help="procesos de trabajo (1 = sin pool)",
+    )
+    args = parser.parse_args(argv)
+
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, newline="", encoding="utf-8")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    try:
+        formato = args.formato
+        if formato == "auto":
+            formato = _detectar_formato(args.entrada, entrada)
+        trabajos = _leer_trabajos(entrada, formato)
+        if args.procesos <= 1:
+            resultados = map(_resolver, trabajos)
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=args.procesos)
+            resultados = pool.map(_resolver, trabajos, chunksize=8)
+        try:
+            for resultado in resultados:
+                salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+                salida.flush()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""Resolución de sistemas de ecuaciones lineales por lotes, sin interfaz gráfica.
+
+Entrada en texto (una ecuación por línea, sistemas separados por una línea
+en blanco; las líneas que empiezan con '#' se ignoran) o en JSONL, con un
+objeto por sistema:
+
+    {"ecuaciones": ["2x + y = 3", "x - y = 0"], "metodo": "cramer"}
+    {"matriz": [[2, 1, 3], [1, -1, 0]]}
+
+Las ecuaciones usan la misma sintaxis que el diálogo "Ingresar ecuaciones"
+de las ventanas. Cada sistema produce una línea JSONL con su clasificación
+(determinado, indeterminado o incompatible) y la solución exacta en
+fracciones; con --pasos se añade el procedimiento.
+
+Ejemplo:
+    python sistemas_cli.py sistemas.txt -m gauss_jordan --pasos -j 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from fractions import Fraction
+
+from qt_app.sistemas.cramer_qt import cramer_determinantes
+from qt_app.sistemas.gauss_jordan_qt import _extraer_soluciones, _parse_equations_text, gauss_jordan
+from qt_app.sistemas.gauss_qt import gauss_eliminacion, rref_para_soluciones
+
+
+_METODOS = ("gauss", "gauss_jordan", "cramer")
+
+
+def _nombre_metodo(texto: str) -> str:
+    texto = unicodedata.normalize("NFKD", str(texto))
+    texto = "".join(ch for ch in texto if not unicodedata.combining(ch))
+    return texto.strip().lower().replace("-", "_").replace(" ", "_")
+
+
+def _matriz_desde(sistema: dict):
+    if "matriz" in sistema:
+        M = [[Fraction(str(v).strip()) for v in fila] for fila in sistema["matriz"]]
+        if not M or any(len(fila) != len(M[0]) for fila in M):
+            raise ValueError("La matriz aumentada debe ser rectangular y no vacía.")
+        return M
+    ecuaciones = sistema.get("ecuaciones")
+    if isinstance(ecuaciones, list):
+        ecuaciones = "\n".join(str(e) for e in ecuaciones)
+    if not ecuaciones:
+        raise ValueError("El sistema no tiene ecuaciones.")
+    return _parse_equations_text(ecuaciones)
+
+
+def _pasos_eliminacion(pasos):
+    return [
+        {
+            "titulo": paso.get("titulo", ""),
+            "comentario": paso.get("comentario", ""),
+            "lineas": list(paso.get("oper_lines", [])) + list(paso.get("matriz_lines", [])),
+        }
+        for paso in pasos
+    ]
+
+
+def _clasificar(rref, salida: dict) -> None:
+    soluciones, tipo, analisis = _extraer_soluciones(rref)
+    salida["tipo"] = tipo
+    if soluciones is None:
+        return
+    salida["solucion"] = {f"x{i+1}": str(valor) for i, valor in enumerate(soluciones)}
+    salida["variables_libres"] = [f"x{j+1}" for j in analisis[1]]
+
+
+def _resolver(trabajo):
+    """Resuelve un sistema. Se ejecuta en los procesos del pool."""
+    numero, sistema, metodo_defecto, con_pasos = trabajo
+    metodo = _nombre_metodo(sistema.get("metodo") or metodo_defecto)
+    salida = {
+        "sistema": numero,
+        "metodo": metodo,
+        "tipo": None,
+        "solucion": None,
+        "variables_libres": [],
+        "error": None,
+    }
+    try:
+        if "_error" in sistema:
+            raise ValueError(sistema["_error"])
+        if metodo not in _METODOS:
+            raise ValueError(f"Método desconocido: {metodo!r} (use gauss, gauss_jordan o cramer).")
+        con_pasos = bool(sistema.get("pasos", con_pasos))
+        A = _matriz_desde(sistema)
+        filas, columnas = len(A), len(A[0])
+        salida["ecuaciones"] = filas
+        salida["incognitas"] = columnas - 1
+
+        if metodo == "gauss_jordan":
+            pasos = gauss_jordan(A, filas, columnas)
+            _clasificar(A, salida)
+        elif metodo == "gauss":
+            pasos, triangular = gauss_eliminacion(A, filas, columnas)
+            _clasificar(rref_para_soluciones(deepcopy(triangular)), salida)
+        else:
+            if columnas != filas + 1:
+                raise ValueError("Para Cramer se requiere una matriz aumentada n x (n+1).")
+            coef = [fila[:-1] for fila in A]
+            b = [fila[-1] for fila in A]
+            detA, det_vars, det_steps = cramer_determinantes(coef, b)
+            salida["determinante"] = str(detA)
+            pasos = [{"titulo": "|A|", "comentario": "", "lineas": det_steps["detA"]}]
+            pasos += [
+                {
+                    "titulo": f"|A{i+1}|",
+                    "comentario": f"determinante sustituyendo columna {i+1}",
+                    "lineas": det_steps[f"det_var_{i+1}"],
+                }
+                for i in range(filas)
+            ]
+            if detA != 0:
+                salida["tipo"] = "determinado"
+                salida["solucion"] = {f"x{i+1}": str(d / detA) for i, d in enumerate(det_vars)}
+            else:
+                # Cramer no distingue entre indeterminado e incompatible
+                salida["nota"] = "det(A) = 0: Cramer no es aplicable; clasificación por Gauss-Jordan."
+                rref = deepcopy(A)
+                gauss_jordan(rref, filas, columnas)
+                _clasificar(rref, salida)
+        if con_pasos:
+            salida["pasos"] = pasos if metodo == "cramer" else _pasos_eliminacion(pasos)
+    except Exception as exc:
+        salida["error"] = str(exc)
+    return salida
+
+
+def _leer_texto(flujo):
+    """Genera (número, sistema) con sistemas separados por líneas en blanco."""
+    actual = []
+    numero = 0
+    for linea in flujo:
+        linea = linea.strip()
+        if linea.startswith("#"):
+            continue
+        if linea:
+            actual.append(linea)
+            continue
+        if actual:
+            numero += 1
+            yield numero, {"ecuaciones": actual}
+            actual = []
+    if actual:
+        yield numero + 1, {"ecuaciones": actual}
+
+
+def _leer_jsonl(flujo):
+    numero = 0
+    for linea in flujo:
+        linea = linea.strip()
+        if not linea or linea.startswith("#"):
+            continue
+        numero += 1
+        try:
+            sistema = json.loads(linea)
+        except ValueError as exc:
+            sistema = {"_error": f"JSON inválido: {exc}"}
+        if not isinstance(sistema, dict):
+            sistema = {"_error": "Cada línea debe ser un objeto JSON."}
+        yield numero, sistema
+
+
+def _detectar_formato(ruta: str, flujo) -> str:
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension in (".jsonl", ".json", ".ndjson"):
+        return "jsonl"
+    if extension:
+        return "texto"
+    # Entrada estándar: mirar el primer carácter
+    primero = flujo.buffer.peek(1)[:1] if hasattr(flujo, "buffer") and hasattr(flujo.buffer, "peek") else b""
+    return "jsonl" if primero == b"{" else "texto"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Resuelve sistemas de ecuaciones lineales por lotes (Gauss, Gauss-Jordan o Cramer)."
+    )
+    parser.add_argument("entrada", help="archivo de sistemas en texto o JSONL ('-' para la entrada estándar)")
+    parser.add_argument("-o", "--salida", default="-", help="archivo JSONL de resultados (por defecto, salida estándar)")
+    parser.add_argument("-m", "--metodo", default="gauss_jordan", help="gauss, gauss_jordan o cramer")
+    parser.add_argument("-f", "--formato", choices=("auto", "texto", "jsonl"), default="auto")
+    parser.add_argument("--pasos", action="store_true", help="incluir el procedimiento de cada sistema")
+    parser.add_argument(
+        "-j", "--procesos", type=int, default=os.cpu_count() or 1,
+        help="procesos de trabajo (1 = sin pool)",
+    )
+    args = parser.parse_args(argv)
+
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    try:
+        formato = args.formato
+        if formato == "auto":
+            formato = _detectar_formato(args.entrada, entrada)
+        sistemas = _leer_jsonl(entrada) if formato == "jsonl" else _leer_texto(entrada)
+        trabajos = ((numero, sistema, args.metodo, args.pasos) for numero, sistema in sistemas)
+        if args.procesos <= 1:
+            resultados = map(_resolver, trabajos)
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=args.procesos)
+            resultados = pool.map(_resolver, trabajos, chunksize=8)
+        try:
+            for resultado in resultados:
+                salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+                salida.flush()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())